@@ -0,0 +1,40 @@
+"""Run an example under cProfile and print the functions with the most own time.
+
+Usage:
+    python examples/profile_example.py examples/read/ws/subscribe_market_depth.py --top 20
+
+Stop a long-running subscription early with Ctrl+C; the stats are still printed. cProfile does
+not charge time spent suspended in ``await`` to the awaiting coroutine, so for a live process
+sample it instead with ``py-spy record --pid <pid>``.
+"""
+
+import argparse
+import cProfile
+import pstats
+import runpy
+import sys
+from pathlib import Path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("script", type=Path, help="example script to run")
+    parser.add_argument("--top", type=int, default=20, help="number of rows to print")
+    parser.add_argument("--sort", default="tottime", help="pstats sort key")
+    args = parser.parse_args()
+
+    script: Path = args.script
+    sys.argv = [str(script)]
+    sys.path.insert(0, str(script.resolve().parent))
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(runpy.run_path, str(script), run_name="__main__")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pstats.Stats(profiler).sort_stats(args.sort).print_stats(args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,12 @@ import os
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 SUB_ADDR = "0x456..."
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     overview = await read.account_overview.get_by_addr(sub_addr=SUB_ADDR)
 
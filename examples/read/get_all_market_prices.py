@@ -1,26 +1,42 @@
 import asyncio
 import os
+from operator import attrgetter
 
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+
+_price_fields = attrgetter(
+    "market",
+    "mark_px",
+    "mid_px",
+    "oracle_px",
+    "funding_rate_bps",
+    "is_funding_positive",
+    "open_interest",
+    "transaction_unix_ms",
+)
+
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     prices = await read.market_prices.get_all()
 
     print("All Market Prices:\n")
     for price in prices:
-        print(f"  Market: {price.market}")
-        print(f"    Mark Px: {price.mark_px}")
-        print(f"    Mid Px: {price.mid_px}")
-        print(f"    Oracle Px: {price.oracle_px}")
-        print(f"    Funding Rate BPS: {price.funding_rate_bps}")
-        print(f"    Is Funding Positive: {price.is_funding_positive}")
-        print(f"    Open Interest: {price.open_interest}")
-        print(f"    Transaction Unix MS: {price.transaction_unix_ms}")
-        print()
+        market, mark, mid, oracle, funding_bps, funding_positive, oi, unix_ms = _price_fields(price)
+        print(
+            f"  Market: {market}\n"
+            f"    Mark Px: {mark}\n"
+            f"    Mid Px: {mid}\n"
+            f"    Oracle Px: {oracle}\n"
+            f"    Funding Rate BPS: {funding_bps}\n"
+            f"    Is Funding Positive: {funding_positive}\n"
+            f"    Open Interest: {oi}\n"
+            f"    Transaction Unix MS: {unix_ms}\n"
+        )
 
 
 if __name__ == "__main__":
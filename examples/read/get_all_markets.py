@@ -4,9 +4,11 @@ import os
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     markets = await read.markets.get_all()
 
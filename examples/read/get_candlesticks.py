@@ -5,9 +5,11 @@ from datetime import UTC, datetime
 from decibel import NETNA_CONFIG
 from decibel.read import CandlestickInterval, DecibelReadDex
 
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     market_name = "BTC/USD"
     interval = CandlestickInterval.ONE_HOUR
@@ -4,11 +4,12 @@ import os
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 SUB_ADDR = "0x456..."
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     delegations = await read.delegations.get_all(sub_addr=SUB_ADDR)
 
@@ -4,9 +4,22 @@ import os
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+
+_format_price = (
+    "  Market: {market}\n"
+    "    Mark Px: {mark_px}\n"
+    "    Mid Px: {mid_px}\n"
+    "    Oracle Px: {oracle_px}\n"
+    "    Funding Rate BPS: {funding_rate_bps}\n"
+    "    Is Funding Positive: {is_funding_positive}\n"
+    "    Open Interest: {open_interest}\n"
+    "    Transaction Unix MS: {transaction_unix_ms}\n"
+).format_map
+
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     market_name = "BTC/USD"
     prices = await read.market_prices.get_by_name(market_name)
@@ -17,15 +30,7 @@ async def main() -> None:
 
     print(f"Market Prices for {market_name}:\n")
     for price in prices:
-        print(f"  Market: {price.market}")
-        print(f"    Mark Px: {price.mark_px}")
-        print(f"    Mid Px: {price.mid_px}")
-        print(f"    Oracle Px: {price.oracle_px}")
-        print(f"    Funding Rate BPS: {price.funding_rate_bps}")
-        print(f"    Is Funding Positive: {price.is_funding_positive}")
-        print(f"    Open Interest: {price.open_interest}")
-        print(f"    Transaction Unix MS: {price.transaction_unix_ms}")
-        print()
+        print(_format_price(vars(price)))
 
 
 if __name__ == "__main__":
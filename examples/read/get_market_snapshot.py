@@ -0,0 +1,31 @@
+import asyncio
+import os
+
+from decibel import NETNA_CONFIG
+from decibel.read import DecibelReadDex
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+
+
+async def main() -> None:
+    async with DecibelReadDex(NETNA_CONFIG, api_key=API_KEY) as read:
+        # Markets, prices, contexts and the leaderboard are fetched concurrently
+        snapshot = await read.snapshot(leaderboard_limit=5)
+
+    print("Market Snapshot:\n")
+    print(f"  Markets: {len(snapshot.markets)}")
+    print(f"  Prices: {len(snapshot.prices)}")
+    print(f"  Market Contexts: {len(snapshot.contexts)}")
+    print()
+
+    for price in snapshot.prices:
+        print(f"  {price.market}: {price.mark_px}")
+    print()
+
+    print("Top Accounts:\n")
+    for item in snapshot.leaderboard.items:
+        print(f"  #{item.rank} {item.account}: ${item.account_value:,.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
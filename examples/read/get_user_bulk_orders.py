@@ -4,11 +4,12 @@ import os
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 SUB_ADDR = "0x456..."
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     bulk_orders = await read.user_bulk_orders.get_by_addr(sub_addr=SUB_ADDR)
 
@@ -16,20 +17,25 @@ async def main() -> None:
         print(f"No bulk orders for {SUB_ADDR}")
         return
 
-    print(f"Bulk Orders for {SUB_ADDR}:\n")
+    lines = [f"Bulk Orders for {SUB_ADDR}:\n"]
     for bulk in bulk_orders:
-        print(f"  Market: {bulk.market}")
-        print(f"    Sequence Number: {bulk.sequence_number}")
-        print(f"    Previous Seq Num: {bulk.previous_seq_num}")
-        print(f"    Bid Prices: {bulk.bid_prices}")
-        print(f"    Bid Sizes: {bulk.bid_sizes}")
-        print(f"    Ask Prices: {bulk.ask_prices}")
-        print(f"    Ask Sizes: {bulk.ask_sizes}")
-        print(f"    Cancelled Bid Prices: {bulk.cancelled_bid_prices}")
-        print(f"    Cancelled Bid Sizes: {bulk.cancelled_bid_sizes}")
-        print(f"    Cancelled Ask Prices: {bulk.cancelled_ask_prices}")
-        print(f"    Cancelled Ask Sizes: {bulk.cancelled_ask_sizes}")
-        print()
+        lines.extend(
+            (
+                f"  Market: {bulk.market}",
+                f"    Sequence Number: {bulk.sequence_number}",
+                f"    Previous Seq Num: {bulk.previous_seq_num}",
+                f"    Bid Prices: {bulk.bid_prices}",
+                f"    Bid Sizes: {bulk.bid_sizes}",
+                f"    Ask Prices: {bulk.ask_prices}",
+                f"    Ask Sizes: {bulk.ask_sizes}",
+                f"    Cancelled Bid Prices: {bulk.cancelled_bid_prices}",
+                f"    Cancelled Bid Sizes: {bulk.cancelled_bid_sizes}",
+                f"    Cancelled Ask Prices: {bulk.cancelled_ask_prices}",
+                f"    Cancelled Ask Sizes: {bulk.cancelled_ask_sizes}",
+                "",
+            )
+        )
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
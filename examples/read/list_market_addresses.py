@@ -5,14 +5,13 @@ from decibel.read import DecibelReadDex
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG)
+    async with DecibelReadDex(NETNA_CONFIG) as read:
+        addresses = await read.markets.list_market_addresses()
 
-    addresses = await read.markets.list_market_addresses()
-
-    print(f"Found {len(addresses)} market addresses:\n")
-    for addr in addresses:
-        name = await read.markets.market_name_by_address(addr)
-        print(f"  {name}: {addr}")
+        print(f"Found {len(addresses)} market addresses:\n")
+        names = await read.markets.market_names_by_addresses(addresses)
+        for addr in addresses:
+            print(f"  {names[addr]}: {addr}")
 
 
 if __name__ == "__main__":
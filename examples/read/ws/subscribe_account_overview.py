@@ -1,48 +1,68 @@
 import asyncio
+import contextlib
 import os
 from typing import Any
 
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 SUB_ADDR = "0x123..."
+MAX_UPDATES = 10
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
+
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
 
     def on_data(msg: Any) -> None:
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+
         overview = msg.account_overview
-        print(f"Account Overview for {SUB_ADDR}:\n")
-        print(f"  Perp Equity Balance: {overview.perp_equity_balance}")
-        print(f"  Unrealized PnL: {overview.unrealized_pnl}")
-        print(f"  Unrealized Funding Cost: {overview.unrealized_funding_cost}")
-        print(f"  Cross Margin Ratio: {overview.cross_margin_ratio}")
-        print(f"  Maintenance Margin: {overview.maintenance_margin}")
-        print(f"  Cross Account Leverage Ratio: {overview.cross_account_leverage_ratio}")
-        print(f"  Net Deposits: {overview.net_deposits}")
-        print(f"  All Time Return: {overview.all_time_return}")
-        print(f"  PnL 90d: {overview.pnl_90d}")
-        print(f"  Sharpe Ratio: {overview.sharpe_ratio}")
-        print(f"  Max Drawdown: {overview.max_drawdown}")
-        print(f"  Weekly Win Rate 12w: {overview.weekly_win_rate_12w}")
-        print(f"  Average Cash Position: {overview.average_cash_position}")
-        print(f"  Average Leverage: {overview.average_leverage}")
-        print(f"  Cross Account Position: {overview.cross_account_position}")
-        print(f"  Total Margin: {overview.total_margin}")
-        print(f"  USDC Cross Withdrawable Balance: {overview.usdc_cross_withdrawable_balance}")
-        print(f"  USDC Isolated Withdrawable: {overview.usdc_isolated_withdrawable_balance}")
-        print(f"  Realized PnL: {overview.realized_pnl}")
-        print(f"  Liquidation Fees Paid: {overview.liquidation_fees_paid}")
-        print(f"  Liquidation Losses: {overview.liquidation_losses}")
-        print()
+        lines = [
+            f"Account Overview for {SUB_ADDR}:\n",
+            f"  Perp Equity Balance: {overview.perp_equity_balance}",
+            f"  Unrealized PnL: {overview.unrealized_pnl}",
+            f"  Unrealized Funding Cost: {overview.unrealized_funding_cost}",
+            f"  Cross Margin Ratio: {overview.cross_margin_ratio}",
+            f"  Maintenance Margin: {overview.maintenance_margin}",
+            f"  Cross Account Leverage Ratio: {overview.cross_account_leverage_ratio}",
+            f"  Net Deposits: {overview.net_deposits}",
+            f"  All Time Return: {overview.all_time_return}",
+            f"  PnL 90d: {overview.pnl_90d}",
+            f"  Sharpe Ratio: {overview.sharpe_ratio}",
+            f"  Max Drawdown: {overview.max_drawdown}",
+            f"  Weekly Win Rate 12w: {overview.weekly_win_rate_12w}",
+            f"  Average Cash Position: {overview.average_cash_position}",
+            f"  Average Leverage: {overview.average_leverage}",
+            f"  Cross Account Position: {overview.cross_account_position}",
+            f"  Total Margin: {overview.total_margin}",
+            f"  USDC Cross Withdrawable Balance: {overview.usdc_cross_withdrawable_balance}",
+            f"  USDC Isolated Withdrawable: {overview.usdc_isolated_withdrawable_balance}",
+            f"  Realized PnL: {overview.realized_pnl}",
+            f"  Liquidation Fees Paid: {overview.liquidation_fees_paid}",
+            f"  Liquidation Losses: {overview.liquidation_losses}",
+            "",
+        ]
+        print(*lines, sep="\n")
 
     unsubscribe = read.account_overview.subscribe_by_addr(SUB_ADDR, on_data)
 
-    await asyncio.sleep(30)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
     await read.ws.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,33 +1,72 @@
 import asyncio
+import contextlib
 import os
+from operator import attrgetter
 from typing import Any
 
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+MAX_UPDATES = 10
+
+# Pull every printed field in one C-level call per price update
+_price_fields = attrgetter(
+    "market",
+    "mark_px",
+    "mid_px",
+    "oracle_px",
+    "funding_rate_bps",
+    "is_funding_positive",
+    "open_interest",
+    "transaction_unix_ms",
+)
+
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
-
-    def on_data(msg: Any) -> None:
-        print(f"Received {len(msg.prices)} market prices:\n")
-        for price in msg.prices:
-            print(f"  Market: {price.market}")
-            print(f"    Mark Price: {price.mark_px}")
-            print(f"    Mid Price: {price.mid_px}")
-            print(f"    Oracle Price: {price.oracle_px}")
-            print(f"    Funding Rate Bps: {price.funding_rate_bps}")
-            print(f"    Is Funding Positive: {price.is_funding_positive}")
-            print(f"    Open Interest: {price.open_interest}")
-            print(f"    Transaction Unix MS: {price.transaction_unix_ms}")
-            print()
-
-    unsubscribe = read.market_prices.subscribe_all(on_data)
-
-    await asyncio.sleep(30)
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
+
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
+
+    def on_batch(msgs: list[Any]) -> None:
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+
+        chunks: list[str] = []
+        for msg in msgs:
+            chunks.append(f"Received {len(msg.prices)} market prices:\n\n")
+            for price in msg.prices:
+                market, mark, mid, oracle, funding_bps, funding_positive, oi, unix_ms = (
+                    _price_fields(price)
+                )
+                chunks.append(
+                    f"  Market: {market}\n"
+                    f"    Mark Price: {mark}\n"
+                    f"    Mid Price: {mid}\n"
+                    f"    Oracle Price: {oracle}\n"
+                    f"    Funding Rate Bps: {funding_bps}\n"
+                    f"    Is Funding Positive: {funding_positive}\n"
+                    f"    Open Interest: {oi}\n"
+                    f"    Transaction Unix MS: {unix_ms}\n\n"
+                )
+        print("".join(chunks), end="")
+
+    # Updates arriving in the same burst are delivered together and printed with one write
+    unsubscribe = read.market_prices.subscribe_all_batched(on_batch)
+
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
     await read.ws.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
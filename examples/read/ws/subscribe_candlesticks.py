@@ -1,36 +1,57 @@
 import asyncio
+import contextlib
 import os
 from typing import Any
 
 from decibel import NETNA_CONFIG
 from decibel.read import CandlestickInterval, DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+MAX_UPDATES = 10
+
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     market_name = "BTC/USD"
     interval = CandlestickInterval.ONE_MINUTE
 
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
+
     def on_data(msg: Any) -> None:
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+
         candle = msg.candle
-        print(f"Candlestick for {market_name}:\n")
-        print(f"  Time Start: {candle.time_start}")
-        print(f"  Time End: {candle.time_end}")
-        print(f"  Interval: {candle.interval}")
-        print(f"  Open Price: {candle.open_price}")
-        print(f"  High: {candle.high}")
-        print(f"  Low: {candle.low}")
-        print(f"  Close: {candle.close}")
-        print(f"  Volume: {candle.volume}")
-        print()
+        lines = [
+            f"Candlestick for {market_name}:\n",
+            f"  Time Start: {candle.time_start}",
+            f"  Time End: {candle.time_end}",
+            f"  Interval: {candle.interval}",
+            f"  Open Price: {candle.open_price}",
+            f"  High: {candle.high}",
+            f"  Low: {candle.low}",
+            f"  Close: {candle.close}",
+            f"  Volume: {candle.volume}",
+            "",
+        ]
+        print(*lines, sep="\n")
 
     unsubscribe = read.candlesticks.subscribe_by_name(market_name, interval, on_data)
 
-    await asyncio.sleep(30)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
     await read.ws.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
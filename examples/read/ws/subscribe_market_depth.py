@@ -1,37 +1,63 @@
 import asyncio
+import contextlib
 import os
 from typing import Any
 
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+MAX_UPDATES = 10
+
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     market_name = "BTC/USD"
     aggregation_size = 1
 
-    def on_data(msg: Any) -> None:
-        print(f"Market Depth for {market_name}:\n")
-        print(f"  Market: {msg.market}")
-        print(f"  Unix MS: {msg.unix_ms}")
-        print(f"  Bids ({len(msg.bids)}):")
-        for bid in msg.bids:
-            print(f"    Price: {bid.price}")
-            print(f"    Size: {bid.size}")
-        print(f"  Asks ({len(msg.asks)}):")
-        for ask in msg.asks:
-            print(f"    Price: {ask.price}")
-            print(f"    Size: {ask.size}")
-        print()
-
-    unsubscribe = read.market_depth.subscribe_by_name(market_name, aggregation_size, on_data)
-
-    await asyncio.sleep(30)
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
+
+    def on_batch(msgs: list[Any]) -> None:
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+
+        lines: list[str] = []
+        for msg in msgs:
+            lines.extend(
+                (
+                    f"Market Depth for {market_name}:\n",
+                    f"  Market: {msg.market}",
+                    f"  Unix MS: {msg.unix_ms}",
+                    f"  Bids ({len(msg.bids)}):",
+                )
+            )
+            for bid in msg.bids:
+                lines.extend((f"    Price: {bid.price}", f"    Size: {bid.size}"))
+            lines.append(f"  Asks ({len(msg.asks)}):")
+            for ask in msg.asks:
+                lines.extend((f"    Price: {ask.price}", f"    Size: {ask.size}"))
+            lines.append("")
+        print("\n".join(lines))
+
+    # Bursts of depth updates are delivered together and printed with one write
+    unsubscribe = read.market_depth.subscribe_by_name_batched(
+        market_name, aggregation_size, on_batch
+    )
+
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
     await read.ws.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
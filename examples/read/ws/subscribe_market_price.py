@@ -1,35 +1,57 @@
 import asyncio
+import contextlib
 import os
 from typing import Any
 
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+MAX_UPDATES = 10
+
+# Built once at import; each update only fills in the fields from the price model's __dict__
+_format_price = (
+    "  Market: {market}\n"
+    "  Mark Price: {mark_px}\n"
+    "  Mid Price: {mid_px}\n"
+    "  Oracle Price: {oracle_px}\n"
+    "  Funding Rate Bps: {funding_rate_bps}\n"
+    "  Is Funding Positive: {is_funding_positive}\n"
+    "  Open Interest: {open_interest}\n"
+    "  Transaction Unix MS: {transaction_unix_ms}\n"
+).format_map
+
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     market_name = "BTC/USD"
 
+    header = f"Market Price for {market_name}:\n\n"
+
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
+
     def on_data(msg: Any) -> None:
-        price = msg.price
-        print(f"Market Price for {market_name}:\n")
-        print(f"  Market: {price.market}")
-        print(f"  Mark Price: {price.mark_px}")
-        print(f"  Mid Price: {price.mid_px}")
-        print(f"  Oracle Price: {price.oracle_px}")
-        print(f"  Funding Rate Bps: {price.funding_rate_bps}")
-        print(f"  Is Funding Positive: {price.is_funding_positive}")
-        print(f"  Open Interest: {price.open_interest}")
-        print(f"  Transaction Unix MS: {price.transaction_unix_ms}")
-        print()
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+
+        print(header + _format_price(vars(msg.price)))
 
     unsubscribe = read.market_prices.subscribe_by_name(market_name, on_data)
 
-    await asyncio.sleep(30)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
     await read.ws.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
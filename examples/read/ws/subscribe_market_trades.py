@@ -1,40 +1,63 @@
 import asyncio
+import contextlib
 import os
 from typing import Any
 
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+MAX_UPDATES = 10
+
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
 
     market_name = "BTC/USD"
 
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
+
     def on_data(msg: Any) -> None:
-        print(f"Market Trades for {market_name}:\n")
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+
+        lines = [f"Market Trades for {market_name}:\n"]
         for trade in msg.trades:
-            print(f"  Account: {trade.account}")
-            print(f"    Market: {trade.market}")
-            print(f"    Action: {trade.action}")
-            print(f"    Size: {trade.size}")
-            print(f"    Price: {trade.price}")
-            print(f"    Is Profit: {trade.is_profit}")
-            print(f"    Realized PnL Amount: {trade.realized_pnl_amount}")
-            print(f"    Is Funding Positive: {trade.is_funding_positive}")
-            print(f"    Realized Funding Amount: {trade.realized_funding_amount}")
-            print(f"    Is Rebate: {trade.is_rebate}")
-            print(f"    Fee Amount: {trade.fee_amount}")
-            print(f"    Transaction Unix MS: {trade.transaction_unix_ms}")
-            print(f"    Transaction Version: {trade.transaction_version}")
-            print()
+            lines.extend(
+                (
+                    f"  Account: {trade.account}",
+                    f"    Market: {trade.market}",
+                    f"    Action: {trade.action}",
+                    f"    Size: {trade.size}",
+                    f"    Price: {trade.price}",
+                    f"    Is Profit: {trade.is_profit}",
+                    f"    Realized PnL Amount: {trade.realized_pnl_amount}",
+                    f"    Is Funding Positive: {trade.is_funding_positive}",
+                    f"    Realized Funding Amount: {trade.realized_funding_amount}",
+                    f"    Is Rebate: {trade.is_rebate}",
+                    f"    Fee Amount: {trade.fee_amount}",
+                    f"    Transaction Unix MS: {trade.transaction_unix_ms}",
+                    f"    Transaction Version: {trade.transaction_version}",
+                    "",
+                )
+            )
+        print("\n".join(lines))
 
     unsubscribe = read.market_trades.subscribe_by_name(market_name, on_data)
 
-    await asyncio.sleep(30)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
     await read.ws.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
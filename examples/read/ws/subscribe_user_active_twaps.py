@@ -1,44 +1,68 @@
 import asyncio
+import contextlib
 import os
 from typing import Any
 
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 SUB_ADDR = "0x123..."
+HEADER = f"Active TWAPs for {SUB_ADDR}:\n"
+EMPTY = f"No active TWAPs for {SUB_ADDR}"
+MAX_UPDATES = 10
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
+
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
 
     def on_data(msg: Any) -> None:
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+
         if not msg.twaps:
-            print(f"No active TWAPs for {SUB_ADDR}")
+            print(EMPTY)
             return
 
-        print(f"Active TWAPs for {SUB_ADDR}:\n")
+        lines = [HEADER]
         for twap in msg.twaps:
-            print(f"  Order ID: {twap.order_id}")
-            print(f"    Market: {twap.market}")
-            print(f"    Is Buy: {twap.is_buy}")
-            print(f"    Client Order ID: {twap.client_order_id}")
-            print(f"    Is Reduce Only: {twap.is_reduce_only}")
-            print(f"    Start Unix MS: {twap.start_unix_ms}")
-            print(f"    Frequency S: {twap.frequency_s}")
-            print(f"    Duration S: {twap.duration_s}")
-            print(f"    Orig Size: {twap.orig_size}")
-            print(f"    Remaining Size: {twap.remaining_size}")
-            print(f"    Status: {twap.status}")
-            print(f"    Transaction Unix MS: {twap.transaction_unix_ms}")
-            print(f"    Transaction Version: {twap.transaction_version}")
-            print()
+            lines.extend(
+                (
+                    f"  Order ID: {twap.order_id}",
+                    f"    Market: {twap.market}",
+                    f"    Is Buy: {twap.is_buy}",
+                    f"    Client Order ID: {twap.client_order_id}",
+                    f"    Is Reduce Only: {twap.is_reduce_only}",
+                    f"    Start Unix MS: {twap.start_unix_ms}",
+                    f"    Frequency S: {twap.frequency_s}",
+                    f"    Duration S: {twap.duration_s}",
+                    f"    Orig Size: {twap.orig_size}",
+                    f"    Remaining Size: {twap.remaining_size}",
+                    f"    Status: {twap.status}",
+                    f"    Transaction Unix MS: {twap.transaction_unix_ms}",
+                    f"    Transaction Version: {twap.transaction_version}",
+                    "",
+                )
+            )
+        print(*lines, sep="\n")
 
     unsubscribe = read.user_active_twaps.subscribe_by_addr(SUB_ADDR, on_data)
 
-    await asyncio.sleep(30)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
     await read.ws.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,44 +1,76 @@
 import asyncio
+import contextlib
 import os
 from typing import Any
 
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 SUB_ADDR = "0x123..."
+HEADER = f"Notification for {SUB_ADDR}:\n"
+MAX_UPDATES = 10
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
+
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
 
     def on_data(msg: Any) -> None:
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+
         notif = msg.notification
-        print(f"Notification for {SUB_ADDR}:\n")
-        print(f"  Account: {notif.account}")
-        print(f"  Notification Type: {notif.notification_type}")
-        if notif.notification_metadata:
-            meta = notif.notification_metadata
-            print("  Notification Metadata:")
-            print(f"    Trigger Price: {meta.trigger_price}")
-            print(f"    Reason: {meta.reason}")
-            print(f"    Amount: {meta.amount}")
-            print(f"    Filled Size: {meta.filled_size}")
-        if notif.order:
-            print("  Order:")
-            print(f"    Order ID: {notif.order.order_id}")
-            print(f"    Market: {notif.order.market}")
-        if notif.twap:
-            print("  TWAP:")
-            print(f"    Order ID: {notif.twap.order_id}")
-            print(f"    Market: {notif.twap.market}")
-        print()
+        lines = [
+            HEADER,
+            f"  Account: {notif.account}",
+            f"  Notification Type: {notif.notification_type}",
+        ]
+        if (meta := notif.notification_metadata) is not None:
+            lines.extend(
+                (
+                    "  Notification Metadata:",
+                    f"    Trigger Price: {meta.trigger_price}",
+                    f"    Reason: {meta.reason}",
+                    f"    Amount: {meta.amount}",
+                    f"    Filled Size: {meta.filled_size}",
+                )
+            )
+        if (order := notif.order) is not None:
+            lines.extend(
+                (
+                    "  Order:",
+                    f"    Order ID: {order.order_id}",
+                    f"    Market: {order.market}",
+                )
+            )
+        if (twap := notif.twap) is not None:
+            lines.extend(
+                (
+                    "  TWAP:",
+                    f"    Order ID: {twap.order_id}",
+                    f"    Market: {twap.market}",
+                )
+            )
+        lines.append("")
+        print(*lines, sep="\n")
 
     unsubscribe = read.user_notifications.subscribe_by_addr(SUB_ADDR, on_data)
 
-    await asyncio.sleep(30)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
     await read.ws.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
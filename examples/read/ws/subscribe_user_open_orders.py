@@ -1,54 +1,69 @@
 import asyncio
+import contextlib
 import os
+import sys
 from typing import Any
 
-from decibel import NETNA_CONFIG
+from decibel import NETNA_CONFIG, format_fields
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 SUB_ADDR = "0x123..."
+HEADER = f"Open Orders for {SUB_ADDR}:\n\n"
+EMPTY = f"No open orders for {SUB_ADDR}"
+MAX_UPDATES = 10
+QUEUE_SIZE = 1024
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
+
+    # Updates are handed to a printer task that writes from a worker thread, so a slow terminal
+    # never stalls the WebSocket reader
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=QUEUE_SIZE)
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
+    dropped = 0
 
     def on_data(msg: Any) -> None:
-        if not msg.orders:
-            print(f"No open orders for {SUB_ADDR}")
-            return
-
-        print(f"Open Orders for {SUB_ADDR}:\n")
-        for order in msg.orders:
-            print(f"  Order ID: {order.order_id}")
-            print(f"    Parent: {order.parent}")
-            print(f"    Market: {order.market}")
-            print(f"    Client Order ID: {order.client_order_id}")
-            print(f"    Orig Size: {order.orig_size}")
-            print(f"    Remaining Size: {order.remaining_size}")
-            print(f"    Size Delta: {order.size_delta}")
-            print(f"    Price: {order.price}")
-            print(f"    Is Buy: {order.is_buy}")
-            print(f"    Details: {order.details}")
-            print(f"    Transaction Version: {order.transaction_version}")
-            print(f"    Unix MS: {order.unix_ms}")
-            print(f"    Is TPSL: {order.is_tpsl}")
-            print(f"    TP Order ID: {order.tp_order_id}")
-            print(f"    TP Trigger Price: {order.tp_trigger_price}")
-            print(f"    TP Limit Price: {order.tp_limit_price}")
-            print(f"    SL Order ID: {order.sl_order_id}")
-            print(f"    SL Trigger Price: {order.sl_trigger_price}")
-            print(f"    SL Limit Price: {order.sl_limit_price}")
-            print(f"    Order Type: {order.order_type}")
-            print(f"    Trigger Condition: {order.trigger_condition}")
-            print(f"    Order Direction: {order.order_direction}")
-            print(f"    Is Reduce Only: {order.is_reduce_only}")
-            print()
+        nonlocal remaining, dropped
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+        try:
+            queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            dropped += 1
+
+    async def printer() -> None:
+        while (msg := await queue.get()) is not None:
+            if not msg.orders:
+                print(EMPTY)
+                continue
+
+            chunks = [HEADER]
+            for order in msg.orders:
+                chunks.extend((format_fields(order), "\n"))
+            await asyncio.to_thread(sys.stdout.write, "".join(chunks))
+
+    printer_task = asyncio.create_task(printer())
 
     unsubscribe = read.user_open_orders.subscribe_by_addr(SUB_ADDR, on_data)
 
-    await asyncio.sleep(30)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
+    await queue.put(None)
+    await printer_task
     await read.ws.close()
+    if dropped:
+        print(f"Dropped {dropped} updates while the printer was behind")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
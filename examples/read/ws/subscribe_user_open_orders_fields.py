@@ -0,0 +1,53 @@
+import asyncio
+import contextlib
+import os
+import sys
+from typing import Any
+
+from decibel import NETNA_CONFIG
+from decibel.read import DecibelReadDex
+
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+SUB_ADDR = "0x123..."
+MAX_UPDATES = 10
+
+# Only these fields are picked out of each order; the rest of the frame is never validated
+FIELDS = ("order_id", "market", "price", "remaining_size", "is_buy")
+
+
+async def main() -> None:
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
+
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
+
+    def on_data(orders: list[dict[str, Any]]) -> None:
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+
+        chunks = [f"Open Orders for {SUB_ADDR} ({len(orders)}):\n"]
+        for order in orders:
+            side = "BUY" if order["is_buy"] else "SELL"
+            chunks.append(
+                f"  {order['order_id']} {order['market']} {side} "
+                f"{order['remaining_size']} @ {order['price']}\n"
+            )
+        sys.stdout.write("".join(chunks))
+
+    unsubscribe = read.user_open_orders.subscribe_fields_by_addr(SUB_ADDR, FIELDS, on_data)
+
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
+    unsubscribe()
+    await read.ws.close()
+
+
+if __name__ == "__main__":
+    run(main())
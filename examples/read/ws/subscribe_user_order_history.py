@@ -1,55 +1,92 @@
 import asyncio
+import contextlib
 import os
+import sys
 from typing import Any
 
 from decibel import NETNA_CONFIG
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 SUB_ADDR = "0x123..."
+HEADER = f"Order Update for {SUB_ADDR}:\n\n"
+MAX_UPDATES = 10
+QUEUE_SIZE = 1024
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
+
+    # Updates are handed to a printer task that writes from a worker thread, so a slow terminal
+    # never stalls the WebSocket reader
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=QUEUE_SIZE)
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
+    dropped = 0
 
     def on_data(msg: Any) -> None:
-        inner = msg.order
-        order = inner.order
-        print(f"Order Update for {SUB_ADDR}:\n")
-        print(f"  Status: {inner.status}")
-        print(f"  Details: {inner.details}")
-        print("  Order:")
-        print(f"    Order ID: {order.order_id}")
-        print(f"    Parent: {order.parent}")
-        print(f"    Market: {order.market}")
-        print(f"    Client Order ID: {order.client_order_id}")
-        print(f"    Status: {order.status}")
-        print(f"    Order Type: {order.order_type}")
-        print(f"    Trigger Condition: {order.trigger_condition}")
-        print(f"    Order Direction: {order.order_direction}")
-        print(f"    Orig Size: {order.orig_size}")
-        print(f"    Remaining Size: {order.remaining_size}")
-        print(f"    Size Delta: {order.size_delta}")
-        print(f"    Price: {order.price}")
-        print(f"    Is Buy: {order.is_buy}")
-        print(f"    Is Reduce Only: {order.is_reduce_only}")
-        print(f"    Details: {order.details}")
-        print(f"    Is TPSL: {order.is_tpsl}")
-        print(f"    TP Order ID: {order.tp_order_id}")
-        print(f"    TP Trigger Price: {order.tp_trigger_price}")
-        print(f"    TP Limit Price: {order.tp_limit_price}")
-        print(f"    SL Order ID: {order.sl_order_id}")
-        print(f"    SL Trigger Price: {order.sl_trigger_price}")
-        print(f"    SL Limit Price: {order.sl_limit_price}")
-        print(f"    Transaction Version: {order.transaction_version}")
-        print(f"    Unix MS: {order.unix_ms}")
-        print()
+        nonlocal remaining, dropped
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+        try:
+            queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            dropped += 1
+
+    async def printer() -> None:
+        while (msg := await queue.get()) is not None:
+            inner = msg.order
+            order = inner.order
+            text = (
+                f"{HEADER}  Status: {inner.status}\n"
+                f"  Details: {inner.details}\n"
+                "  Order:\n"
+                f"    Order ID: {order.order_id}\n"
+                f"    Parent: {order.parent}\n"
+                f"    Market: {order.market}\n"
+                f"    Client Order ID: {order.client_order_id}\n"
+                f"    Status: {order.status}\n"
+                f"    Order Type: {order.order_type}\n"
+                f"    Trigger Condition: {order.trigger_condition}\n"
+                f"    Order Direction: {order.order_direction}\n"
+                f"    Orig Size: {order.orig_size}\n"
+                f"    Remaining Size: {order.remaining_size}\n"
+                f"    Size Delta: {order.size_delta}\n"
+                f"    Price: {order.price}\n"
+                f"    Is Buy: {order.is_buy}\n"
+                f"    Is Reduce Only: {order.is_reduce_only}\n"
+                f"    Details: {order.details}\n"
+                f"    Is TPSL: {order.is_tpsl}\n"
+                f"    TP Order ID: {order.tp_order_id}\n"
+                f"    TP Trigger Price: {order.tp_trigger_price}\n"
+                f"    TP Limit Price: {order.tp_limit_price}\n"
+                f"    SL Order ID: {order.sl_order_id}\n"
+                f"    SL Trigger Price: {order.sl_trigger_price}\n"
+                f"    SL Limit Price: {order.sl_limit_price}\n"
+                f"    Transaction Version: {order.transaction_version}\n"
+                f"    Unix MS: {order.unix_ms}\n\n"
+            )
+            await asyncio.to_thread(sys.stdout.write, text)
+
+    printer_task = asyncio.create_task(printer())
 
     unsubscribe = read.user_order_history.subscribe_by_addr(SUB_ADDR, on_data)
 
-    await asyncio.sleep(30)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
+    await queue.put(None)
+    await printer_task
     await read.ws.close()
+    if dropped:
+        print(f"Dropped {dropped} updates while the printer was behind")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
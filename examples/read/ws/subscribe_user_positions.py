@@ -1,42 +1,64 @@
 import asyncio
+import contextlib
 import os
+import sys
 from typing import Any
 
-from decibel import NETNA_CONFIG
+from decibel import NETNA_CONFIG, format_fields
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 SUB_ADDR = "0x123..."
+HEADER = f"Positions for {SUB_ADDR}:\n\n"
+MAX_UPDATES = 10
+QUEUE_SIZE = 1024
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
+
+    # Updates are handed to a printer task that writes from a worker thread, so a slow terminal
+    # never stalls the WebSocket reader
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=QUEUE_SIZE)
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
+    dropped = 0
 
     def on_data(msg: Any) -> None:
-        print(f"Positions for {SUB_ADDR}:\n")
-        for pos in msg.positions:
-            print(f"  Market: {pos.market}")
-            print(f"    User: {pos.user}")
-            print(f"    Size: {pos.size}")
-            print(f"    User Leverage: {pos.user_leverage}")
-            print(f"    Entry Price: {pos.entry_price}")
-            print(f"    Is Isolated: {pos.is_isolated}")
-            print(f"    Unrealized Funding: {pos.unrealized_funding}")
-            print(f"    Estimated Liquidation Price: {pos.estimated_liquidation_price}")
-            print(f"    TP Order ID: {pos.tp_order_id}")
-            print(f"    TP Trigger Price: {pos.tp_trigger_price}")
-            print(f"    TP Limit Price: {pos.tp_limit_price}")
-            print(f"    SL Order ID: {pos.sl_order_id}")
-            print(f"    SL Trigger Price: {pos.sl_trigger_price}")
-            print(f"    SL Limit Price: {pos.sl_limit_price}")
-            print(f"    Has Fixed Sized TPSLs: {pos.has_fixed_sized_tpsls}")
-            print()
+        nonlocal remaining, dropped
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+        try:
+            queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            dropped += 1
+
+    async def printer() -> None:
+        while (msg := await queue.get()) is not None:
+            chunks = [HEADER]
+            for pos in msg.positions:
+                chunks.extend((format_fields(pos), "\n"))
+            await asyncio.to_thread(sys.stdout.write, "".join(chunks))
+
+    printer_task = asyncio.create_task(printer())
 
     unsubscribe = read.user_positions.subscribe_by_addr(SUB_ADDR, on_data)
 
-    await asyncio.sleep(30)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
+    await queue.put(None)
+    await printer_task
     await read.ws.close()
+    if dropped:
+        print(f"Dropped {dropped} updates while the printer was behind")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,40 +1,64 @@
 import asyncio
+import contextlib
 import os
+import sys
 from typing import Any
 
-from decibel import NETNA_CONFIG
+from decibel import NETNA_CONFIG, format_fields
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 SUB_ADDR = "0x123..."
+HEADER = f"Trade History for {SUB_ADDR}:\n\n"
+MAX_UPDATES = 10
+QUEUE_SIZE = 1024
 
 
 async def main() -> None:
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
+    read = DecibelReadDex(NETNA_CONFIG, api_key=API_KEY)
+
+    # Updates are handed to a printer task that writes from a worker thread, so a slow terminal
+    # never stalls the WebSocket reader
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=QUEUE_SIZE)
+    done = asyncio.Event()
+    remaining = MAX_UPDATES
+    dropped = 0
 
     def on_data(msg: Any) -> None:
-        print(f"Trade History for {SUB_ADDR}:\n")
-        for trade in msg.trades:
-            print(f"  Account: {trade.account}")
-            print(f"    Market: {trade.market}")
-            print(f"    Action: {trade.action}")
-            print(f"    Size: {trade.size}")
-            print(f"    Price: {trade.price}")
-            print(f"    Is Profit: {trade.is_profit}")
-            print(f"    Realized PnL Amount: {trade.realized_pnl_amount}")
-            print(f"    Is Funding Positive: {trade.is_funding_positive}")
-            print(f"    Realized Funding Amount: {trade.realized_funding_amount}")
-            print(f"    Is Rebate: {trade.is_rebate}")
-            print(f"    Fee Amount: {trade.fee_amount}")
-            print(f"    Transaction Unix MS: {trade.transaction_unix_ms}")
-            print(f"    Transaction Version: {trade.transaction_version}")
-            print()
+        nonlocal remaining, dropped
+        remaining -= 1
+        if remaining == 0:
+            done.set()
+        try:
+            queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            dropped += 1
+
+    async def printer() -> None:
+        while (msg := await queue.get()) is not None:
+            chunks = [HEADER]
+            for trade in msg.trades:
+                chunks.extend((format_fields(trade), "\n"))
+            await asyncio.to_thread(sys.stdout.write, "".join(chunks))
+
+    printer_task = asyncio.create_task(printer())
 
     unsubscribe = read.user_trade_history.subscribe_by_addr(SUB_ADDR, on_data)
 
-    await asyncio.sleep(30)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(done.wait(), timeout=30)
     unsubscribe()
+    await queue.put(None)
+    await printer_task
     await read.ws.close()
+    if dropped:
+        print(f"Dropped {dropped} updates while the printer was behind")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
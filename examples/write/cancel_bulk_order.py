@@ -1,8 +1,6 @@
-import asyncio
 import os
 
 from aptos_sdk.account import Account
-from aptos_sdk.ed25519 import PrivateKey
 
 from decibel import (
     NETNA_CONFIG,
@@ -11,10 +9,16 @@ from decibel import (
     GasPriceManager,
 )
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+
 
 async def main() -> None:
-    private_key = PrivateKey.from_hex(os.environ["PRIVATE_KEY"])
-    account = Account.load_key(private_key.hex())
+    account = Account.load_key(os.environ["PRIVATE_KEY"])
 
     gas = GasPriceManager(NETNA_CONFIG)
     await gas.initialize()
@@ -23,7 +27,7 @@ async def main() -> None:
         NETNA_CONFIG,
         account,
         opts=BaseSDKOptions(
-            node_api_key=os.environ.get("APTOS_NODE_API_KEY"),
+            node_api_key=API_KEY,
             gas_price_manager=gas,
             skip_simulate=False,
             no_fee_payer=True,
@@ -42,4 +46,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
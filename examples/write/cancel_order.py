@@ -1,8 +1,6 @@
-import asyncio
 import os
 
 from aptos_sdk.account import Account
-from aptos_sdk.ed25519 import PrivateKey
 
 from decibel import (
     NETNA_CONFIG,
@@ -11,10 +9,16 @@ from decibel import (
     GasPriceManager,
 )
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+
 
 async def main() -> None:
-    private_key = PrivateKey.from_hex(os.environ["PRIVATE_KEY"])
-    account = Account.load_key(private_key.hex())
+    account = Account.load_key(os.environ["PRIVATE_KEY"])
 
     gas = GasPriceManager(NETNA_CONFIG)
     await gas.initialize()
@@ -23,7 +27,7 @@ async def main() -> None:
         NETNA_CONFIG,
         account,
         opts=BaseSDKOptions(
-            node_api_key=os.environ.get("APTOS_NODE_API_KEY"),
+            node_api_key=API_KEY,
             gas_price_manager=gas,
             skip_simulate=False,
             no_fee_payer=True,
@@ -40,8 +44,17 @@ async def main() -> None:
     print(f"Transaction hash: {tx_result.get('hash')}")
     print(f"Order {order_id} cancelled")
 
+    # Several orders on the same market: the cancels are submitted concurrently
+    order_ids: list[int | str] = [12346, 12347, 12348]
+    results = await write.cancel_orders(order_ids=order_ids, market_name="BTC/USD")
+    for cancelled_id, result in zip(order_ids, results, strict=True):
+        if isinstance(result, BaseException):
+            print(f"Order {cancelled_id} not cancelled: {result}")
+        else:
+            print(f"Order {cancelled_id} cancelled: {result.get('hash')}")
+
     await gas.destroy()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,8 +1,6 @@
-import asyncio
 import os
 
 from aptos_sdk.account import Account
-from aptos_sdk.ed25519 import PrivateKey
 
 from decibel import (
     NETNA_CONFIG,
@@ -11,37 +9,39 @@ from decibel import (
     GasPriceManager,
 )
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
 
-async def main() -> None:
-    private_key = PrivateKey.from_hex(os.environ["PRIVATE_KEY"])
-    account = Account.load_key(private_key.hex())
-
-    gas = GasPriceManager(NETNA_CONFIG)
-    await gas.initialize()
-
-    write = DecibelWriteDex(
-        NETNA_CONFIG,
-        account,
-        opts=BaseSDKOptions(
-            node_api_key=os.environ.get("APTOS_NODE_API_KEY"),
-            gas_price_manager=gas,
-            skip_simulate=False,
-            no_fee_payer=True,
-            time_delta_ms=0,
-        ),
-    )
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
 
-    client_order_id = "my-limit-order-001"
-    tx_result = await write.cancel_client_order(
-        client_order_id=client_order_id,
-        market_name="BTC/USD",
-    )
 
-    print(f"Transaction hash: {tx_result.get('hash')}")
-    print(f"Order with client ID '{client_order_id}' cancelled")
-
-    await gas.destroy()
+async def main() -> None:
+    account = Account.load_key(os.environ["PRIVATE_KEY"])
+
+    async with GasPriceManager(NETNA_CONFIG) as gas:
+        write = DecibelWriteDex(
+            NETNA_CONFIG,
+            account,
+            opts=BaseSDKOptions(
+                node_api_key=API_KEY,
+                gas_price_manager=gas,
+                skip_simulate=False,
+                no_fee_payer=True,
+                time_delta_ms=0,
+            ),
+        )
+
+        client_order_id = "my-limit-order-001"
+        tx_result = await write.cancel_client_order(
+            client_order_id=client_order_id,
+            market_name="BTC/USD",
+        )
+
+        print(f"Transaction hash: {tx_result.get('hash')}")
+        print(f"Order with client ID '{client_order_id}' cancelled")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -2,7 +2,6 @@ import asyncio
 import os
 
 from aptos_sdk.account import Account
-from aptos_sdk.ed25519 import PrivateKey
 
 from decibel import (
     NETNA_CONFIG,
@@ -15,68 +14,73 @@ from decibel import (
 )
 from decibel.read import DecibelReadDex
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+API_KEY = os.environ.get("APTOS_NODE_API_KEY")
+
 
 async def main() -> None:
-    private_key = PrivateKey.from_hex(os.environ["PRIVATE_KEY"])
-    account = Account.load_key(private_key.hex())
+    account = Account.load_key(os.environ["PRIVATE_KEY"])
 
     gas = GasPriceManager(NETNA_CONFIG)
-    await gas.initialize()
-
-    read = DecibelReadDex(NETNA_CONFIG, api_key=os.environ.get("APTOS_NODE_API_KEY"))
-    markets = await read.markets.get_all()
-    btc_market = next((m for m in markets if m.market_name == "BTC/USD"), None)
-
-    if btc_market is None:
-        print("BTC/USD market not found")
-        await gas.destroy()
-        return
-
-    price = amount_to_chain_units(80000.0, btc_market.px_decimals)
-    size = amount_to_chain_units(0.001, btc_market.sz_decimals)
-    tick_size = btc_market.tick_size
-
-    tp_trigger = amount_to_chain_units(100000.0, btc_market.px_decimals)
-    tp_limit = amount_to_chain_units(99900.0, btc_market.px_decimals)
-
-    sl_trigger = amount_to_chain_units(70000.0, btc_market.px_decimals)
-    sl_limit = amount_to_chain_units(69900.0, btc_market.px_decimals)
-
-    write = DecibelWriteDex(
-        NETNA_CONFIG,
-        account,
-        opts=BaseSDKOptions(
-            node_api_key=os.environ.get("APTOS_NODE_API_KEY"),
-            gas_price_manager=gas,
-            skip_simulate=False,
-            no_fee_payer=True,
-            time_delta_ms=0,
-        ),
-    )
-
-    result = await write.place_order(
-        market_name="BTC/USD",
-        price=price,
-        size=size,
-        is_buy=True,
-        time_in_force=TimeInForce.GoodTillCanceled,
-        is_reduce_only=False,
-        tp_trigger_price=tp_trigger,
-        tp_limit_price=tp_limit,
-        sl_trigger_price=sl_trigger,
-        sl_limit_price=sl_limit,
-        tick_size=tick_size,
-    )
-
-    if isinstance(result, PlaceOrderSuccess):
-        print("Order with TP/SL placed!")
-        print(f"Order ID: {result.order_id}")
-        print(f"Transaction hash: {result.transaction_hash}")
-    else:
-        print(f"Order failed: {result.error}")
-
-    await gas.destroy()
+
+    async with DecibelReadDex(NETNA_CONFIG, api_key=API_KEY) as read:
+        _, btc_market = await asyncio.gather(gas.initialize(), read.markets.find_by_name("BTC/USD"))
+
+        async with gas:
+            if btc_market is None:
+                print("BTC/USD market not found")
+                return
+
+            px_decimals = btc_market.px_decimals
+            sz_decimals = btc_market.sz_decimals
+
+            price = amount_to_chain_units(80000.0, px_decimals)
+            size = amount_to_chain_units(0.001, sz_decimals)
+            tick_size = btc_market.tick_size
+
+            tp_trigger = amount_to_chain_units(100000.0, px_decimals)
+            tp_limit = amount_to_chain_units(99900.0, px_decimals)
+
+            sl_trigger = amount_to_chain_units(70000.0, px_decimals)
+            sl_limit = amount_to_chain_units(69900.0, px_decimals)
+
+            write = DecibelWriteDex(
+                NETNA_CONFIG,
+                account,
+                opts=BaseSDKOptions(
+                    node_api_key=API_KEY,
+                    gas_price_manager=gas,
+                    skip_simulate=False,
+                    no_fee_payer=True,
+                    time_delta_ms=0,
+                ),
+            )
+
+            result = await write.place_order(
+                market_name="BTC/USD",
+                price=price,
+                size=size,
+                is_buy=True,
+                time_in_force=TimeInForce.GoodTillCanceled,
+                is_reduce_only=False,
+                tp_trigger_price=tp_trigger,
+                tp_limit_price=tp_limit,
+                sl_trigger_price=sl_trigger,
+                sl_limit_price=sl_limit,
+                tick_size=tick_size,
+            )
+
+            if isinstance(result, PlaceOrderSuccess):
+                print("Order with TP/SL placed!")
+                print(f"Order ID: {result.order_id}")
+                print(f"Transaction hash: {result.transaction_hash}")
+            else:
+                print(f"Order failed: {result.error}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -77,8 +77,10 @@ from decibel._transaction_builder import (
 from decibel._utils import (
     FetchError,
     amount_to_chain_units,
+    amounts_to_chain_units,
     chain_units_to_amount,
     extract_vault_address_from_create_tx,
+    format_fields,
     generate_random_replay_protection_nonce,
     get_market_addr,
     get_primary_subaccount_addr,
@@ -92,7 +94,9 @@ from decibel._utils import (
     post_request_sync,
     round_to_tick_size,
     round_to_valid_order_size,
+    round_to_valid_order_sizes,
     round_to_valid_price,
+    round_to_valid_prices,
 )
 from decibel._version import __version__
 from decibel.abi import (
@@ -146,6 +150,7 @@ __all__ = [
     "ABISummary",
     "AbiRegistry",
     "amount_to_chain_units",
+    "amounts_to_chain_units",
     "ApproveBuilderFeeArgs",
     "build_simple_transaction_sync",
     "CancelBulkOrderArgs",
@@ -169,6 +174,7 @@ __all__ = [
     "DOCKER_CONFIG",
     "extract_vault_address_from_create_tx",
     "FetchError",
+    "format_fields",
     "GasPriceInfo",
     "GasPriceManager",
     "GasPriceManagerOptions",
@@ -229,7 +235,9 @@ __all__ = [
     "RevokeBuilderFeeArgs",
     "round_to_tick_size",
     "round_to_valid_order_size",
+    "round_to_valid_order_sizes",
     "round_to_valid_price",
+    "round_to_valid_prices",
     "SearchTermParams",
     "SimpleTransaction",
     "SortDirection",
@@ -1,25 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import logging
 import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Self, TypeVar, TypeVarTuple, cast
 
 import httpx
 from aptos_sdk.async_client import RestClient
-from aptos_sdk.authenticator import (
-    AccountAuthenticator,
-    Authenticator,
-    Ed25519Authenticator,
-    FeePayerAuthenticator,
-)
+from aptos_sdk.authenticator import AccountAuthenticator, Authenticator, Ed25519Authenticator
 from aptos_sdk.bcs import Serializer
 from aptos_sdk.ed25519 import PublicKey as Ed25519PublicKey
 from aptos_sdk.ed25519 import Signature as Ed25519Signature
-from aptos_sdk.transactions import FeePayerRawTransaction, SignedTransaction
+from pydantic_core import from_json
 
 from ._fee_pay import (
     PendingTransactionResponse,
+    pending_response_for,
     submit_fee_paid_transaction,
     submit_fee_paid_transaction_sync,
 )
@@ -28,6 +27,9 @@ from ._utils import generate_random_replay_protection_nonce, get_primary_subacco
 from .abi import AbiRegistry
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Executor
+
     from aptos_sdk.account import Account
     from aptos_sdk.account_address import AccountAddress
 
@@ -44,10 +46,27 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+Ts = TypeVarTuple("Ts")
+
 DEFAULT_MAX_GAS_AMOUNT = 200_000
 DEFAULT_GAS_ESTIMATE = 100
 MAX_GAS_UNITS_LIMIT = 2_000_000
 
+_BCS_CONTENT_TYPE = "application/x.aptos.signed_transaction+bcs"
+_RAW_TXN_SIGNING_SALT = hashlib.sha3_256(b"APTOS::RawTransaction").digest()
+_RAW_TXN_WITH_DATA_SIGNING_SALT = hashlib.sha3_256(b"APTOS::RawTransactionWithData").digest()
+_ZERO_ED25519_SIGNATURE = Ed25519Signature(b"\x00" * 64)
+
+# Without a GasPriceManager, a remembered estimate is used as-is while fresh, and served while
+# being refreshed in the background until stale; only an older (or no) estimate blocks build_tx.
+_GAS_PRICE_FRESH_SECS = 10.0
+_GAS_PRICE_STALE_SECS = 60.0
+
+_POLL_BACKOFF_FACTOR = 1.7
+# Bound on remembered simulations; the oldest entry is dropped first
+_SIMULATION_CACHE_MAX_ENTRIES = 256
+
 
 @dataclass
 class BaseSDKOptions:
@@ -56,6 +75,18 @@ class BaseSDKOptions:
     node_api_key: str | None = None
     gas_price_manager: GasPriceManager | None = None
     time_delta_ms: int = 0
+    http_client: httpx.AsyncClient | None = None
+    # Negotiate HTTP/2 on the SDK-owned client so concurrent requests multiplex over one
+    # connection; servers without HTTP/2 fall back to HTTP/1.1. Ignored with http_client.
+    # Needs the h2 package: pip install 'decibel-python-sdk[http2]'.
+    http2: bool = False
+    # Run transaction building and signing in this executor instead of on the event loop, for
+    # apps sending many transactions concurrently alongside latency-sensitive I/O
+    cpu_executor: Executor | None = None
+    # Reuse a simulation's gas values for later sends of an identical payload from the same
+    # sender for this many seconds, skipping the simulate round trip in tight loops. 0 simulates
+    # every send.
+    simulation_cache_ttl_secs: float = 0.0
 
 
 @dataclass
@@ -66,6 +97,116 @@ class BaseSDKOptionsSync:
     gas_price_manager: GasPriceManagerSync | None = None
     time_delta_ms: int = 0
     http_client: httpx.Client | None = None
+    # As BaseSDKOptions.http2, for the SDK-owned client. Ignored with http_client.
+    http2: bool = False
+    # As BaseSDKOptions.simulation_cache_ttl_secs
+    simulation_cache_ttl_secs: float = 0.0
+
+
+def _http2_unavailable() -> ImportError:
+    return ImportError(
+        "http2=True requires the h2 package; install it with "
+        "pip install 'decibel-python-sdk[http2]'"
+    )
+
+
+def _next_poll_delay(response: httpx.Response, interval: float, remaining: float) -> float:
+    # Honor a numeric Retry-After from a rate-limited node (the HTTP-date form is not used
+    # there), ignoring negative or unparsable values and never sleeping past the deadline
+    delay = interval
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            requested = float(retry_after)
+        except ValueError:
+            requested = -1.0
+        if requested >= 0:
+            delay = max(requested, interval)
+    return max(min(delay, remaining), 0.0)
+
+
+def _simulation_cache_key(payload: InputEntryFunctionData, sender: AccountAddress) -> str:
+    # Gas depends on the whole call: the market, order sizes, vector lengths of bulk orders and
+    # which optional legs are set all change the cost, so only an identical call from the same
+    # sender reuses a simulation
+    return repr((str(sender), payload.function, payload.type_arguments, payload.function_arguments))
+
+
+def _cached_simulation(
+    cache: dict[str, tuple[float, int, int]],
+    key: str,
+    ttl: float,
+) -> tuple[int, int] | None:
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= ttl:
+        del cache[key]
+        return None
+    return cached[1], cached[2]
+
+
+def _remember_simulation(
+    cache: dict[str, tuple[float, int, int]],
+    key: str,
+    max_gas_amount: int,
+    gas_unit_price: int,
+) -> None:
+    cache.pop(key, None)
+    if len(cache) >= _SIMULATION_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = (time.monotonic(), max_gas_amount, gas_unit_price)
+
+
+def _log_gas_refresh_error(task: asyncio.Task[int]) -> None:
+    if not task.cancelled() and (error := task.exception()) is not None:
+        logger.warning("Background gas price refresh failed: %s", error)
+
+
+# BCS bytes of the zero-signature simulation authenticators: the single-signer authenticator,
+# then the fee-payer authenticator split around the fee payer address (the fee payer is
+# simulated with the sender's key)
+def _zero_signature_authenticator_bytes(account: Account) -> tuple[bytes, bytes, bytes]:
+    ed25519_auth = Ed25519Authenticator(
+        cast("Ed25519PublicKey", account.public_key()),
+        _ZERO_ED25519_SIGNATURE,
+    )
+
+    single = Serializer()
+    Authenticator(ed25519_auth).serialize(single)
+
+    account_auth = Serializer()
+    AccountAuthenticator(ed25519_auth).serialize(account_auth)
+    account_auth_bytes = account_auth.output()
+
+    # FeePayerAuthenticator layout: sender, secondary addresses, secondary signers, fee payer
+    # address, fee payer authenticator; there are no secondary signers
+    prefix = Serializer()
+    prefix.uleb128(Authenticator.FEE_PAYER)
+    prefix.fixed_bytes(account_auth_bytes)  # pyright: ignore[reportUnknownMemberType]
+    prefix.uleb128(0)
+    prefix.uleb128(0)
+
+    return single.output(), prefix.output(), account_auth_bytes
+
+
+def _sign_raw_txn_bytes(
+    signer: Account,
+    raw_txn_bytes: bytes,
+    fee_payer: AccountAddress | None,
+) -> AccountAuthenticator:
+    # Same signing message as RawTransaction.sign / FeePayerRawTransaction.sign, built from
+    # already-serialized bytes: a domain-separation hash followed by the BCS transaction
+    if fee_payer is None:
+        message = _RAW_TXN_SIGNING_SALT + raw_txn_bytes
+    else:
+        # RawTransactionWithData::MultiAgentWithFeePayer with no secondary signers
+        message = b"".join(
+            (_RAW_TXN_WITH_DATA_SIGNING_SALT, b"\x01", raw_txn_bytes, b"\x00", fee_payer.address)
+        )
+    signature = cast("Ed25519Signature", signer.sign(message))
+    public_key = cast("Ed25519PublicKey", signer.public_key())
+    return AccountAuthenticator(Ed25519Authenticator(public_key, signature))
 
 
 class BaseSDK:
@@ -79,14 +220,48 @@ class BaseSDK:
         self._account = account
         self._chain_id = config.chain_id
         self._abi_registry = AbiRegistry(chain_id=config.chain_id)
+        self._abi_cache: dict[str, MoveFunction | None] = {}
         self._aptos = RestClient(config.fullnode_url)
 
         opts = opts or BaseSDKOptions()
         self._skip_simulate = opts.skip_simulate
         self._no_fee_payer = opts.no_fee_payer
+        # Options are fixed for the SDK's lifetime, so the submit route is resolved once
+        self._submit = self._submit_direct if self._no_fee_payer else self._submit_fee_paid
         self._node_api_key = opts.node_api_key
+        # Built once and shared by every request; httpx copies them, so they are never mutated
+        self._node_headers = self._build_node_headers()
+        self._bcs_headers = {**self._node_headers, "Content-Type": _BCS_CONTENT_TYPE}
+        fullnode_url = config.fullnode_url
+        self._estimate_gas_url = f"{fullnode_url}/estimate_gas_price"
+        self._simulate_url = f"{fullnode_url}/transactions/simulate"
+        self._submit_url = f"{fullnode_url}/transactions"
+        self._tx_by_hash_url = f"{fullnode_url}/transactions/by_hash/"
+        # Simulation only needs the sender's public key next to an all-zero signature, so the
+        # authenticator bytes are serialized once; only the fee payer address varies
+        (
+            self._zero_auth_bytes,
+            self._zero_auth_fee_payer_prefix,
+            self._zero_auth_fee_payer_suffix,
+        ) = _zero_signature_authenticator_bytes(account)
+        self._last_gas_price: tuple[float, int] | None = None
+        self._gas_refresh_task: asyncio.Task[int] | None = None
         self._gas_price_manager = opts.gas_price_manager
         self._time_delta_ms = opts.time_delta_ms
+        self._simulation_cache_ttl_secs = opts.simulation_cache_ttl_secs
+        # Simulation cache key -> (simulated at, max gas amount, gas unit price)
+        self._simulation_cache: dict[str, tuple[float, int, int]] = {}
+        self._cpu_executor = opts.cpu_executor
+        # Build, simulate, submit and poll all hit the same node, so they share one pooled client
+        # and its keep-alive connections. A caller-supplied client is used as-is and left open.
+        http_client = opts.http_client
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            try:
+                http_client = httpx.AsyncClient(http2=opts.http2)
+            except ImportError as e:
+                raise _http2_unavailable() from e
+        self._http_client = http_client
 
         if config.chain_id is None:
             logger.warning(
@@ -98,6 +273,25 @@ class BaseSDK:
     def aptos(self) -> RestClient:
         return self._aptos
 
+    async def close(self) -> None:
+        if self._gas_refresh_task is not None:
+            self._gas_refresh_task.cancel()
+            self._gas_refresh_task = None
+        await self._aptos.close()
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        await self.close()
+
     @property
     def config(self) -> DecibelConfig:
         return self._config
@@ -123,7 +317,22 @@ class BaseSDK:
         self._time_delta_ms = value
 
     def _get_abi(self, function_id: str) -> MoveFunction | None:
-        return self._abi_registry.get_function(function_id)
+        # build_tx runs twice per simulated send, so resolved ABIs (and misses) are memoized
+        try:
+            return self._abi_cache[function_id]
+        except KeyError:
+            function_abi = self._abi_registry.get_function(function_id)
+            self._abi_cache[function_id] = function_abi
+            return function_abi
+
+    def _draft_gas_unit_price(self) -> int:
+        if self._gas_price_manager is not None:
+            cached_price = self._gas_price_manager.get_gas_price()
+            if cached_price is not None:
+                return cached_price
+        elif self._last_gas_price is not None:
+            return self._last_gas_price[1]
+        return DEFAULT_GAS_ESTIMATE
 
     async def build_tx(
         self,
@@ -145,16 +354,10 @@ class BaseSDK:
             )
 
         if gas_unit_price is None:
-            if self._gas_price_manager is not None:
-                cached_price = self._gas_price_manager.get_gas_price()
-                if cached_price is not None:
-                    gas_unit_price = cached_price
-                else:
-                    gas_unit_price = await self._gas_price_manager.fetch_and_set_gas_price()
-            else:
-                gas_unit_price = await self._fetch_gas_price_estimation()
+            gas_unit_price = await self._get_gas_unit_price()
 
-        return build_simple_transaction_sync(
+        build = functools.partial(
+            build_simple_transaction_sync,
             sender=sender,
             data=data,
             chain_id=self._chain_id,
@@ -165,18 +368,27 @@ class BaseSDK:
             time_delta_ms=self._time_delta_ms,
             max_gas_amount=max_gas_amount or DEFAULT_MAX_GAS_AMOUNT,
         )
+        return await self._run_cpu_bound(build)
 
     async def submit_tx(
         self,
         transaction: SimpleTransaction,
         sender_authenticator: AccountAuthenticator,
+        raw_txn_bytes: bytes | None = None,
+    ) -> PendingTransactionResponse:
+        return await self._submit(transaction, sender_authenticator, raw_txn_bytes)
+
+    async def _submit_fee_paid(
+        self,
+        transaction: SimpleTransaction,
+        sender_authenticator: AccountAuthenticator,
+        raw_txn_bytes: bytes | None = None,
     ) -> PendingTransactionResponse:
-        if self._no_fee_payer:
-            return await self._submit_direct(transaction, sender_authenticator)
         return await submit_fee_paid_transaction(
             self._config,
             transaction,
             sender_authenticator,
+            client=self._http_client,
         )
 
     async def _send_tx(
@@ -187,26 +399,10 @@ class BaseSDK:
         signer = account_override if account_override is not None else self._account
         sender = signer.address()
 
-        transaction = await self.build_tx(payload, sender)
-
-        if not self._skip_simulate:
-            sim_result = await self._simulate_transaction(transaction)
-
-            max_gas_amount_str = sim_result.get("max_gas_amount")
-            gas_unit_price_str = sim_result.get("gas_unit_price")
-
-            if max_gas_amount_str is None or gas_unit_price_str is None:
-                raise ValueError("Transaction simulation returned no results")
-
-            simulated_max_gas = int(max_gas_amount_str)
-            simulated_gas_price = int(gas_unit_price_str)
-
-            max_gas_amount = min(
-                max(simulated_max_gas * 2, DEFAULT_MAX_GAS_AMOUNT),
-                MAX_GAS_UNITS_LIMIT,
-            )
-            gas_unit_price = max(simulated_gas_price, 1)
-
+        if self._skip_simulate:
+            transaction = await self.build_tx(payload, sender)
+        else:
+            max_gas_amount, gas_unit_price = await self._simulate_gas(payload, sender)
             transaction = await self.build_tx(
                 payload,
                 sender,
@@ -214,66 +410,160 @@ class BaseSDK:
                 gas_unit_price=gas_unit_price,
             )
 
-        sender_authenticator = self._sign_transaction(signer, transaction)
+        raw_txn_bytes, sender_authenticator = await self._run_cpu_bound(
+            self._serialize_and_sign, signer, transaction
+        )
 
-        pending_tx = await self.submit_tx(transaction, sender_authenticator)
+        try:
+            pending_tx = await self._submit(transaction, sender_authenticator, raw_txn_bytes)
+            return await self._wait_for_transaction(pending_tx.hash)
+        except Exception:
+            # Gas values reused from an earlier simulation may be why this failed
+            self._simulation_cache.pop(_simulation_cache_key(payload, sender), None)
+            raise
 
-        return await self._wait_for_transaction(pending_tx.hash)
+    async def _simulate_gas(
+        self,
+        payload: InputEntryFunctionData,
+        sender: AccountAddress,
+    ) -> tuple[int, int]:
+        cache_ttl = self._simulation_cache_ttl_secs
+        cache_key = _simulation_cache_key(payload, sender) if cache_ttl > 0 else None
+        if cache_key is not None:
+            cached = _cached_simulation(self._simulation_cache, cache_key, cache_ttl)
+            if cached is not None:
+                return cached
+
+        # The node estimates the gas price while simulating and the transaction is rebuilt
+        # with that estimate, so the draft does not need a fresh quote of its own.
+        draft = await self.build_tx(payload, sender, gas_unit_price=self._draft_gas_unit_price())
+        sim_result = await self._simulate_transaction(draft)
+
+        max_gas_amount_str = sim_result.get("max_gas_amount")
+        gas_unit_price_str = sim_result.get("gas_unit_price")
+
+        if max_gas_amount_str is None or gas_unit_price_str is None:
+            raise ValueError("Transaction simulation returned no results")
+
+        simulated_max_gas = int(max_gas_amount_str)
+        simulated_gas_price = int(gas_unit_price_str)
+
+        max_gas_amount = min(
+            max(simulated_max_gas * 2, DEFAULT_MAX_GAS_AMOUNT),
+            MAX_GAS_UNITS_LIMIT,
+        )
+        gas_unit_price = max(simulated_gas_price, 1)
+
+        if cache_key is not None:
+            _remember_simulation(self._simulation_cache, cache_key, max_gas_amount, gas_unit_price)
+        return max_gas_amount, gas_unit_price
+
+    async def send_many(
+        self,
+        payloads: Sequence[InputEntryFunctionData],
+        account_override: Account | None = None,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Send several entry-function payloads with all transactions in flight at once.
+
+        The node has no batch simulate, so each payload is still simulated and submitted on its
+        own; with replay-protection nonces they run concurrently, in roughly one round trip.
+
+        Returns one entry per payload, in order: the committed transaction, or the exception
+        that payload raised. A failure does not cancel the others, so the results show exactly
+        which transactions landed.
+        """
+        return await asyncio.gather(
+            *(self._send_tx(payload, account_override) for payload in payloads),
+            return_exceptions=True,
+        )
 
     def _sign_transaction(
         self,
         signer: Account,
         transaction: SimpleTransaction,
+        raw_txn_bytes: bytes | None = None,
     ) -> AccountAuthenticator:
-        raw_txn = transaction.raw_transaction
+        if raw_txn_bytes is None:
+            raw_txn_bytes = self._serialize_raw_txn(transaction)
+        return _sign_raw_txn_bytes(signer, raw_txn_bytes, transaction.fee_payer_address)
 
-        if transaction.fee_payer_address is not None:
-            fee_payer_txn = FeePayerRawTransaction(
-                raw_transaction=raw_txn,
-                secondary_signers=[],
-                fee_payer=transaction.fee_payer_address,
-            )
-            return fee_payer_txn.sign(signer.private_key)
-        else:
-            return raw_txn.sign(signer.private_key)
+    def _serialize_and_sign(
+        self,
+        signer: Account,
+        transaction: SimpleTransaction,
+    ) -> tuple[bytes, AccountAuthenticator]:
+        raw_txn_bytes = self._serialize_raw_txn(transaction)
+        return raw_txn_bytes, self._sign_transaction(signer, transaction, raw_txn_bytes)
+
+    async def _run_cpu_bound(self, func: Callable[[*Ts], T], *args: *Ts) -> T:
+        if self._cpu_executor is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._cpu_executor, func, *args)
+
+    async def _get_gas_unit_price(self) -> int:
+        if self._gas_price_manager is not None:
+            cached_price = self._gas_price_manager.get_gas_price()
+            if cached_price is not None:
+                return cached_price
+            return await self._gas_price_manager.request_refresh()
+
+        if self._last_gas_price is not None:
+            fetched_at, price = self._last_gas_price
+            age = time.monotonic() - fetched_at
+            if age < _GAS_PRICE_FRESH_SECS:
+                return price
+            if age < _GAS_PRICE_STALE_SECS:
+                self._refresh_gas_price()
+                return price
+
+        return await asyncio.shield(self._refresh_gas_price())
+
+    def _refresh_gas_price(self) -> asyncio.Task[int]:
+        # Single flight: concurrent callers share the in-progress estimate request
+        if self._gas_refresh_task is None or self._gas_refresh_task.done():
+            self._gas_refresh_task = asyncio.create_task(self._fetch_and_remember_gas_price())
+            self._gas_refresh_task.add_done_callback(_log_gas_refresh_error)
+        return self._gas_refresh_task
+
+    async def _fetch_and_remember_gas_price(self) -> int:
+        price = await self._fetch_gas_price_estimation()
+        self._last_gas_price = (time.monotonic(), price)
+        return price
 
     async def _fetch_gas_price_estimation(self) -> int:
-        url = f"{self._config.fullnode_url}/estimate_gas_price"
-        headers = self._build_node_headers()
+        url = self._estimate_gas_url
+        headers = self._node_headers
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
+        response = await self._http_client.get(url, headers=headers)
 
         if not response.is_success:
             raise ValueError(f"Failed to fetch gas price: {response.status_code} - {response.text}")
 
-        data = cast("dict[str, Any]", response.json())
+        data = cast("dict[str, Any]", from_json(response.content))
         return int(data.get("gas_estimate", DEFAULT_GAS_ESTIMATE))
 
     async def _simulate_transaction(
         self,
         transaction: SimpleTransaction,
     ) -> dict[str, Any]:
-        url = f"{self._config.fullnode_url}/transactions/simulate"
-        headers = self._build_node_headers()
-        headers["Content-Type"] = "application/x.aptos.signed_transaction+bcs"
+        url = self._simulate_url
+        headers = self._bcs_headers
 
         bcs_bytes = self._serialize_for_simulation(transaction)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                content=bcs_bytes,
-                headers=headers,
-                params={"estimate_max_gas_amount": "true", "estimate_gas_unit_price": "true"},
-            )
+        response = await self._http_client.post(
+            url,
+            content=bcs_bytes,
+            headers=headers,
+            params={"estimate_max_gas_amount": "true", "estimate_gas_unit_price": "true"},
+        )
 
         if not response.is_success:
             raise ValueError(
                 f"Transaction simulation failed: {response.status_code} - {response.text}"
             )
 
-        data: list[dict[str, Any]] | dict[str, Any] = response.json()
+        data: list[dict[str, Any]] | dict[str, Any] = from_json(response.content)
         if isinstance(data, list) and len(data) > 0:
             return data[0]
 
@@ -283,68 +573,61 @@ class BaseSDK:
         self,
         transaction: SimpleTransaction,
         sender_authenticator: AccountAuthenticator,
+        raw_txn_bytes: bytes | None = None,
     ) -> PendingTransactionResponse:
-        url = f"{self._config.fullnode_url}/transactions"
-        headers = self._build_node_headers()
-        headers["Content-Type"] = "application/x.aptos.signed_transaction+bcs"
+        url = self._submit_url
+        headers = self._bcs_headers
+        if raw_txn_bytes is None:
+            raw_txn_bytes = self._serialize_raw_txn(transaction)
 
-        bcs_bytes = self._serialize_signed_transaction(transaction, sender_authenticator)
+        bcs_bytes = self._serialize_signed_transaction(raw_txn_bytes, sender_authenticator)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, content=bcs_bytes, headers=headers)
+        response = await self._http_client.post(url, content=bcs_bytes, headers=headers)
 
         if not response.is_success:
             raise ValueError(
                 f"Transaction submission failed: {response.status_code} - {response.text}"
             )
 
-        data = cast("dict[str, Any]", response.json())
-        raw_txn = transaction.raw_transaction
-
-        return PendingTransactionResponse(
-            hash=str(data.get("hash", "")),
-            sender=str(raw_txn.sender),
-            sequence_number=str(raw_txn.sequence_number),
-            max_gas_amount=str(raw_txn.max_gas_amount),
-            gas_unit_price=str(raw_txn.gas_unit_price),
-            expiration_timestamp_secs=str(raw_txn.expiration_timestamps_secs),
-        )
+        data = cast("dict[str, Any]", from_json(response.content))
+        return pending_response_for(str(data.get("hash") or ""), transaction.raw_transaction)
 
     async def _wait_for_transaction(
         self,
         tx_hash: str,
         timeout_secs: float = 30.0,
         poll_interval_secs: float = 1.0,
+        min_poll_interval_secs: float = 0.05,
     ) -> dict[str, Any]:
-        url = f"{self._config.fullnode_url}/transactions/by_hash/{tx_hash}"
-        headers = self._build_node_headers()
-        start_time = time.time()
-
-        async with httpx.AsyncClient() as client:
-            while True:
-                response = await client.get(url, headers=headers)
-
-                if response.is_success:
-                    data = cast("dict[str, Any]", response.json())
-                    tx_type = data.get("type")
-                    if tx_type == "pending_transaction":
-                        pass
-                    elif data.get("success") is True:
+        url = self._tx_by_hash_url + tx_hash
+        headers = self._node_headers
+        deadline = time.monotonic() + timeout_secs
+        # Most transactions land well under a second, so start polling fast and back off
+        # towards poll_interval_secs for slow ones
+        interval = min_poll_interval_secs
+
+        while True:
+            response = await self._http_client.get(url, headers=headers)
+
+            if response.is_success:
+                data = cast("dict[str, Any]", from_json(response.content))
+                # Pending is the common answer while waiting; only committed ones carry success
+                if data.get("type") != "pending_transaction":
+                    success = data.get("success")
+                    if success is True:
                         return data
-                    elif data.get("success") is False:
+                    if success is False:
                         vm_status = data.get("vm_status", "Unknown error")
                         raise ValueError(f"Transaction failed: {vm_status}")
 
-                if time.time() - start_time > timeout_secs:
-                    raise TimeoutError(
-                        f"Transaction {tx_hash} did not complete within {timeout_secs}s"
-                    )
+            now = time.monotonic()
+            if now >= deadline:
+                raise TimeoutError(f"Transaction {tx_hash} did not complete within {timeout_secs}s")
 
-                await self._async_sleep(poll_interval_secs)
+            await self._async_sleep(_next_poll_delay(response, interval, deadline - now))
+            interval = min(interval * _POLL_BACKOFF_FACTOR, poll_interval_secs)
 
     async def _async_sleep(self, seconds: float) -> None:
-        import asyncio
-
         await asyncio.sleep(seconds)
 
     def _build_node_headers(self) -> dict[str, str]:
@@ -353,41 +636,34 @@ class BaseSDK:
             headers["x-api-key"] = self._node_api_key
         return headers
 
-    def _serialize_for_simulation(self, transaction: SimpleTransaction) -> bytes:
-        zero_signature = Ed25519Signature(b"\x00" * 64)
-        sender_public_key = cast("Ed25519PublicKey", self._account.public_key())
-        sender_auth = AccountAuthenticator(Ed25519Authenticator(sender_public_key, zero_signature))
-
-        raw_txn = transaction.raw_transaction
+    def _serialize_raw_txn(self, transaction: SimpleTransaction) -> bytes:
+        serializer = Serializer()
+        transaction.raw_transaction.serialize(serializer)
+        return serializer.output()
 
-        if transaction.fee_payer_address is not None:
-            fee_payer_auth = AccountAuthenticator(
-                Ed25519Authenticator(sender_public_key, zero_signature)
-            )
-            fee_payer_authenticator = FeePayerAuthenticator(
-                sender=sender_auth,
-                secondary_signers=[],
-                fee_payer=(transaction.fee_payer_address, fee_payer_auth),
+    def _serialize_for_simulation(self, transaction: SimpleTransaction) -> bytes:
+        raw_txn_bytes = self._serialize_raw_txn(transaction)
+
+        fee_payer = transaction.fee_payer_address
+        if fee_payer is None:
+            return raw_txn_bytes + self._zero_auth_bytes
+        return b"".join(
+            (
+                raw_txn_bytes,
+                self._zero_auth_fee_payer_prefix,
+                fee_payer.address,
+                self._zero_auth_fee_payer_suffix,
             )
-            authenticator = Authenticator(fee_payer_authenticator)
-        else:
-            authenticator = Authenticator(Ed25519Authenticator(sender_public_key, zero_signature))
-
-        signed_txn = SignedTransaction(raw_txn, authenticator)
-        return signed_txn.bytes()
+        )
 
     def _serialize_signed_transaction(
         self,
-        transaction: SimpleTransaction,
+        raw_txn_bytes: bytes,
         sender_authenticator: AccountAuthenticator,
     ) -> bytes:
         serializer = Serializer()
-
-        transaction.raw_transaction.serialize(serializer)
-
         sender_authenticator.serialize(serializer)
-
-        return serializer.output()
+        return raw_txn_bytes + serializer.output()
 
     def get_primary_subaccount_address(self, addr: AccountAddress | str) -> str:
         return get_primary_subaccount_addr(
@@ -408,14 +684,44 @@ class BaseSDKSync:
         self._account = account
         self._chain_id = config.chain_id
         self._abi_registry = AbiRegistry(chain_id=config.chain_id)
+        self._abi_cache: dict[str, MoveFunction | None] = {}
 
         opts = opts or BaseSDKOptionsSync()
         self._skip_simulate = opts.skip_simulate
         self._no_fee_payer = opts.no_fee_payer
+        # Options are fixed for the SDK's lifetime, so the submit route is resolved once
+        self._submit = self._submit_direct if self._no_fee_payer else self._submit_fee_paid
         self._node_api_key = opts.node_api_key
+        # Built once and shared by every request; httpx copies them, so they are never mutated
+        self._node_headers = self._build_node_headers()
+        self._bcs_headers = {**self._node_headers, "Content-Type": _BCS_CONTENT_TYPE}
+        fullnode_url = config.fullnode_url
+        self._estimate_gas_url = f"{fullnode_url}/estimate_gas_price"
+        self._simulate_url = f"{fullnode_url}/transactions/simulate"
+        self._submit_url = f"{fullnode_url}/transactions"
+        self._tx_by_hash_url = f"{fullnode_url}/transactions/by_hash/"
+        # Simulation only needs the sender's public key next to an all-zero signature, so the
+        # authenticator bytes are serialized once; only the fee payer address varies
+        (
+            self._zero_auth_bytes,
+            self._zero_auth_fee_payer_prefix,
+            self._zero_auth_fee_payer_suffix,
+        ) = _zero_signature_authenticator_bytes(account)
         self._gas_price_manager = opts.gas_price_manager
         self._time_delta_ms = opts.time_delta_ms
-        self._http_client = opts.http_client
+        self._simulation_cache_ttl_secs = opts.simulation_cache_ttl_secs
+        # Simulation cache key -> (simulated at, max gas amount, gas unit price)
+        self._simulation_cache: dict[str, tuple[float, int, int]] = {}
+        # Build, simulate, submit and poll all hit the same node, so they share one pooled client
+        # and its keep-alive connections. A caller-supplied client is used as-is and left open.
+        http_client = opts.http_client
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            try:
+                http_client = httpx.Client(http2=opts.http2)
+            except ImportError as e:
+                raise _http2_unavailable() from e
+        self._http_client = http_client
 
         if config.chain_id is None:
             logger.warning(
@@ -423,6 +729,21 @@ class BaseSDKSync:
                 "this might cause issues with the transaction builder"
             )
 
+    def close(self) -> None:
+        if self._owns_http_client:
+            self._http_client.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        self.close()
+
     @property
     def config(self) -> DecibelConfig:
         return self._config
@@ -448,7 +769,20 @@ class BaseSDKSync:
         self._time_delta_ms = value
 
     def _get_abi(self, function_id: str) -> MoveFunction | None:
-        return self._abi_registry.get_function(function_id)
+        # build_tx runs twice per simulated send, so resolved ABIs (and misses) are memoized
+        try:
+            return self._abi_cache[function_id]
+        except KeyError:
+            function_abi = self._abi_registry.get_function(function_id)
+            self._abi_cache[function_id] = function_abi
+            return function_abi
+
+    def _draft_gas_unit_price(self) -> int:
+        if self._gas_price_manager is not None:
+            cached_price = self._gas_price_manager.get_gas_price()
+            if cached_price is not None:
+                return cached_price
+        return DEFAULT_GAS_ESTIMATE
 
     def build_tx(
         self,
@@ -475,7 +809,7 @@ class BaseSDKSync:
                 if cached_price is not None:
                     gas_unit_price = cached_price
                 else:
-                    gas_unit_price = self._gas_price_manager.fetch_and_set_gas_price()
+                    gas_unit_price = self._gas_price_manager.request_refresh()
             else:
                 gas_unit_price = self._fetch_gas_price_estimation()
 
@@ -495,13 +829,21 @@ class BaseSDKSync:
         self,
         transaction: SimpleTransaction,
         sender_authenticator: AccountAuthenticator,
+        raw_txn_bytes: bytes | None = None,
+    ) -> PendingTransactionResponse:
+        return self._submit(transaction, sender_authenticator, raw_txn_bytes)
+
+    def _submit_fee_paid(
+        self,
+        transaction: SimpleTransaction,
+        sender_authenticator: AccountAuthenticator,
+        raw_txn_bytes: bytes | None = None,
     ) -> PendingTransactionResponse:
-        if self._no_fee_payer:
-            return self._submit_direct(transaction, sender_authenticator)
         return submit_fee_paid_transaction_sync(
             self._config,
             transaction,
             sender_authenticator,
+            client=self._http_client,
         )
 
     def _send_tx(
@@ -512,26 +854,10 @@ class BaseSDKSync:
         signer = account_override if account_override is not None else self._account
         sender = signer.address()
 
-        transaction = self.build_tx(payload, sender)
-
-        if not self._skip_simulate:
-            sim_result = self._simulate_transaction(transaction)
-
-            max_gas_amount_str = sim_result.get("max_gas_amount")
-            gas_unit_price_str = sim_result.get("gas_unit_price")
-
-            if max_gas_amount_str is None or gas_unit_price_str is None:
-                raise ValueError("Transaction simulation returned no results")
-
-            simulated_max_gas = int(max_gas_amount_str)
-            simulated_gas_price = int(gas_unit_price_str)
-
-            max_gas_amount = min(
-                max(simulated_max_gas * 2, DEFAULT_MAX_GAS_AMOUNT),
-                MAX_GAS_UNITS_LIMIT,
-            )
-            gas_unit_price = max(simulated_gas_price, 1)
-
+        if self._skip_simulate:
+            transaction = self.build_tx(payload, sender)
+        else:
+            max_gas_amount, gas_unit_price = self._simulate_gas(payload, sender)
             transaction = self.build_tx(
                 payload,
                 sender,
@@ -539,142 +865,158 @@ class BaseSDKSync:
                 gas_unit_price=gas_unit_price,
             )
 
-        sender_authenticator = self._sign_transaction(signer, transaction)
+        raw_txn_bytes = self._serialize_raw_txn(transaction)
+        sender_authenticator = self._sign_transaction(signer, transaction, raw_txn_bytes)
 
-        pending_tx = self.submit_tx(transaction, sender_authenticator)
+        try:
+            pending_tx = self._submit(transaction, sender_authenticator, raw_txn_bytes)
+            return self._wait_for_transaction(pending_tx.hash)
+        except Exception:
+            # Gas values reused from an earlier simulation may be why this failed
+            self._simulation_cache.pop(_simulation_cache_key(payload, sender), None)
+            raise
+
+    def _simulate_gas(
+        self,
+        payload: InputEntryFunctionData,
+        sender: AccountAddress,
+    ) -> tuple[int, int]:
+        cache_ttl = self._simulation_cache_ttl_secs
+        cache_key = _simulation_cache_key(payload, sender) if cache_ttl > 0 else None
+        if cache_key is not None:
+            cached = _cached_simulation(self._simulation_cache, cache_key, cache_ttl)
+            if cached is not None:
+                return cached
+
+        # The node estimates the gas price while simulating and the transaction is rebuilt
+        # with that estimate, so the draft does not need a fresh quote of its own.
+        draft = self.build_tx(payload, sender, gas_unit_price=self._draft_gas_unit_price())
+        sim_result = self._simulate_transaction(draft)
+
+        max_gas_amount_str = sim_result.get("max_gas_amount")
+        gas_unit_price_str = sim_result.get("gas_unit_price")
+
+        if max_gas_amount_str is None or gas_unit_price_str is None:
+            raise ValueError("Transaction simulation returned no results")
+
+        simulated_max_gas = int(max_gas_amount_str)
+        simulated_gas_price = int(gas_unit_price_str)
+
+        max_gas_amount = min(
+            max(simulated_max_gas * 2, DEFAULT_MAX_GAS_AMOUNT),
+            MAX_GAS_UNITS_LIMIT,
+        )
+        gas_unit_price = max(simulated_gas_price, 1)
 
-        return self._wait_for_transaction(pending_tx.hash)
+        if cache_key is not None:
+            _remember_simulation(self._simulation_cache, cache_key, max_gas_amount, gas_unit_price)
+        return max_gas_amount, gas_unit_price
 
     def _sign_transaction(
         self,
         signer: Account,
         transaction: SimpleTransaction,
+        raw_txn_bytes: bytes | None = None,
     ) -> AccountAuthenticator:
-        raw_txn = transaction.raw_transaction
-
-        if transaction.fee_payer_address is not None:
-            fee_payer_txn = FeePayerRawTransaction(
-                raw_transaction=raw_txn,
-                secondary_signers=[],
-                fee_payer=transaction.fee_payer_address,
-            )
-            return fee_payer_txn.sign(signer.private_key)
-        else:
-            return raw_txn.sign(signer.private_key)
+        if raw_txn_bytes is None:
+            raw_txn_bytes = self._serialize_raw_txn(transaction)
+        return _sign_raw_txn_bytes(signer, raw_txn_bytes, transaction.fee_payer_address)
 
     def _fetch_gas_price_estimation(self) -> int:
-        url = f"{self._config.fullnode_url}/estimate_gas_price"
-        headers = self._build_node_headers()
-
-        def make_request(client: httpx.Client) -> int:
-            response = client.get(url, headers=headers)
-            if not response.is_success:
-                raise ValueError(
-                    f"Failed to fetch gas price: {response.status_code} - {response.text}"
-                )
-            data = cast("dict[str, Any]", response.json())
-            return int(data.get("gas_estimate", DEFAULT_GAS_ESTIMATE))
-
-        if self._http_client is not None:
-            return make_request(self._http_client)
-        with httpx.Client() as client:
-            return make_request(client)
+        url = self._estimate_gas_url
+        headers = self._node_headers
+
+        response = self._http_client.get(url, headers=headers)
+
+        if not response.is_success:
+            raise ValueError(f"Failed to fetch gas price: {response.status_code} - {response.text}")
+
+        data = cast("dict[str, Any]", from_json(response.content))
+        return int(data.get("gas_estimate", DEFAULT_GAS_ESTIMATE))
 
     def _simulate_transaction(
         self,
         transaction: SimpleTransaction,
     ) -> dict[str, Any]:
-        url = f"{self._config.fullnode_url}/transactions/simulate"
-        headers = self._build_node_headers()
-        headers["Content-Type"] = "application/x.aptos.signed_transaction+bcs"
+        url = self._simulate_url
+        headers = self._bcs_headers
         bcs_bytes = self._serialize_for_simulation(transaction)
 
-        def make_request(client: httpx.Client) -> dict[str, Any]:
-            response = client.post(
-                url,
-                content=bcs_bytes,
-                headers=headers,
-                params={"estimate_max_gas_amount": "true", "estimate_gas_unit_price": "true"},
+        response = self._http_client.post(
+            url,
+            content=bcs_bytes,
+            headers=headers,
+            params={"estimate_max_gas_amount": "true", "estimate_gas_unit_price": "true"},
+        )
+
+        if not response.is_success:
+            raise ValueError(
+                f"Transaction simulation failed: {response.status_code} - {response.text}"
             )
-            if not response.is_success:
-                raise ValueError(
-                    f"Transaction simulation failed: {response.status_code} - {response.text}"
-                )
-            data: list[dict[str, Any]] | dict[str, Any] = response.json()
-            if isinstance(data, list) and len(data) > 0:
-                return data[0]
-            raise ValueError("Transaction simulation returned empty results")
-
-        if self._http_client is not None:
-            return make_request(self._http_client)
-        with httpx.Client() as client:
-            return make_request(client)
+
+        data: list[dict[str, Any]] | dict[str, Any] = from_json(response.content)
+
+        if isinstance(data, list) and len(data) > 0:
+            return data[0]
+
+        raise ValueError("Transaction simulation returned empty results")
 
     def _submit_direct(
         self,
         transaction: SimpleTransaction,
         sender_authenticator: AccountAuthenticator,
+        raw_txn_bytes: bytes | None = None,
     ) -> PendingTransactionResponse:
-        url = f"{self._config.fullnode_url}/transactions"
-        headers = self._build_node_headers()
-        headers["Content-Type"] = "application/x.aptos.signed_transaction+bcs"
-        bcs_bytes = self._serialize_signed_transaction(transaction, sender_authenticator)
-
-        def make_request(client: httpx.Client) -> PendingTransactionResponse:
-            response = client.post(url, content=bcs_bytes, headers=headers)
-            if not response.is_success:
-                raise ValueError(
-                    f"Transaction submission failed: {response.status_code} - {response.text}"
-                )
-            data = cast("dict[str, Any]", response.json())
-            raw_txn = transaction.raw_transaction
-            return PendingTransactionResponse(
-                hash=str(data.get("hash", "")),
-                sender=str(raw_txn.sender),
-                sequence_number=str(raw_txn.sequence_number),
-                max_gas_amount=str(raw_txn.max_gas_amount),
-                gas_unit_price=str(raw_txn.gas_unit_price),
-                expiration_timestamp_secs=str(raw_txn.expiration_timestamps_secs),
+        url = self._submit_url
+        headers = self._bcs_headers
+        if raw_txn_bytes is None:
+            raw_txn_bytes = self._serialize_raw_txn(transaction)
+        bcs_bytes = self._serialize_signed_transaction(raw_txn_bytes, sender_authenticator)
+
+        response = self._http_client.post(url, content=bcs_bytes, headers=headers)
+
+        if not response.is_success:
+            raise ValueError(
+                f"Transaction submission failed: {response.status_code} - {response.text}"
             )
 
-        if self._http_client is not None:
-            return make_request(self._http_client)
-        with httpx.Client() as client:
-            return make_request(client)
+        data = cast("dict[str, Any]", from_json(response.content))
+        return pending_response_for(str(data.get("hash") or ""), transaction.raw_transaction)
 
     def _wait_for_transaction(
         self,
         tx_hash: str,
         timeout_secs: float = 30.0,
         poll_interval_secs: float = 1.0,
+        min_poll_interval_secs: float = 0.05,
     ) -> dict[str, Any]:
-        url = f"{self._config.fullnode_url}/transactions/by_hash/{tx_hash}"
-        headers = self._build_node_headers()
-        start_time = time.time()
-
-        def poll_loop(client: httpx.Client) -> dict[str, Any]:
-            while True:
-                response = client.get(url, headers=headers)
-                if response.is_success:
-                    data = cast("dict[str, Any]", response.json())
-                    tx_type = data.get("type")
-                    if tx_type == "pending_transaction":
-                        pass
-                    elif data.get("success") is True:
+        url = self._tx_by_hash_url + tx_hash
+        headers = self._node_headers
+        deadline = time.monotonic() + timeout_secs
+        # Most transactions land well under a second, so start polling fast and back off
+        # towards poll_interval_secs for slow ones
+        interval = min_poll_interval_secs
+
+        while True:
+            response = self._http_client.get(url, headers=headers)
+
+            if response.is_success:
+                data = cast("dict[str, Any]", from_json(response.content))
+                # Pending is the common answer while waiting; only committed ones carry success
+                if data.get("type") != "pending_transaction":
+                    success = data.get("success")
+                    if success is True:
                         return data
-                    elif data.get("success") is False:
+                    if success is False:
                         vm_status = data.get("vm_status", "Unknown error")
                         raise ValueError(f"Transaction failed: {vm_status}")
-                if time.time() - start_time > timeout_secs:
-                    raise TimeoutError(
-                        f"Transaction {tx_hash} did not complete within {timeout_secs}s"
-                    )
-                time.sleep(poll_interval_secs)
 
-        if self._http_client is not None:
-            return poll_loop(self._http_client)
-        with httpx.Client() as client:
-            return poll_loop(client)
+            now = time.monotonic()
+            if now >= deadline:
+                raise TimeoutError(f"Transaction {tx_hash} did not complete within {timeout_secs}s")
+
+            time.sleep(_next_poll_delay(response, interval, deadline - now))
+            interval = min(interval * _POLL_BACKOFF_FACTOR, poll_interval_secs)
 
     def _build_node_headers(self) -> dict[str, str]:
         headers: dict[str, str] = {}
@@ -682,41 +1024,34 @@ class BaseSDKSync:
             headers["x-api-key"] = self._node_api_key
         return headers
 
-    def _serialize_for_simulation(self, transaction: SimpleTransaction) -> bytes:
-        zero_signature = Ed25519Signature(b"\x00" * 64)
-        sender_public_key = cast("Ed25519PublicKey", self._account.public_key())
-        sender_auth = AccountAuthenticator(Ed25519Authenticator(sender_public_key, zero_signature))
-
-        raw_txn = transaction.raw_transaction
+    def _serialize_raw_txn(self, transaction: SimpleTransaction) -> bytes:
+        serializer = Serializer()
+        transaction.raw_transaction.serialize(serializer)
+        return serializer.output()
 
-        if transaction.fee_payer_address is not None:
-            fee_payer_auth = AccountAuthenticator(
-                Ed25519Authenticator(sender_public_key, zero_signature)
-            )
-            fee_payer_authenticator = FeePayerAuthenticator(
-                sender=sender_auth,
-                secondary_signers=[],
-                fee_payer=(transaction.fee_payer_address, fee_payer_auth),
+    def _serialize_for_simulation(self, transaction: SimpleTransaction) -> bytes:
+        raw_txn_bytes = self._serialize_raw_txn(transaction)
+
+        fee_payer = transaction.fee_payer_address
+        if fee_payer is None:
+            return raw_txn_bytes + self._zero_auth_bytes
+        return b"".join(
+            (
+                raw_txn_bytes,
+                self._zero_auth_fee_payer_prefix,
+                fee_payer.address,
+                self._zero_auth_fee_payer_suffix,
             )
-            authenticator = Authenticator(fee_payer_authenticator)
-        else:
-            authenticator = Authenticator(Ed25519Authenticator(sender_public_key, zero_signature))
-
-        signed_txn = SignedTransaction(raw_txn, authenticator)
-        return signed_txn.bytes()
+        )
 
     def _serialize_signed_transaction(
         self,
-        transaction: SimpleTransaction,
+        raw_txn_bytes: bytes,
         sender_authenticator: AccountAuthenticator,
     ) -> bytes:
         serializer = Serializer()
-
-        transaction.raw_transaction.serialize(serializer)
-
         sender_authenticator.serialize(serializer)
-
-        return serializer.output()
+        return raw_txn_bytes + serializer.output()
 
     def get_primary_subaccount_address(self, addr: AccountAddress | str) -> str:
         return get_primary_subaccount_addr(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from enum import Enum
 
@@ -72,12 +73,18 @@ def get_perp_engine_global_address(package: str) -> str:
     return str(AccountAddress.for_named_object(creator, b"GlobalPerpEngine"))
 
 
-def _create_deployment(package: str) -> Deployment:
+# NETNA, LOCAL and DOCKER share a package, so their deployments are derived once
+@functools.cache
+def _create_deployment(package: str, usdc: str | None = None) -> Deployment:
+    # Parse the package address once for all derived addresses; a deployment whose USDC is not
+    # the package's named object (mainnet) passes it in, skipping that derivation
+    creator = AccountAddress.from_str(package)
+    named = AccountAddress.for_named_object
     return Deployment(
         package=package,
-        usdc=get_usdc_address(package),
-        testc=get_testc_address(package),
-        perp_engine_global=get_perp_engine_global_address(package),
+        usdc=usdc if usdc is not None else str(named(creator, b"USDC")),
+        testc=str(named(creator, b"TESTC")),
+        perp_engine_global=str(named(creator, b"GlobalPerpEngine")),
     )
 
 
@@ -88,12 +95,7 @@ _TESTNET_PACKAGE = "0x952535c3049e52f195f26798c2f1340d7dd5100edbe0f464e520a974d1
 _LOCAL_PACKAGE = "0xb8a5788314451ce4d2fbbad32e1bad88d4184b73943b7fe5166eab93cf1a5a95"
 _DOCKER_PACKAGE = "0xb8a5788314451ce4d2fbbad32e1bad88d4184b73943b7fe5166eab93cf1a5a95"
 
-MAINNET_DEPLOYMENT = Deployment(
-    package=_MAINNET_PACKAGE,
-    usdc=_MAINNET_USDC,
-    testc=get_testc_address(_MAINNET_PACKAGE),
-    perp_engine_global=get_perp_engine_global_address(_MAINNET_PACKAGE),
-)
+MAINNET_DEPLOYMENT = _create_deployment(_MAINNET_PACKAGE, usdc=_MAINNET_USDC)
 
 MAINNET_CONFIG = DecibelConfig(
     network=Network.MAINNET,
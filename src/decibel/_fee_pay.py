@@ -2,12 +2,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, cast
 
-import httpx
 from aptos_sdk.bcs import Serializer
 from pydantic import BaseModel
+from pydantic_core import from_json
+
+from ._constants import Network
+from ._http import get_shared_async_client, get_shared_sync_client
 
 if TYPE_CHECKING:
+    import httpx
     from aptos_sdk.authenticator import AccountAuthenticator
+    from aptos_sdk.transactions import RawTransaction
 
     from ._constants import DecibelConfig
     from ._transaction_builder import SimpleTransaction
@@ -19,6 +24,15 @@ __all__ = [
 ]
 
 
+_sign_and_submit_endpoints: dict[int, tuple[DecibelConfig, str, dict[str, str]]] = {}
+
+_LEGACY_FEE_PAYER_HEADERS = {"Content-Type": "application/json"}
+
+# The fee payer endpoints take BCS bytes as JSON arrays of numbers; building the array text
+# from a lookup table skips the per-byte list and json.dumps work
+_BYTE_TEXT = tuple(str(i) for i in range(256))
+
+
 class PendingTransactionResponse(BaseModel):
     hash: str
     sender: str
@@ -35,23 +49,11 @@ async def submit_fee_paid_transaction(
     *,
     client: httpx.AsyncClient | None = None,
 ) -> PendingTransactionResponse:
-    if config.gas_station_api_key:
-        return await _submit_via_gas_station_api(
-            config,
-            transaction,
-            sender_authenticator,
-            client=client,
-        )
-
-    if config.gas_station_url:
-        return await _submit_via_legacy_fee_payer(
-            config,
-            transaction,
-            sender_authenticator,
-            client=client,
-        )
-
-    raise ValueError("Either gas_station_api_key or gas_station_url must be provided")
+    url, body, headers = _build_submit_request(config, transaction, sender_authenticator)
+    if client is None:
+        client = get_shared_async_client()
+    response = await client.post(url, content=body, headers=headers)
+    return _parse_submit_response(config, transaction, response)
 
 
 def submit_fee_paid_transaction_sync(
@@ -61,174 +63,81 @@ def submit_fee_paid_transaction_sync(
     *,
     client: httpx.Client | None = None,
 ) -> PendingTransactionResponse:
+    url, body, headers = _build_submit_request(config, transaction, sender_authenticator)
+    if client is None:
+        client = get_shared_sync_client()
+    response = client.post(url, content=body, headers=headers)
+    return _parse_submit_response(config, transaction, response)
+
+
+def _build_submit_request(
+    config: DecibelConfig,
+    transaction: SimpleTransaction,
+    sender_authenticator: AccountAuthenticator,
+) -> tuple[str, str, dict[str, str]]:
+    # Shared by the sync and async entry points, which only differ in how they post
     if config.gas_station_api_key:
-        return _submit_via_gas_station_api_sync(
-            config,
-            transaction,
-            sender_authenticator,
-            client=client,
-        )
+        return _build_gas_station_request(config, transaction, sender_authenticator)
 
     if config.gas_station_url:
-        return _submit_via_legacy_fee_payer_sync(
-            config,
-            transaction,
-            sender_authenticator,
-            client=client,
-        )
+        return _build_legacy_request(config, transaction, sender_authenticator)
 
     raise ValueError("Either gas_station_api_key or gas_station_url must be provided")
 
 
-async def _submit_via_gas_station_api(
+def _build_gas_station_request(
     config: DecibelConfig,
     transaction: SimpleTransaction,
     sender_authenticator: AccountAuthenticator,
-    *,
-    client: httpx.AsyncClient | None = None,
-) -> PendingTransactionResponse:
-    base_url = _get_default_gas_station_url(config)
-    url = f"{base_url}/api/transaction/signAndSubmit"
-
-    raw_txn = transaction.raw_transaction
-
-    txn_serializer = Serializer()
-    raw_txn.serialize(txn_serializer)
-    if transaction.fee_payer_address is None:
-        txn_serializer.bool(False)
-    else:
-        txn_serializer.bool(True)
-        transaction.fee_payer_address.serialize(txn_serializer)
-    transaction_bytes = list(txn_serializer.output())
-
-    auth_serializer = Serializer()
-    sender_authenticator.serialize(auth_serializer)
-    authenticator_bytes = list(auth_serializer.output())
-
-    body = {
-        "transactionBytes": transaction_bytes,
-        "senderAuth": authenticator_bytes,
-    }
-
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {config.gas_station_api_key}",
-    }
-
-    if client is not None:
-        response = await client.post(url, json=body, headers=headers)
-    else:
-        async with httpx.AsyncClient() as temp_client:
-            response = await temp_client.post(url, json=body, headers=headers)
+) -> tuple[str, str, dict[str, str]]:
+    url, headers = _get_sign_and_submit_endpoint(config)
 
-    if not response.is_success:
-        raise ValueError(f"Gas station API error: {response.status_code} - {response.text}")
-
-    data = response.json()
-    transaction_hash = data.get("transactionHash", data.get("hash", ""))
-
-    return PendingTransactionResponse(
-        hash=transaction_hash,
-        sender=str(raw_txn.sender),
-        sequence_number=str(raw_txn.sequence_number),
-        max_gas_amount=str(raw_txn.max_gas_amount),
-        gas_unit_price=str(raw_txn.gas_unit_price),
-        expiration_timestamp_secs=str(raw_txn.expiration_timestamps_secs),
+    transaction_bytes, authenticator_bytes = _serialize_submit_payload(
+        transaction, sender_authenticator, with_fee_payer=True
+    )
+    body = (
+        f'{{"transactionBytes":{_json_byte_array(transaction_bytes)},'
+        f'"senderAuth":{_json_byte_array(authenticator_bytes)}}}'
     )
+    return url, body, headers
 
 
-def _submit_via_gas_station_api_sync(
+def _build_legacy_request(
     config: DecibelConfig,
     transaction: SimpleTransaction,
     sender_authenticator: AccountAuthenticator,
-    *,
-    client: httpx.Client | None = None,
-) -> PendingTransactionResponse:
-    base_url = _get_default_gas_station_url(config)
-    url = f"{base_url}/api/transaction/signAndSubmit"
-
-    raw_txn = transaction.raw_transaction
-
-    txn_serializer = Serializer()
-    raw_txn.serialize(txn_serializer)
-    if transaction.fee_payer_address is None:
-        txn_serializer.bool(False)
-    else:
-        txn_serializer.bool(True)
-        transaction.fee_payer_address.serialize(txn_serializer)
-    transaction_bytes = list(txn_serializer.output())
-
-    auth_serializer = Serializer()
-    sender_authenticator.serialize(auth_serializer)
-    authenticator_bytes = list(auth_serializer.output())
-
-    body = {
-        "transactionBytes": transaction_bytes,
-        "senderAuth": authenticator_bytes,
-    }
-
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {config.gas_station_api_key}",
-    }
-
-    if client is not None:
-        response = client.post(url, json=body, headers=headers)
-    else:
-        with httpx.Client() as temp_client:
-            response = temp_client.post(url, json=body, headers=headers)
-
-    if not response.is_success:
-        raise ValueError(f"Gas station API error: {response.status_code} - {response.text}")
-
-    data = response.json()
-    transaction_hash = data.get("transactionHash", data.get("hash", ""))
+) -> tuple[str, str, dict[str, str]]:
+    url = f"{config.gas_station_url}/transactions"
 
-    return PendingTransactionResponse(
-        hash=transaction_hash,
-        sender=str(raw_txn.sender),
-        sequence_number=str(raw_txn.sequence_number),
-        max_gas_amount=str(raw_txn.max_gas_amount),
-        gas_unit_price=str(raw_txn.gas_unit_price),
-        expiration_timestamp_secs=str(raw_txn.expiration_timestamps_secs),
+    transaction_bytes, signature_bytes = _serialize_submit_payload(
+        transaction, sender_authenticator, with_fee_payer=False
+    )
+    body = (
+        f'{{"signature":{_json_byte_array(signature_bytes)},'
+        f'"transaction":{_json_byte_array(transaction_bytes)}}}'
     )
+    return url, body, _LEGACY_FEE_PAYER_HEADERS
 
 
-async def _submit_via_legacy_fee_payer(
+def _parse_submit_response(
     config: DecibelConfig,
     transaction: SimpleTransaction,
-    sender_authenticator: AccountAuthenticator,
-    *,
-    client: httpx.AsyncClient | None = None,
+    response: httpx.Response,
 ) -> PendingTransactionResponse:
-    url = f"{config.gas_station_url}/transactions"
-
-    auth_serializer = Serializer()
-    sender_authenticator.serialize(auth_serializer)
-    signature_bytes = list(auth_serializer.output())
-
-    txn_serializer = Serializer()
-    transaction.raw_transaction.serialize(txn_serializer)
-    transaction_bytes = list(txn_serializer.output())
-
-    body = {
-        "signature": signature_bytes,
-        "transaction": transaction_bytes,
-    }
+    if config.gas_station_api_key:
+        if not response.is_success:
+            raise ValueError(f"Gas station API error: {response.status_code} - {response.text}")
 
-    headers = {"Content-Type": "application/json"}
+        data = from_json(response.content)
+        transaction_hash = data.get("transactionHash", data.get("hash", ""))
 
-    if client is not None:
-        response = await client.post(url, json=body, headers=headers)
-    else:
-        async with httpx.AsyncClient() as temp_client:
-            response = await temp_client.post(url, json=body, headers=headers)
+        return pending_response_for(str(transaction_hash), transaction.raw_transaction)
 
     # TODO: Improve error handling
     if not response.is_success:
         raise ValueError(f"Fee payer error: {response.status_code} - {response.text}")
 
-    data = cast("dict[str, Any]", response.json())
+    data = cast("dict[str, Any]", from_json(response.content))
     return PendingTransactionResponse(
         hash=str(data.get("hash", "")),
         sender=str(data.get("sender", "")),
@@ -239,54 +148,61 @@ async def _submit_via_legacy_fee_payer(
     )
 
 
-def _submit_via_legacy_fee_payer_sync(
-    config: DecibelConfig,
+def pending_response_for(tx_hash: str, raw_txn: RawTransaction) -> PendingTransactionResponse:
+    # Shared by the fee payer and direct submit paths. Only the hash comes from the server; the
+    # other fields mirror the submitted transaction and are already strings, so validation is
+    # skipped
+    return PendingTransactionResponse.model_construct(
+        hash=tx_hash,
+        sender=str(raw_txn.sender),
+        sequence_number=str(raw_txn.sequence_number),
+        max_gas_amount=str(raw_txn.max_gas_amount),
+        gas_unit_price=str(raw_txn.gas_unit_price),
+        expiration_timestamp_secs=str(raw_txn.expiration_timestamps_secs),
+    )
+
+
+def _serialize_submit_payload(
     transaction: SimpleTransaction,
     sender_authenticator: AccountAuthenticator,
     *,
-    client: httpx.Client | None = None,
-) -> PendingTransactionResponse:
-    url = f"{config.gas_station_url}/transactions"
-
-    auth_serializer = Serializer()
-    sender_authenticator.serialize(auth_serializer)
-    signature_bytes = list(auth_serializer.output())
-
-    txn_serializer = Serializer()
-    transaction.raw_transaction.serialize(txn_serializer)
-    transaction_bytes = list(txn_serializer.output())
-
-    body = {
-        "signature": signature_bytes,
-        "transaction": transaction_bytes,
+    with_fee_payer: bool,
+) -> tuple[bytes, bytes]:
+    # One serializer for both parts: the authenticator bytes are whatever follows the transaction
+    serializer = Serializer()
+    transaction.raw_transaction.serialize(serializer)
+    if with_fee_payer:
+        # The gas station API takes the fee payer as a BCS Option after the raw transaction
+        if transaction.fee_payer_address is None:
+            serializer.bool(False)
+        else:
+            serializer.bool(True)
+            transaction.fee_payer_address.serialize(serializer)
+    transaction_bytes = serializer.output()
+    sender_authenticator.serialize(serializer)
+    return transaction_bytes, serializer.output()[len(transaction_bytes) :]
+
+
+def _json_byte_array(data: bytes) -> str:
+    return "[" + ",".join([_BYTE_TEXT[b] for b in data]) + "]"
+
+
+def _get_sign_and_submit_endpoint(config: DecibelConfig) -> tuple[str, dict[str, str]]:
+    # Resolved once per config (the config is frozen, so neither the URL nor the API key can
+    # change); holding the config in the entry keeps its id from being reused
+    cached = _sign_and_submit_endpoints.get(id(config))
+    if cached is not None and cached[0] is config:
+        return cached[1], cached[2]
+    url = f"{_get_default_gas_station_url(config)}/api/transaction/signAndSubmit"
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {config.gas_station_api_key}",
     }
-
-    headers = {"Content-Type": "application/json"}
-
-    if client is not None:
-        response = client.post(url, json=body, headers=headers)
-    else:
-        with httpx.Client() as temp_client:
-            response = temp_client.post(url, json=body, headers=headers)
-
-    # TODO: Improve error handling
-    if not response.is_success:
-        raise ValueError(f"Fee payer error: {response.status_code} - {response.text}")
-
-    data = cast("dict[str, Any]", response.json())
-    return PendingTransactionResponse(
-        hash=str(data.get("hash", "")),
-        sender=str(data.get("sender", "")),
-        sequence_number=str(data.get("sequence_number", "")),
-        max_gas_amount=str(data.get("max_gas_amount", "")),
-        gas_unit_price=str(data.get("gas_unit_price", "")),
-        expiration_timestamp_secs=str(data.get("expiration_timestamp_secs", "")),
-    )
+    _sign_and_submit_endpoints[id(config)] = (config, url, headers)
+    return url, headers
 
 
 def _get_default_gas_station_url(config: DecibelConfig) -> str:
-    from ._constants import Network
-
     if config.network == Network.TESTNET:
         return "https://api.testnet.aptoslabs.com/gs/v1"
 
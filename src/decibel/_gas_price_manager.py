@@ -2,15 +2,25 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
+import itertools
 import logging
 import threading
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from weakref import WeakMethod
 
-import httpx
+from pydantic_core import from_json
+
+from ._http import get_shared_async_client, get_shared_sync_client
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import httpx
+
     from ._constants import DecibelConfig
 
 __all__ = [
@@ -23,19 +33,26 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GasPriceInfo:
     gas_estimate: int
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class GasPriceManagerOptions:
     node_api_key: str | None = None
     multiplier: float = 2.0
     refresh_interval_seconds: float = 60.0
 
 
+def _retrieve_exception(task: asyncio.Task[int]) -> None:
+    # fetch_and_set_gas_price already logs failures; this only marks them as retrieved in case
+    # every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
 def _build_auth_headers(api_key: str | None) -> dict[str, str]:
     if not api_key:
         return {}
@@ -47,12 +64,23 @@ class GasPriceManager:
         self,
         config: DecibelConfig,
         opts: GasPriceManagerOptions | None = None,
+        *,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self._config = config
+        # A caller-supplied client (e.g. the one the SDK uses for the same node) is used as-is
+        # and left open; otherwise estimates go through the shared pooled client
+        self._client = client
         self._opts = opts or GasPriceManagerOptions()
+        # node_api_key is fixed for the manager's lifetime; httpx copies headers per request
+        self._auth_headers = _build_auth_headers(self._opts.node_api_key)
+        self._estimate_url = f"{config.fullnode_url}/estimate_gas_price"
         self._gas_price: GasPriceInfo | None = None
         self._refresh_task: asyncio.Task[None] | None = None
         self._pending_refresh_task: asyncio.Task[None] | None = None
+        self._inflight_fetch: asyncio.Task[int] | None = None
+        # Set once the first estimate after start() has landed or failed
+        self._ready = asyncio.Event()
         self._is_initialized = False
         self._refresh_interval_seconds = self._opts.refresh_interval_seconds
         self._multiplier = self._opts.multiplier
@@ -68,15 +96,20 @@ class GasPriceManager:
         return self._is_initialized
 
     async def initialize(self) -> None:
-        if self._is_initialized:
+        self.start()
+        await self.wait_ready()
+
+    def start(self) -> None:
+        # Non-blocking initialize: the first estimate is fetched in the background so it
+        # overlaps the rest of the app's startup; await wait_ready() before relying on a price
+        if self._is_initialized or self._refresh_task is not None:
             return
+        self._ready.clear()
+        self._refresh_task = asyncio.create_task(self._initialize_and_refresh())
 
-        try:
-            await self.fetch_and_set_gas_price()
-            self._refresh_task = asyncio.create_task(self._refresh_loop())
-            self._is_initialized = True
-        except Exception as e:
-            logger.error("Failed to initialize gas price manager: %s", e)
+    async def wait_ready(self) -> bool:
+        await self._ready.wait()
+        return self._is_initialized
 
     async def destroy(self) -> None:
         if self._refresh_task is not None:
@@ -87,6 +120,7 @@ class GasPriceManager:
 
         self._is_initialized = False
         self._gas_price = None
+        self._ready.set()
 
     def get_gas_price(self) -> int | None:
         return self.gas_price
@@ -95,17 +129,25 @@ class GasPriceManager:
         if self._pending_refresh_task is None or self._pending_refresh_task.done():
             self._pending_refresh_task = asyncio.create_task(self._safe_fetch())
 
+    async def request_refresh(self) -> int:
+        # Concurrent callers share one in-flight estimate request instead of each sending their
+        # own; the fetch is shielded so a cancelled caller does not cancel it for the others
+        if self._inflight_fetch is None or self._inflight_fetch.done():
+            self._inflight_fetch = asyncio.create_task(self.fetch_and_set_gas_price())
+            self._inflight_fetch.add_done_callback(_retrieve_exception)
+        return await asyncio.shield(self._inflight_fetch)
+
     async def fetch_gas_price_estimation(self) -> int:
-        url = f"{self._config.fullnode_url}/estimate_gas_price"
-        headers = _build_auth_headers(self._opts.node_api_key)
+        url = self._estimate_url
+        headers = self._auth_headers
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
+        client = self._client if self._client is not None else get_shared_async_client()
+        response = await client.get(url, headers=headers)
 
         if not response.is_success:
             raise ValueError(f"Failed to fetch gas price: {response.status_code} - {response.text}")
 
-        data = response.json()
+        data = from_json(response.content)
         gas_estimate = data.get("gas_estimate", 0)
 
         return int(gas_estimate * self._multiplier)
@@ -127,17 +169,30 @@ class GasPriceManager:
             logger.error("Failed to fetch gas price: %s", e)
             raise
 
+    async def _initialize_and_refresh(self) -> None:
+        try:
+            await self.request_refresh()
+        except Exception as e:
+            logger.error("Failed to initialize gas price manager: %s", e)
+            self._refresh_task = None
+            self._ready.set()
+            return
+
+        self._is_initialized = True
+        self._ready.set()
+        await self._refresh_loop()
+
     async def _refresh_loop(self) -> None:
         while True:
             await asyncio.sleep(self._refresh_interval_seconds)
             try:
-                await self.fetch_and_set_gas_price()
+                await self.request_refresh()
             except Exception as e:
                 logger.warning("Failed to fetch gas price during refresh: %s", e)
 
     async def _safe_fetch(self) -> None:
         try:
-            await self.fetch_and_set_gas_price()
+            await self.request_refresh()
         except Exception as e:
             logger.warning("Failed to fetch gas price: %s", e)
 
@@ -159,12 +214,20 @@ class GasPriceManagerSync:
         self,
         config: DecibelConfig,
         opts: GasPriceManagerOptions | None = None,
+        *,
+        client: httpx.Client | None = None,
     ) -> None:
         self._config = config
+        self._client = client
         self._opts = opts or GasPriceManagerOptions()
+        # node_api_key is fixed for the manager's lifetime; httpx copies headers per request
+        self._auth_headers = _build_auth_headers(self._opts.node_api_key)
+        self._estimate_url = f"{config.fullnode_url}/estimate_gas_price"
         self._gas_price: GasPriceInfo | None = None
-        self._refresh_thread: threading.Thread | None = None
-        self._stop_event = threading.Event()
+        self._inflight_fetch: Future[int] | None = None
+        self._inflight_lock = threading.Lock()
+        # Bumped by initialize/destroy so refreshes scheduled by an earlier run are dropped
+        self._refresh_generation = 0
         self._is_initialized = False
         self._refresh_interval_seconds = self._opts.refresh_interval_seconds
         self._multiplier = self._opts.multiplier
@@ -185,19 +248,18 @@ class GasPriceManagerSync:
 
         try:
             self.fetch_and_set_gas_price()
-            self._stop_event.clear()
-            self._refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
-            self._refresh_thread.start()
+            self._refresh_generation += 1
+            _refresh_scheduler.schedule(
+                self._scheduled_refresh,
+                self._refresh_generation,
+                self._refresh_interval_seconds,
+            )
             self._is_initialized = True
         except Exception as e:
             logger.error("Failed to initialize gas price manager: %s", e)
 
     def destroy(self) -> None:
-        if self._refresh_thread is not None:
-            self._stop_event.set()
-            self._refresh_thread.join(timeout=2.0)
-            self._refresh_thread = None
-
+        self._refresh_generation += 1
         self._is_initialized = False
         self._gas_price = None
 
@@ -206,21 +268,47 @@ class GasPriceManagerSync:
 
     def refresh(self) -> None:
         try:
-            self.fetch_and_set_gas_price()
+            self.request_refresh()
         except Exception as e:
             logger.warning("Failed to fetch gas price: %s", e)
 
+    def request_refresh(self) -> int:
+        # Threads arriving while an estimate request is in flight wait for its result instead of
+        # sending their own
+        with self._inflight_lock:
+            inflight = self._inflight_fetch
+            is_leader = inflight is None
+            if inflight is None:
+                inflight = Future[int]()
+                self._inflight_fetch = inflight
+
+        if not is_leader:
+            return inflight.result()
+
+        try:
+            gas_estimate = self.fetch_and_set_gas_price()
+        except BaseException as e:
+            # Followers are blocked on the future, so it must complete even on KeyboardInterrupt
+            inflight.set_exception(e)
+            raise
+        else:
+            inflight.set_result(gas_estimate)
+            return gas_estimate
+        finally:
+            with self._inflight_lock:
+                self._inflight_fetch = None
+
     def fetch_gas_price_estimation(self) -> int:
-        url = f"{self._config.fullnode_url}/estimate_gas_price"
-        headers = _build_auth_headers(self._opts.node_api_key)
+        url = self._estimate_url
+        headers = self._auth_headers
 
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers)
+        client = self._client if self._client is not None else get_shared_sync_client()
+        response = client.get(url, headers=headers)
 
         if not response.is_success:
             raise ValueError(f"Failed to fetch gas price: {response.status_code} - {response.text}")
 
-        data = response.json()
+        data = from_json(response.content)
         gas_estimate = data.get("gas_estimate", 0)
 
         return int(gas_estimate * self._multiplier)
@@ -242,12 +330,14 @@ class GasPriceManagerSync:
             logger.error("Failed to fetch gas price: %s", e)
             raise
 
-    def _refresh_loop(self) -> None:
-        while not self._stop_event.wait(self._refresh_interval_seconds):
-            try:
-                self.fetch_and_set_gas_price()
-            except Exception as e:
-                logger.warning("Failed to fetch gas price during refresh: %s", e)
+    def _scheduled_refresh(self, generation: int) -> float | None:
+        if generation != self._refresh_generation:
+            return None
+        try:
+            self.request_refresh()
+        except Exception as e:
+            logger.warning("Failed to fetch gas price during refresh: %s", e)
+        return self._refresh_interval_seconds
 
     def __enter__(self) -> GasPriceManagerSync:
         self.initialize()
@@ -260,3 +350,59 @@ class GasPriceManagerSync:
         exc_tb: object,
     ) -> None:
         self.destroy()
+
+
+class _RefreshScheduler:
+    """Runs every GasPriceManagerSync's periodic refresh on one shared daemon thread.
+
+    Callbacks are held weakly and receive the token they were scheduled with; they return the
+    delay until their next run, or None to stop.
+    """
+
+    def __init__(self) -> None:
+        self._queue: list[tuple[float, int, WeakMethod[Callable[[int], float | None]], int]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, callback: Callable[[int], float | None], token: int, delay: float) -> None:
+        self._push(WeakMethod(callback), token, delay)
+
+    def _push(
+        self,
+        callback: WeakMethod[Callable[[int], float | None]],
+        token: int,
+        delay: float,
+    ) -> None:
+        with self._condition:
+            entry = (time.monotonic() + delay, next(self._counter), callback, token)
+            heapq.heappush(self._queue, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="decibel-gas-price-refresh", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue or self._queue[0][0] > time.monotonic():
+                    timeout = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._condition.wait(timeout)
+                _, _, callback, token = heapq.heappop(self._queue)
+
+            func = callback()
+            if func is None:
+                continue
+            try:
+                delay = func(token)
+            except Exception as e:
+                logger.warning("Gas price refresh failed: %s", e)
+                continue
+            del func
+            if delay is not None:
+                self._push(callback, token, delay)
+
+
+_refresh_scheduler = _RefreshScheduler()
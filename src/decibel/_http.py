@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+__all__ = [
+    "get_shared_async_client",
+    "get_shared_sync_client",
+]
+
+# Fallback clients for calls made without a caller-supplied client, so one-off requests to the
+# gas station, trading API and node reuse pooled keep-alive connections instead of paying a
+# fresh TCP/TLS handshake each time
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# httpx async connections belong to the event loop that opened them, so there is one async
+# client per loop. Each entry also holds the async generator that closes the client when the
+# loop shuts down (asyncio.run and Runner call loop.shutdown_asyncgens before closing the loop).
+# The pooled transports reference their loop, so entries must be removed explicitly rather
+# than left to a weak mapping.
+_async_clients: dict[
+    asyncio.AbstractEventLoop,
+    tuple[httpx.AsyncClient, AsyncGenerator[None, None]],
+] = {}
+
+_sync_client: httpx.Client | None = None
+_sync_client_lock = threading.Lock()
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(loop)
+    if entry is not None and not entry[0].is_closed:
+        return entry[0]
+
+    _drop_closed_loops()
+    client = httpx.AsyncClient(limits=_LIMITS)
+    closer = _close_on_loop_shutdown(loop, client)
+    # Run the generator up to its yield so the loop's first-iteration hook registers it for
+    # shutdown_asyncgens; nothing before the yield awaits
+    with contextlib.suppress(StopIteration):
+        closer.__anext__().send(None)
+    _async_clients[loop] = (client, closer)
+    return client
+
+
+async def _close_on_loop_shutdown(
+    loop: asyncio.AbstractEventLoop,
+    client: httpx.AsyncClient,
+) -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        entry = _async_clients.get(loop)
+        if entry is not None and entry[0] is client:
+            del _async_clients[loop]
+        await client.aclose()
+
+
+def _drop_closed_loops() -> None:
+    # Loops closed without shutdown_asyncgens (manual loop management) never ran their closer;
+    # their connections cannot be closed any more, but the entries must not keep them alive
+    for loop in [loop for loop in _async_clients if loop.is_closed()]:
+        del _async_clients[loop]
+
+
+def get_shared_sync_client() -> httpx.Client:
+    global _sync_client
+    client = _sync_client
+    if client is None or client.is_closed:
+        with _sync_client_lock:
+            client = _sync_client
+            if client is None or client.is_closed:
+                client = httpx.Client(limits=_LIMITS)
+                _sync_client = client
+    return client
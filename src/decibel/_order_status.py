@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 from typing import TYPE_CHECKING, Literal
 
-import httpx
 from pydantic import BaseModel
 
+from ._http import get_shared_async_client, get_shared_sync_client
 from ._utils import FetchError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import httpx
+
     from ._constants import DecibelConfig
 
 __all__ = [
@@ -40,6 +46,7 @@ class OrderStatus(BaseModel):
 class OrderStatusClient:
     def __init__(self, config: DecibelConfig) -> None:
         self._config = config
+        self._orders_url = f"{config.trading_http_url}/api/v1/orders"
 
     async def get_order_status(
         self,
@@ -49,7 +56,7 @@ class OrderStatusClient:
         *,
         client: httpx.AsyncClient | None = None,
     ) -> OrderStatus | None:
-        url = f"{self._config.trading_http_url}/api/v1/orders"
+        url = self._orders_url
         params = {
             "order_id": order_id,
             "market_address": market_address,
@@ -57,11 +64,9 @@ class OrderStatusClient:
         }
 
         try:
-            if client is not None:
-                response = await client.get(url, params=params)
-            else:
-                async with httpx.AsyncClient() as temp_client:
-                    response = await temp_client.get(url, params=params)
+            if client is None:
+                client = get_shared_async_client()
+            response = await client.get(url, params=params)
 
             if response.status_code == 404:
                 return None
@@ -69,11 +74,28 @@ class OrderStatusClient:
             if not response.is_success:
                 raise FetchError(response.text, response.status_code, response.reason_phrase)
 
-            return OrderStatus.model_validate(response.json())
+            return OrderStatus.model_validate_json(response.content)
         except Exception as e:
             logger.error("Error fetching order status: %s", e)
             return None
 
+    async def get_order_statuses(
+        self,
+        queries: Sequence[tuple[str, str, str]],
+        *,
+        client: httpx.AsyncClient | None = None,
+    ) -> list[OrderStatus | None]:
+        # queries are (order_id, market_address, user_address); results come back in the same
+        # order. All requests share one client, so an HTTP/2 client multiplexes them over a
+        # single connection
+        if client is None:
+            client = get_shared_async_client()
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self.get_order_status(*query, client=client)) for query in queries
+            ]
+        return [task.result() for task in tasks]
+
     def get_order_status_sync(
         self,
         order_id: str,
@@ -82,7 +104,7 @@ class OrderStatusClient:
         *,
         client: httpx.Client | None = None,
     ) -> OrderStatus | None:
-        url = f"{self._config.trading_http_url}/api/v1/orders"
+        url = self._orders_url
         params = {
             "order_id": order_id,
             "market_address": market_address,
@@ -90,11 +112,9 @@ class OrderStatusClient:
         }
 
         try:
-            if client is not None:
-                response = client.get(url, params=params)
-            else:
-                with httpx.Client() as temp_client:
-                    response = temp_client.get(url, params=params)
+            if client is None:
+                client = get_shared_sync_client()
+            response = client.get(url, params=params)
 
             if response.status_code == 404:
                 return None
@@ -102,7 +122,7 @@ class OrderStatusClient:
             if not response.is_success:
                 raise FetchError(response.text, response.status_code, response.reason_phrase)
 
-            return OrderStatus.model_validate(response.json())
+            return OrderStatus.model_validate_json(response.content)
         except Exception as e:
             logger.error("Error fetching order status: %s", e)
             return None
@@ -111,16 +131,7 @@ class OrderStatusClient:
     def parse_order_status_type(status: str | None) -> OrderStatusType:
         if not status:
             return "Unknown"
-        lower_status = status.lower()
-        if "acknowledged" in lower_status:
-            return "Acknowledged"
-        if "filled" in lower_status:
-            return "Filled"
-        if "cancelled" in lower_status:
-            return "Cancelled"
-        if "rejected" in lower_status:
-            return "Rejected"
-        return "Unknown"
+        return _parse_order_status_type(status)
 
     @staticmethod
     def is_success_status(status: str | None) -> bool:
@@ -136,3 +147,18 @@ class OrderStatusClient:
         return OrderStatusClient.is_success_status(status) or OrderStatusClient.is_failure_status(
             status
         )
+
+
+# Status strings come from a small fixed set, so each distinct one is classified only once
+@functools.lru_cache(maxsize=128)
+def _parse_order_status_type(status: str) -> OrderStatusType:
+    lower_status = status.lower()
+    if "acknowledged" in lower_status:
+        return "Acknowledged"
+    if "filled" in lower_status:
+        return "Filled"
+    if "cancelled" in lower_status:
+        return "Cancelled"
+    if "rejected" in lower_status:
+        return "Rejected"
+    return "Unknown"
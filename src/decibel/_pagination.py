@@ -67,16 +67,11 @@ PARAM_MAP: dict[str, str] = {
 
 
 def construct_known_query_params(args: KnownQueryParams) -> dict[str, str]:
-    query_params: dict[str, str] = {}
-
-    for arg_key, value in args.items():
-        param_key = PARAM_MAP.get(arg_key)
-        if param_key is None:
-            continue
-        if value is None:
-            continue
-        if isinstance(value, str) and value.strip() == "":
-            continue
-        query_params[param_key] = str(value)
-
-    return query_params
+    # Unknown keys, None and blank strings are dropped; strings are passed through as-is
+    return {
+        PARAM_MAP[arg_key]: value if isinstance(value, str) else str(value)
+        for arg_key, value in args.items()
+        if arg_key in PARAM_MAP
+        and value is not None
+        and not (isinstance(value, str) and value.strip() == "")
+    }
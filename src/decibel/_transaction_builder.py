@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, cast
@@ -15,6 +16,8 @@ from aptos_sdk.transactions import (
 from aptos_sdk.type_tag import StructTag, TypeTag
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .abi import MoveFunction
 
 __all__ = [
@@ -33,6 +36,9 @@ _INNER_PAYLOAD_VARIANT_V1 = 0
 _EXECUTABLE_VARIANT_ENTRY_FUNCTION = 1
 _EXTRA_CONFIG_VARIANT_V1 = 0
 
+# Placeholder fee payer for sponsored transactions; the gas station fills in the real one
+_FEE_PAYER_ZERO = AccountAddress.from_str("0x0")
+
 
 class TransactionExtraConfigV1:
     """Extra configuration for orderless transactions containing replay protection nonce."""
@@ -128,7 +134,8 @@ def generate_expire_timestamp(
     time_delta_ms: int = 0,
     default_txn_expiry_sec: int = 20,
 ) -> int:
-    return int((time.time() * 1000 + time_delta_ms) / 1000) + default_txn_expiry_sec
+    # Integer arithmetic throughout: current time in ms plus the clock offset, floored to seconds
+    return (time.time_ns() // 1_000_000 + time_delta_ms) // 1_000 + default_txn_expiry_sec
 
 
 def build_simple_transaction_sync(
@@ -143,7 +150,7 @@ def build_simple_transaction_sync(
     max_gas_amount: int = 100_000,
     default_txn_expiry_sec: int = 20,
 ) -> SimpleTransaction:
-    sender_address = AccountAddress.from_str(sender) if isinstance(sender, str) else sender
+    sender_address = _address_from_str(sender) if isinstance(sender, str) else sender
 
     entry_function = _build_entry_function(data, abi)
 
@@ -167,26 +174,23 @@ def build_simple_transaction_sync(
         chain_id=chain_id,
     )
 
-    fee_payer = AccountAddress.from_str("0x0") if with_fee_payer else None
+    fee_payer = _FEE_PAYER_ZERO if with_fee_payer else None
 
     return SimpleTransaction(raw_transaction=raw_txn, fee_payer_address=fee_payer)
 
 
+# A client signs for one or a few accounts, so the sender string repeats on every transaction;
+# addresses are only ever serialized, so sharing instances is safe
+@functools.lru_cache(maxsize=4096)
+def _address_from_str(address: str) -> AccountAddress:
+    return AccountAddress.from_str(address)
+
+
 def _build_entry_function(
     data: InputEntryFunctionData,
     abi: MoveFunction,
 ) -> EntryFunction:
-    parts = data.function.split("::")
-    if len(parts) != 3:
-        raise ValueError(
-            f"Invalid function format: {data.function}, expected 'address::module::function'"
-        )
-
-    module_address = parts[0]
-    module_name = parts[1]
-    function_name = parts[2]
-
-    module_id = ModuleId(AccountAddress.from_str(module_address), module_name)
+    module_id, function_name = _parse_function_id(data.function)
 
     type_tags = _parse_type_arguments(data.type_arguments or [])
 
@@ -203,10 +207,26 @@ def _build_entry_function(
     )
 
 
+# Bots call the same handful of entry functions over and over; the module id is only ever
+# serialized, so one shared instance per function string is safe
+@functools.lru_cache(maxsize=256)
+def _parse_function_id(function: str) -> tuple[ModuleId, str]:
+    parts = function.split("::")
+    if len(parts) != 3:
+        raise ValueError(
+            f"Invalid function format: {function}, expected 'address::module::function'"
+        )
+
+    module_address = parts[0]
+    module_name = parts[1]
+    function_name = parts[2]
+
+    return ModuleId(AccountAddress.from_str(module_address), module_name), function_name
+
+
 def _find_first_non_signer_arg(params: list[str]) -> int:
     for i, param in enumerate(params):
-        normalized = param.replace("&", "").strip()
-        if normalized != "signer":
+        if _normalize_param_type(param) != "signer":
             return i
     return len(params)
 
@@ -215,6 +235,9 @@ def _parse_type_arguments(type_args: list[str]) -> list[TypeTag]:
     return [_parse_type_tag(t) for t in type_args]
 
 
+# Type arguments come from a small fixed set of strings, and the resulting tags are only ever
+# serialized, so one shared instance per string is safe
+@functools.lru_cache(maxsize=512)
 def _parse_type_tag(type_str: str) -> TypeTag:
     type_str = type_str.strip()
 
@@ -254,72 +277,81 @@ def _encode_function_arguments(args: list[Any], param_types: list[str]) -> list[
     return encoded
 
 
+@functools.lru_cache(maxsize=512)
+def _normalize_param_type(param_type: str) -> str:
+    return param_type.replace("&", "").strip()
+
+
 def _encode_argument(arg: Any, param_type: str) -> bytes:
     serializer = Serializer()
-    normalized_type = param_type.replace("&", "").strip()
-
-    if normalized_type == "bool":
-        serializer.bool(bool(arg))
-    elif normalized_type == "u8":
-        serializer.u8(int(arg))
-    elif normalized_type == "u16":
-        serializer.u16(int(arg))
-    elif normalized_type == "u32":
-        serializer.u32(int(arg))
-    elif normalized_type == "u64":
-        serializer.u64(int(arg))
-    elif normalized_type == "u128":
-        serializer.u128(int(arg))
-    elif normalized_type == "u256":
-        serializer.u256(int(arg))
-    elif normalized_type == "address":
-        addr = AccountAddress.from_str(arg) if isinstance(arg, str) else arg
-        addr.serialize(serializer)
-    elif normalized_type == "vector<u8>":
-        if isinstance(arg, bytes):
-            serializer.to_bytes(arg)
-        elif isinstance(arg, str):
-            serializer.to_bytes(bytes.fromhex(arg.removeprefix("0x")))
-        else:
-            serializer.to_bytes(bytes(arg))
+    _encode_argument_into(serializer, arg, _normalize_param_type(param_type))
+    return serializer.output()
+
+
+def _encode_address(serializer: Serializer, arg: Any) -> None:
+    addr = AccountAddress.from_str(arg) if isinstance(arg, str) else arg
+    addr.serialize(serializer)
+
+
+def _encode_byte_vector(serializer: Serializer, arg: Any) -> None:
+    if isinstance(arg, bytes):
+        serializer.to_bytes(arg)
+    elif isinstance(arg, str):
+        serializer.to_bytes(bytes.fromhex(arg.removeprefix("0x")))
+    else:
+        serializer.to_bytes(bytes(arg))
+
+
+# Param types with a fixed encoding, looked up directly instead of walking a comparison chain;
+# generic vectors, options and objects are matched structurally in _encode_argument_into
+_SCALAR_ENCODERS: dict[str, Callable[[Serializer, Any], None]] = {
+    "bool": lambda serializer, arg: serializer.bool(bool(arg)),
+    "u8": lambda serializer, arg: serializer.u8(int(arg)),
+    "u16": lambda serializer, arg: serializer.u16(int(arg)),
+    "u32": lambda serializer, arg: serializer.u32(int(arg)),
+    "u64": lambda serializer, arg: serializer.u64(int(arg)),
+    "u128": lambda serializer, arg: serializer.u128(int(arg)),
+    "u256": lambda serializer, arg: serializer.u256(int(arg)),
+    "address": _encode_address,
+    "vector<u8>": _encode_byte_vector,
+    "0x1::string::String": lambda serializer, arg: serializer.str(str(arg)),
+}
+
+
+def _encode_argument_into(serializer: Serializer, arg: Any, normalized_type: str) -> None:
+    # Nested vector elements and option values are written straight into the parent
+    # serializer rather than encoded separately and copied in
+    encoder = _SCALAR_ENCODERS.get(normalized_type)
+    if encoder is not None:
+        encoder(serializer, arg)
     elif normalized_type.startswith("vector<"):
-        return _encode_vector_bytes(arg, normalized_type)
-    elif normalized_type == "0x1::string::String":
-        serializer.str(str(arg))
+        _encode_vector_into(serializer, arg, normalized_type)
     elif "::option::Option<" in normalized_type:
-        return _encode_option_bytes(arg, normalized_type)
+        _encode_option_into(serializer, arg, normalized_type)
     elif "::object::Object<" in normalized_type or normalized_type.endswith("::Object"):
-        addr = AccountAddress.from_str(arg) if isinstance(arg, str) else arg
-        addr.serialize(serializer)
+        _encode_address(serializer, arg)
     else:
         raise ValueError(
             f"Cannot encode argument of type '{type(arg).__name__}' "
             f"for param type '{normalized_type}'"
         )
 
-    return serializer.output()
-
 
-def _encode_vector_bytes(arg: list[Any], param_type: str) -> bytes:
-    inner_match = param_type[7:-1]
+def _encode_vector_into(serializer: Serializer, arg: list[Any], param_type: str) -> None:
+    # Element type is normalized once for the whole vector rather than per element
+    inner_type = param_type[7:-1].strip()
 
-    serializer = Serializer()
     serializer.uleb128(len(arg))
     for item in arg:
-        item_bytes = _encode_argument(item, inner_match)
-        serializer.fixed_bytes(item_bytes)  # pyright: ignore[reportUnknownMemberType]
-    return serializer.output()
+        _encode_argument_into(serializer, item, inner_type)
 
 
-def _encode_option_bytes(arg: Any | None, param_type: str) -> bytes:
-    serializer = Serializer()
+def _encode_option_into(serializer: Serializer, arg: Any | None, param_type: str) -> None:
     if arg is None:
         serializer.u8(0)
     else:
         serializer.u8(1)
         inner_start = param_type.find("Option<") + 7
         inner_end = param_type.rfind(">")
-        inner_type = param_type[inner_start:inner_end]
-        inner_bytes = _encode_argument(arg, inner_type)
-        serializer.fixed_bytes(inner_bytes)  # pyright: ignore[reportUnknownMemberType]
-    return serializer.output()
+        inner_type = _normalize_param_type(param_type[inner_start:inner_end])
+        _encode_argument_into(serializer, arg, inner_type)
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import math
 import secrets
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
-import httpx
 from aptos_sdk.account_address import AccountAddress
 from aptos_sdk.bcs import Serializer
 from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
+
+from ._http import get_shared_async_client, get_shared_sync_client
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import httpx
+
     from ._constants import CompatVersion
 
 logger = logging.getLogger(__name__)
@@ -19,6 +26,7 @@ logger = logging.getLogger(__name__)
 __all__ = [
     "FetchError",
     "bigint_reviver",
+    "decode_json",
     "prettify_validation_error",
     "get_request",
     "get_request_sync",
@@ -32,15 +40,26 @@ __all__ = [
     "get_vault_share_address",
     "round_to_tick_size",
     "round_to_valid_price",
+    "round_to_valid_prices",
     "round_to_valid_order_size",
+    "round_to_valid_order_sizes",
     "amount_to_chain_units",
+    "amounts_to_chain_units",
     "chain_units_to_amount",
     "extract_vault_address_from_create_tx",
+    "format_fields",
     "generate_random_replay_protection_nonce",
 ]
 
 T = TypeVar("T", bound=BaseModel)
 
+_BIGINT_MARKER = b'"$bigint"'
+_BIGINT_MARKER_STR = _BIGINT_MARKER.decode()
+
+# Decimal scales for the price/size/amount conversions; anything outside the table (never the
+# case for on-chain markets or USDC) falls back to computing the power
+_POW10 = {i: 10**i for i in range(32)}
+
 
 class FetchError(Exception):
     status: int
@@ -49,26 +68,24 @@ class FetchError(Exception):
 
     def __init__(self, response_data: str, status: int, status_text: str) -> None:
         self.status = status
+        self.status_text = status_text
+        self.response_message = response_data
 
+        # Error bodies are often plain text; a JSON object may override the status text and
+        # carry a friendlier message
         try:
-            parsed_data: Any = json.loads(response_data)
-            parsed_status: str | None = None
-            parsed_message: str | None = None
-
-            if isinstance(parsed_data, dict):
-                data_dict = cast("dict[str, Any]", parsed_data)
-                status_val = data_dict.get("status")
-                message_val = data_dict.get("message")
-                if isinstance(status_val, str):
-                    parsed_status = status_val
-                if isinstance(message_val, str):
-                    parsed_message = message_val
-
-            self.status_text = parsed_status if parsed_status is not None else status_text
-            self.response_message = parsed_message if parsed_message is not None else response_data
-        except (json.JSONDecodeError, TypeError):
-            self.status_text = status_text
-            self.response_message = response_data
+            parsed_data: Any = from_json(response_data)
+        except (ValueError, TypeError):
+            parsed_data = None
+
+        if isinstance(parsed_data, dict):
+            data_dict = cast("dict[str, Any]", parsed_data)
+            status_val = data_dict.get("status")
+            message_val = data_dict.get("message")
+            if isinstance(status_val, str):
+                self.status_text = status_val
+            if isinstance(message_val, str):
+                self.response_message = message_val
 
         formatted_status_text = f" ({self.status_text})" if self.status_text else ""
         message = f"HTTP Error {self.status}{formatted_status_text}: {self.response_message}"
@@ -81,6 +98,17 @@ def bigint_reviver(obj: dict[str, Any]) -> Any:
     return obj
 
 
+def decode_json(data: str | bytes) -> Any:
+    """Decode a JSON payload, reviving ``{"$bigint": "..."}`` wrappers only when present.
+
+    Payloads without the marker are parsed by pydantic-core's native parser.
+    """
+    has_bigint = _BIGINT_MARKER in data if isinstance(data, bytes) else _BIGINT_MARKER_STR in data
+    if has_bigint:
+        return json.loads(data, object_hook=bigint_reviver)
+    return from_json(data)
+
+
 def prettify_validation_error(e: ValidationError) -> str:
     errors = e.errors()
     lines: list[str] = []
@@ -216,23 +244,15 @@ async def _base_request_async(
 
     json_body = body if method in ("POST", "PATCH") else None
 
-    if client is not None:
-        response = await client.request(
-            method=method,
-            url=url,
-            params=params,
-            json=json_body,
-            headers=headers,
-        )
-    else:
-        async with httpx.AsyncClient() as temp_client:
-            response = await temp_client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_body,
-                headers=headers,
-            )
+    if client is None:
+        client = get_shared_async_client()
+    response = await client.request(
+        method=method,
+        url=url,
+        params=params,
+        json=json_body,
+        headers=headers,
+    )
 
     return _process_response(model, response)
 
@@ -255,23 +275,15 @@ def _base_request_sync(
 
     json_body = body if method in ("POST", "PATCH") else None
 
-    if client is not None:
-        response = client.request(
-            method=method,
-            url=url,
-            params=params,
-            json=json_body,
-            headers=headers,
-        )
-    else:
-        with httpx.Client() as temp_client:
-            response = temp_client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_body,
-                headers=headers,
-            )
+    if client is None:
+        client = get_shared_sync_client()
+    response = client.request(
+        method=method,
+        url=url,
+        params=params,
+        json=json_body,
+        headers=headers,
+    )
 
     return _process_response(model, response)
 
@@ -283,14 +295,21 @@ def _process_response(model: type[T], response: httpx.Response) -> tuple[T, int,
     if not response.is_success:
         raise FetchError(response.text, status, status_text)
 
+    content = response.content
     try:
-        raw_data = json.loads(response.text, object_hook=bigint_reviver)
-        data = model.model_validate(raw_data)
+        if _BIGINT_MARKER in content:
+            # Already known to carry the marker, so skip decode_json's own check
+            data = model.model_validate(json.loads(content, object_hook=bigint_reviver))
+        else:
+            # Parse and validate in one pass in pydantic-core, without an intermediate dict tree
+            data = model.model_validate_json(content)
         return (data, status, status_text)
     except ValidationError as e:
         raise ValueError(prettify_validation_error(e)) from e
 
 
+# Seeds and market names come from a small fixed set of strings
+@functools.lru_cache(maxsize=256)
 def _bcs_encode_string(s: str) -> bytes:
     serializer = Serializer()
     serializer.str(s)
@@ -299,10 +318,17 @@ def _bcs_encode_string(s: str) -> bytes:
 
 def _get_subaccount_seed_bytes(owner_addr: AccountAddress, seed: str) -> bytes:
     # TODO: Is this the best way to concatenate/serialize SubaccountSeed?
-    return bytes(owner_addr.address) + _bcs_encode_string(seed)
+    # AccountAddress.address is already bytes, so no copy is needed before concatenating
+    return owner_addr.address + _bcs_encode_string(seed)
 
 
 def get_market_addr(name: str, perp_engine_global_addr: str) -> str:
+    return _derive_market_addr(name, perp_engine_global_addr)
+
+
+# Address derivations are pure functions of their inputs, so results are memoized
+@functools.lru_cache(maxsize=256)
+def _derive_market_addr(name: str, perp_engine_global_addr: str) -> str:
     creator = AccountAddress.from_str(perp_engine_global_addr)
     market_name_bytes = _bcs_encode_string(name)
     return str(AccountAddress.for_named_object(creator, market_name_bytes))
@@ -318,6 +344,13 @@ def get_primary_subaccount_addr(
     package_address = (
         AccountAddress.from_str(package_addr) if isinstance(package_addr, str) else package_addr
     )
+    return _derive_primary_subaccount_addr(account.address, package_address.address)
+
+
+@functools.lru_cache(maxsize=256)
+def _derive_primary_subaccount_addr(account_bytes: bytes, package_bytes: bytes) -> str:
+    account = AccountAddress(account_bytes)
+    package_address = AccountAddress(package_bytes)
     deriver = AccountAddress.for_named_object(package_address, b"GlobalSubaccountManager")
     seed_bytes = _get_subaccount_seed_bytes(account, "primary_subaccount")
     result = str(AccountAddress.for_named_object(deriver, seed_bytes))
@@ -333,10 +366,21 @@ def get_primary_subaccount_addr(
 
 def get_trading_competition_subaccount_addr(addr: AccountAddress | str) -> str:
     account = AccountAddress.from_str(addr) if isinstance(addr, str) else addr
+    return _derive_trading_competition_subaccount_addr(account.address)
+
+
+@functools.lru_cache(maxsize=256)
+def _derive_trading_competition_subaccount_addr(account_bytes: bytes) -> str:
+    account = AccountAddress(account_bytes)
     return str(AccountAddress.for_named_object(account, b"trading_competition"))
 
 
 def get_vault_share_address(vault_address: str) -> str:
+    return _derive_vault_share_address(vault_address)
+
+
+@functools.lru_cache(maxsize=256)
+def _derive_vault_share_address(vault_address: str) -> str:
     creator = AccountAddress.from_str(vault_address)
     return str(AccountAddress.for_named_object(creator, b"vault_share_asset"))
 
@@ -344,21 +388,38 @@ def get_vault_share_address(vault_address: str) -> str:
 def round_to_tick_size(price: float, tick_size: int, px_decimals: int, round_up: bool) -> float:
     if price == 0:
         return 0.0
-    denormalized = price * (10**px_decimals)
+    scale = _POW10.get(px_decimals) or 10**px_decimals
+    denormalized = price * scale
     if round_up:
         rounded = math.ceil(denormalized / tick_size) * tick_size
     else:
         rounded = math.floor(denormalized / tick_size) * tick_size
-    return round(rounded / (10**px_decimals), px_decimals)
+    return round(rounded / scale, px_decimals)
 
 
 def round_to_valid_price(price: float, tick_size: int, px_decimals: int) -> float:
     """Round a price to the nearest valid tick size using standard rounding."""
     if price == 0:
         return 0.0
-    denormalized = price * (10**px_decimals)
+    scale = _POW10.get(px_decimals) or 10**px_decimals
+    denormalized = price * scale
     rounded = round(denormalized / tick_size) * tick_size
-    return round(rounded / (10**px_decimals), px_decimals)
+    return round(rounded / scale, px_decimals)
+
+
+def round_to_valid_prices(prices: Iterable[float], tick_size: int, px_decimals: int) -> list[float]:
+    """Round many prices to valid ticks, e.g. the levels of a quote ladder."""
+    scale = _POW10.get(px_decimals) or 10**px_decimals
+    rounded_prices: list[float] = []
+    for price in prices:
+        # Same steps as round_to_valid_price, with the scale computed once for the batch
+        if price == 0:
+            rounded_prices.append(0.0)
+            continue
+        denormalized = price * scale
+        rounded = round(denormalized / tick_size) * tick_size
+        rounded_prices.append(round(rounded / scale, px_decimals))
+    return rounded_prices
 
 
 def round_to_valid_order_size(
@@ -371,23 +432,84 @@ def round_to_valid_order_size(
     if order_size == 0:
         return 0.0
 
-    normalized_min_size = min_size / (10**sz_decimals)
+    scale = _POW10.get(sz_decimals) or 10**sz_decimals
+    normalized_min_size = min_size / scale
     if order_size < normalized_min_size:
         return normalized_min_size
 
-    denormalized = order_size * (10**sz_decimals)
+    denormalized = order_size * scale
     rounded = round(denormalized / lot_size) * lot_size
-    return round(rounded / (10**sz_decimals), sz_decimals)
+    return round(rounded / scale, sz_decimals)
+
+
+def round_to_valid_order_sizes(
+    order_sizes: Iterable[float],
+    lot_size: int,
+    sz_decimals: int,
+    min_size: int,
+) -> list[float]:
+    """Round many order sizes to valid lots, enforcing the minimum size on each."""
+    scale = _POW10.get(sz_decimals) or 10**sz_decimals
+    normalized_min_size = min_size / scale
+    rounded_sizes: list[float] = []
+    for order_size in order_sizes:
+        # Same steps as round_to_valid_order_size, with the scale and minimum computed once
+        if order_size == 0:
+            rounded_sizes.append(0.0)
+            continue
+        if order_size < normalized_min_size:
+            rounded_sizes.append(normalized_min_size)
+            continue
+        denormalized = order_size * scale
+        rounded = round(denormalized / lot_size) * lot_size
+        rounded_sizes.append(round(rounded / scale, sz_decimals))
+    return rounded_sizes
 
 
 def amount_to_chain_units(amount: float, decimals: int = 6) -> int:
     """Convert a decimal amount to chain units (e.g., 5.67 USDC -> 5670000)."""
-    return round(amount * (10**decimals))
+    return round(amount * (_POW10.get(decimals) or 10**decimals))
+
+
+def amounts_to_chain_units(amounts: Iterable[float], decimals: int = 6) -> list[int]:
+    """Convert many decimal amounts to chain units, e.g. the price ladder of a bulk order."""
+    scale = _POW10.get(decimals) or 10**decimals
+    return [round(amount * scale) for amount in amounts]
 
 
 def chain_units_to_amount(chain_units: int, decimals: int = 6) -> float:
     """Convert chain units to a decimal amount (e.g., 5670000 -> 5.67)."""
-    return chain_units / (10**decimals)
+    return chain_units / (_POW10.get(decimals) or 10**decimals)
+
+
+_LABEL_WORDS = {
+    "id": "ID",
+    "ms": "MS",
+    "pnl": "PnL",
+    "sl": "SL",
+    "tp": "TP",
+    "tpsl": "TPSL",
+    "tpsls": "TPSLs",
+    "usdc": "USDC",
+}
+
+
+@functools.cache
+def _fields_template(model: type[BaseModel], indent: int) -> str:
+    pad = " " * indent
+    lines: list[str] = []
+    for name in model.model_fields:
+        label = " ".join(_LABEL_WORDS.get(word, word.capitalize()) for word in name.split("_"))
+        lines.append(f"{pad}{label}: {{{name}}}\n")
+    return "".join(lines)
+
+
+def format_fields(model: BaseModel, indent: int = 4) -> str:
+    """Render a model as one ``Label: value`` line per field (e.g. ``    Order ID: 42``).
+
+    The line template is built once per model class and indent, then filled from the instance.
+    """
+    return _fields_template(type(model), indent).format_map(vars(model))
 
 
 def extract_vault_address_from_create_tx(create_vault_tx: dict[str, Any]) -> str:
@@ -424,9 +546,10 @@ def extract_vault_address_from_create_tx(create_vault_tx: dict[str, Any]) -> str
 
 
 def generate_random_replay_protection_nonce() -> int | None:
-    buf = [secrets.randbits(32), secrets.randbits(32)]
+    # One 64-bit draw; as before, a zero in either 32-bit half means no nonce
+    nonce = secrets.randbits(64)
 
-    if buf[0] == 0 or buf[1] == 0:
+    if nonce >> 32 == 0 or nonce & 0xFFFFFFFF == 0:
         return None
 
-    return (buf[0] << 32) | buf[1]
+    return nonce
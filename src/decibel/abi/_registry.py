@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import importlib.resources
-import json
 import warnings
 from functools import lru_cache
 from typing import TYPE_CHECKING
@@ -24,10 +23,8 @@ CHAIN_ID_TESTNET = 2
 @lru_cache(maxsize=4)
 def _load_abi_json(filename: str) -> ABIData:
     json_dir: Traversable = importlib.resources.files("decibel.abi") / "json"
-    json_file = json_dir / filename
-    with json_file.open("r") as f:
-        data = json.load(f)
-    return ABIData.model_validate(data)
+    # Parsed and validated in one pass straight from the file bytes
+    return ABIData.model_validate_json((json_dir / filename).read_bytes())
 
 
 def get_abi_data(chain_id: int | None) -> ABIData:
@@ -51,6 +48,11 @@ class AbiRegistry:
     def __init__(self, chain_id: int | None = None) -> None:
         self._chain_id = chain_id
         self._abi_data: ABIData | None = None
+        # Filtered views of the (immutable) ABI set, built on first use; callers get copies so
+        # mutating a result cannot corrupt later lookups
+        self._entry_functions: dict[MoveFunctionId, MoveFunction] | None = None
+        self._view_functions: dict[MoveFunctionId, MoveFunction] | None = None
+        self._functions_by_module: dict[str, dict[MoveFunctionId, MoveFunction]] | None = None
 
     @property
     def abi_data(self) -> ABIData:
@@ -76,14 +78,30 @@ class AbiRegistry:
         return self.abi_data.abis
 
     def get_entry_functions(self) -> dict[MoveFunctionId, MoveFunction]:
-        return {fid: func for fid, func in self.abi_data.abis.items() if func.is_entry}
+        if self._entry_functions is None:
+            self._entry_functions = {
+                fid: func for fid, func in self.abi_data.abis.items() if func.is_entry
+            }
+        return dict(self._entry_functions)
 
     def get_view_functions(self) -> dict[MoveFunctionId, MoveFunction]:
-        return {fid: func for fid, func in self.abi_data.abis.items() if func.is_view}
+        if self._view_functions is None:
+            self._view_functions = {
+                fid: func for fid, func in self.abi_data.abis.items() if func.is_view
+            }
+        return dict(self._view_functions)
 
     def get_module_functions(self, module_name: str) -> dict[MoveFunctionId, MoveFunction]:
-        pattern = f"::{module_name}::"
-        return {fid: func for fid, func in self.abi_data.abis.items() if pattern in fid}
+        if self._functions_by_module is None:
+            # Function ids are "address::module::function"
+            by_module: dict[str, dict[MoveFunctionId, MoveFunction]] = {}
+            for fid, func in self.abi_data.abis.items():
+                parts = fid.split("::")
+                if len(parts) == 3:
+                    by_module.setdefault(parts[1], {})[fid] = func
+            self._functions_by_module = by_module
+        module_functions = self._functions_by_module.get(module_name)
+        return {} if module_functions is None else dict(module_functions)
 
     def has_function(self, function_id: MoveFunctionId) -> bool:
         return function_id in self.abi_data.abis
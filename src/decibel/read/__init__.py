@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
-from aptos_sdk.async_client import RestClient
+import httpx
 
 from ._account_overview import (
     AccountOverview,
@@ -13,6 +14,7 @@ from ._account_overview import (
 from ._base import ReaderDeps
 from ._candlesticks import (
     Candlestick,
+    CandlestickColumns,
     CandlestickInterval,
     CandlesticksReader,
     CandlestickWsMessage,
@@ -58,6 +60,7 @@ from ._portfolio_chart import (
     PortfolioChartTimeRange,
     PortfolioChartType,
 )
+from ._snapshot import MarketSnapshot
 from ._trading_points import (
     OwnerTradingPoints,
     SubaccountPoints,
@@ -160,10 +163,20 @@ class DecibelReadDex:
         *,
         api_key: str | None = None,
         on_ws_error: Callable[[Exception], None] | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
-        aptos = RestClient(config.fullnode_url)
+        # One pooled client for every REST reader so repeated calls reuse keep-alive connections.
+        # A caller-supplied client (e.g. one built with http2=True) is used as-is and left open.
+        self._owns_http_client = http_client is None
+        self._http_client = http_client if http_client is not None else httpx.AsyncClient()
         ws = DecibelWsSubscription(config, api_key, on_ws_error)
-        deps = ReaderDeps(config=config, ws=ws, aptos=aptos, api_key=api_key)
+        deps = ReaderDeps(
+            config=config,
+            ws=ws,
+            api_key=api_key,
+            http_client=self._http_client,
+        )
+        self._deps = deps
 
         self.ws = ws
         self.account_overview = AccountOverviewReader(deps)
@@ -190,6 +203,39 @@ class DecibelReadDex:
         self.vaults = VaultsReader(deps)
         self.trading_points = TradingPointsReader(deps)
 
+    async def snapshot(self, *, leaderboard_limit: int = 10) -> MarketSnapshot:
+        """Fetch markets, prices, market contexts and the leaderboard concurrently."""
+        markets, prices, contexts, leaderboard = await asyncio.gather(
+            self.markets.get_all(),
+            self.market_prices.get_all(),
+            self.market_contexts.get_all(),
+            self.leaderboard.get_leaderboard(limit=leaderboard_limit),
+        )
+        return MarketSnapshot(
+            markets=markets,
+            prices=prices,
+            contexts=contexts,
+            leaderboard=leaderboard,
+        )
+
+    async def close(self) -> None:
+        await self.ws.close()
+        if self._deps.aptos is not None:
+            await self._deps.aptos.close()
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    async def __aenter__(self) -> DecibelReadDex:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        await self.close()
+
 
 __all__ = [
     "AccountOverview",
@@ -199,6 +245,7 @@ __all__ = [
     "AssetType",
     "BalanceTable",
     "Candlestick",
+    "CandlestickColumns",
     "CandlestickInterval",
     "CandlestickWsMessage",
     "CollateralBalanceSheet",
@@ -223,6 +270,7 @@ __all__ = [
     "MarketOrder",
     "MarketPrice",
     "MarketPriceWsMessage",
+    "MarketSnapshot",
     "MarketTrade",
     "MarketTradesResponse",
     "MarketTradeWsMessage",
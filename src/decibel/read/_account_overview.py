@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict
 
 from ._base import BaseReader
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable
 
     from ._ws import Unsubscribe
 
@@ -117,3 +117,19 @@ class AccountOverviewReader(BaseReader):
     ) -> Unsubscribe:
         topic = f"account_overview:{sub_addr}"
         return self.ws.subscribe(topic, AccountOverviewWsMessage, on_data)
+
+    def subscribe_fields_by_addr(
+        self,
+        sub_addr: str,
+        fields: Iterable[str],
+        on_data: Callable[[dict[str, Any]], None] | Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> Unsubscribe:
+        """Subscribe to account overview updates, receiving only ``fields`` as a plain dict.
+
+        Frames skip model validation entirely; values are the raw decoded JSON (floats or
+        ``None``), and fields absent from a frame map to ``None``.
+        """
+        topic = f"account_overview:{sub_addr}"
+        return self.ws.subscribe_fields(
+            topic, "account_overview", _AccountOverviewWs, fields, on_data
+        )
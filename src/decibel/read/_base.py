@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
+from aptos_sdk.async_client import RestClient
 from pydantic import BaseModel
 
 from .._utils import (
@@ -15,7 +16,9 @@ from .._utils import (
 )
 
 if TYPE_CHECKING:
-    from aptos_sdk.async_client import RestClient
+    from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+
+    import httpx
 
     from .._constants import DecibelConfig
     from ._ws import DecibelWsSubscription
@@ -26,14 +29,25 @@ __all__ = [
 ]
 
 T = TypeVar("T", bound=BaseModel)
+T_co = TypeVar("T_co", covariant=True)
+
+
+class _Page(Protocol[T_co]):
+    @property
+    def items(self) -> Sequence[T_co]: ...
+
+    @property
+    def total_count(self) -> int: ...
 
 
 @dataclass
 class ReaderDeps:
     config: DecibelConfig
     ws: DecibelWsSubscription
-    aptos: RestClient
+    # Created on first on-chain read; REST and WebSocket readers never need it
+    aptos: RestClient | None = None
     api_key: str | None = None
+    http_client: httpx.AsyncClient | None = None
 
 
 class BaseReader:
@@ -50,8 +64,26 @@ class BaseReader:
 
     @property
     def aptos(self) -> RestClient:
+        if self._deps.aptos is None:
+            self._deps.aptos = RestClient(self._deps.config.fullnode_url)
         return self._deps.aptos
 
+    @staticmethod
+    async def _iter_pages(
+        fetch: Callable[[int, int], Awaitable[_Page[T_co]]],
+        page_size: int,
+    ) -> AsyncIterator[T_co]:
+        # fetch(limit, offset); the offset advances by what the server actually returned, so a
+        # server that caps the page below page_size does not skip items
+        offset = 0
+        while True:
+            page = await fetch(page_size, offset)
+            for item in page.items:
+                yield item
+            offset += len(page.items)
+            if not page.items or offset >= page.total_count:
+                return
+
     async def get_request(
         self,
         model: type[T],
@@ -64,6 +96,7 @@ class BaseReader:
             url=url,
             params=params,
             api_key=self._deps.api_key,
+            client=self._deps.http_client,
         )
 
     async def post_request(
@@ -78,6 +111,7 @@ class BaseReader:
             url=url,
             body=body,
             api_key=self._deps.api_key,
+            client=self._deps.http_client,
         )
 
     async def patch_request(
@@ -92,6 +126,7 @@ class BaseReader:
             url=url,
             body=body,
             api_key=self._deps.api_key,
+            client=self._deps.http_client,
         )
 
     def get_request_sync(
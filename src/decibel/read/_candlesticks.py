@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from array import array
+from dataclasses import dataclass
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
@@ -15,6 +17,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "Candlestick",
+    "CandlestickColumns",
     "CandlestickInterval",
     "CandlesticksReader",
     "CandlestickWsMessage",
@@ -54,6 +57,38 @@ class _CandlesticksList(RootModel[list[Candlestick]]):
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class CandlestickColumns:
+    """Candlesticks laid out column-wise in packed arrays.
+
+    Each column supports the buffer protocol, so e.g. ``numpy.frombuffer(cols.close)`` wraps
+    it without copying.
+    """
+
+    time_start: array[int]
+    time_end: array[int]
+    open_price: array[float]
+    high: array[float]
+    low: array[float]
+    close: array[float]
+    volume: array[float]
+
+    @classmethod
+    def from_candlesticks(cls, candles: list[Candlestick]) -> CandlestickColumns:
+        return cls(
+            time_start=array("q", [c.time_start for c in candles]),
+            time_end=array("q", [c.time_end for c in candles]),
+            open_price=array("d", [c.open_price for c in candles]),
+            high=array("d", [c.high for c in candles]),
+            low=array("d", [c.low for c in candles]),
+            close=array("d", [c.close for c in candles]),
+            volume=array("d", [c.volume for c in candles]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.time_start)
+
+
 class CandlestickWsMessage(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
@@ -83,6 +118,22 @@ class CandlesticksReader(BaseReader):
         )
         return response.root
 
+    async def get_columns_by_name(
+        self,
+        market_name: str,
+        *,
+        interval: CandlestickInterval,
+        start_time: int,
+        end_time: int,
+    ) -> CandlestickColumns:
+        candles = await self.get_by_name(
+            market_name,
+            interval=interval,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        return CandlestickColumns.from_candlesticks(candles)
+
     def subscribe_by_name(
         self,
         market_name: str,
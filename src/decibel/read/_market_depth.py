@@ -66,6 +66,23 @@ class MarketDepthReader(BaseReader):
         topic = f"depth:{market_addr}:{aggregation_size}"
         return self.ws.subscribe(topic, MarketDepth, on_data)
 
+    def subscribe_by_name_batched(
+        self,
+        market_name: str,
+        aggregation_size: MarketDepthAggregationSize,
+        on_batch: (
+            Callable[[list[MarketDepth]], None] | Callable[[list[MarketDepth]], Awaitable[None]]
+        ),
+        *,
+        max_batch: int = 32,
+        max_delay: float = 0.005,
+    ) -> Unsubscribe:
+        market_addr = get_market_addr(market_name, self.config.deployment.perp_engine_global)
+        topic = f"depth:{market_addr}:{aggregation_size}"
+        return self.ws.subscribe_batched(
+            topic, MarketDepth, on_batch, max_batch=max_batch, max_delay=max_delay
+        )
+
     def reset_subscription_by_name(
         self,
         market_name: str,
@@ -98,3 +98,18 @@ class MarketPricesReader(BaseReader):
     ) -> Unsubscribe:
         topic = "all_market_prices"
         return self.ws.subscribe(topic, AllMarketPricesWsMessage, on_data)
+
+    def subscribe_all_batched(
+        self,
+        on_batch: (
+            Callable[[list[AllMarketPricesWsMessage]], None]
+            | Callable[[list[AllMarketPricesWsMessage]], Awaitable[None]]
+        ),
+        *,
+        max_batch: int = 32,
+        max_delay: float = 0.005,
+    ) -> Unsubscribe:
+        topic = "all_market_prices"
+        return self.ws.subscribe_batched(
+            topic, AllMarketPricesWsMessage, on_batch, max_batch=max_batch, max_delay=max_delay
+        )
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import time
 from enum import StrEnum
-from typing import Annotated, Any, Literal
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 from aptos_sdk.account_address import AccountAddress
 from pydantic import BaseModel, ConfigDict, Field, RootModel
 
-from .._utils import get_market_addr
+from .._utils import decode_json, get_market_addr
 from ._base import BaseReader
 
+if TYPE_CHECKING:
+    from ._base import ReaderDeps
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
@@ -99,8 +103,38 @@ class _PerpMarketList(RootModel[list[PerpMarket]]):
     pass
 
 
+_MARKETS_CACHE_TTL_SECONDS = 60.0
+
+
 class MarketsReader(BaseReader):
+    def __init__(self, deps: ReaderDeps) -> None:
+        super().__init__(deps)
+        # Market addresses never change name, so lookups are cached until refresh_markets()
+        self._market_names: dict[str, str] = {}
+        self._markets_cache: tuple[float, list[PerpMarket], dict[str, PerpMarket]] | None = None
+        self._market_addresses_cache: tuple[float, list[str]] | None = None
+
+    def refresh_markets(self) -> None:
+        """Drop cached market listings so the next lookup hits the API again."""
+        self._market_names.clear()
+        self._markets_cache = None
+        self._market_addresses_cache = None
+
     async def get_all(self) -> list[PerpMarket]:
+        markets, _ = await self._get_cached_markets()
+        return list(markets)
+
+    async def find_by_name(self, market_name: str) -> PerpMarket | None:
+        """Look up a market from the cached listing, e.g. ``"BTC/USD"``."""
+        _, by_name = await self._get_cached_markets()
+        return by_name.get(market_name)
+
+    async def _get_cached_markets(self) -> tuple[list[PerpMarket], dict[str, PerpMarket]]:
+        if self._markets_cache is not None:
+            fetched_at, markets, by_name = self._markets_cache
+            if time.monotonic() - fetched_at < _MARKETS_CACHE_TTL_SECONDS:
+                return markets, by_name
+
         response, _, _ = await self.get_request(
             model=_PerpMarketList,
             url=f"{self.config.trading_http_url}/api/v1/markets",
@@ -112,7 +146,9 @@ class MarketsReader(BaseReader):
             if market.market_addr not in seen:
                 seen.add(market.market_addr)
                 unique.append(market)
-        return unique
+        by_name = {market.market_name: market for market in unique}
+        self._markets_cache = (time.monotonic(), unique, by_name)
+        return unique, by_name
 
     async def get_by_name(self, market_name: str) -> PerpMarketConfig | None:
         # TODO: Handle different __variant__ values
@@ -128,19 +164,45 @@ class MarketsReader(BaseReader):
             return None
 
     async def list_market_addresses(self) -> list[str]:
+        if self._market_addresses_cache is not None:
+            fetched_at, addresses = self._market_addresses_cache
+            if time.monotonic() - fetched_at < _MARKETS_CACHE_TTL_SECONDS:
+                return list(addresses)
+
         result_bytes = await self.aptos.view(
             f"{self.config.deployment.package}::perp_engine::list_markets",
             [],
             [],
         )
-        result: list[Any] = json.loads(result_bytes.decode("utf-8"))
-        return [str(addr) for addr in result[0]]
+        result: list[Any] = decode_json(result_bytes)
+        addresses = [str(addr) for addr in result[0]]
+        self._market_addresses_cache = (time.monotonic(), addresses)
+        return list(addresses)
+
+    async def market_names_by_addresses(self, market_addrs: list[str]) -> dict[str, str]:
+        """Resolve many market addresses to names with a single markets listing.
+
+        Addresses missing from the listing fall back to concurrent on-chain lookups.
+        """
+        missing = [addr for addr in market_addrs if addr not in self._market_names]
+        if missing:
+            for market in await self.get_all():
+                self._market_names.setdefault(market.market_addr, market.market_name)
+            unresolved = [addr for addr in missing if addr not in self._market_names]
+            if unresolved:
+                await asyncio.gather(*(self.market_name_by_address(a) for a in unresolved))
+        return {addr: self._market_names[addr] for addr in market_addrs}
 
     async def market_name_by_address(self, market_addr: str) -> str:
+        cached = self._market_names.get(market_addr)
+        if cached is not None:
+            return cached
         result_bytes = await self.aptos.view(
             f"{self.config.deployment.package}::perp_engine::market_name",
             [],
             [market_addr],
         )
-        result: list[Any] = json.loads(result_bytes.decode("utf-8"))
-        return str(result[0])
+        result: list[Any] = decode_json(result_bytes)
+        name = str(result[0])
+        self._market_names[market_addr] = name
+        return name
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._leaderboard import LeaderboardResponse
+    from ._market_contexts import MarketContext
+    from ._market_prices import MarketPrice
+    from ._markets import PerpMarket
+
+__all__ = [
+    "MarketSnapshot",
+]
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    markets: list[PerpMarket]
+    prices: list[MarketPrice]
+    contexts: list[MarketContext]
+    leaderboard: LeaderboardResponse
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict
 
 from ._base import BaseReader
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable
 
     from ._ws import Unsubscribe
 
@@ -89,3 +89,20 @@ class UserOpenOrdersReader(BaseReader):
     ) -> Unsubscribe:
         topic = f"account_open_orders:{sub_addr}"
         return self.ws.subscribe(topic, UserOpenOrdersWsMessage, on_data)
+
+    def subscribe_fields_by_addr(
+        self,
+        sub_addr: str,
+        fields: Iterable[str],
+        on_data: (
+            Callable[[list[dict[str, Any]]], None]
+            | Callable[[list[dict[str, Any]]], Awaitable[None]]
+        ),
+    ) -> Unsubscribe:
+        """Subscribe to open orders, receiving only ``fields`` of each order as a plain dict.
+
+        Frames skip model validation; values are the raw decoded JSON, and fields absent from an
+        order map to ``None``.
+        """
+        topic = f"account_open_orders:{sub_addr}"
+        return self.ws.subscribe_fields(topic, "orders", UserOpenOrder, fields, on_data)
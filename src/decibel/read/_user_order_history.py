@@ -7,7 +7,7 @@ from pydantic import BaseModel, ConfigDict
 from ._base import BaseReader
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable
 
     from ._ws import Unsubscribe
 
@@ -90,6 +90,24 @@ class UserOrderHistoryReader(BaseReader):
         )
         return response
 
+    async def iter_by_addr(
+        self,
+        *,
+        sub_addr: str,
+        page_size: int = 100,
+    ) -> AsyncIterator[UserOrder]:
+        """Yield every order for ``sub_addr``, fetching ``page_size`` at a time.
+
+        Only one page is held in memory, and callers can start consuming before later pages
+        arrive.
+        """
+
+        async def fetch(limit: int, offset: int) -> UserOrders:
+            return await self.get_by_addr(sub_addr=sub_addr, limit=limit, offset=offset)
+
+        async for item in self._iter_pages(fetch, page_size):
+            yield item
+
     def subscribe_by_addr(
         self,
         sub_addr: str,
@@ -7,7 +7,7 @@ from pydantic import BaseModel, ConfigDict
 from ._base import BaseReader
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable
 
     from ._ws import Unsubscribe
 
@@ -66,6 +66,24 @@ class UserTradeHistoryReader(BaseReader):
         )
         return response
 
+    async def iter_by_addr(
+        self,
+        *,
+        sub_addr: str,
+        page_size: int = 100,
+    ) -> AsyncIterator[UserTrade]:
+        """Yield every trade for ``sub_addr``, fetching ``page_size`` at a time.
+
+        Only one page is held in memory, and callers can start consuming before later pages
+        arrive.
+        """
+
+        async def fetch(limit: int, offset: int) -> UserTradesResponse:
+            return await self.get_by_addr(sub_addr=sub_addr, limit=limit, offset=offset)
+
+        async for item in self._iter_pages(fetch, page_size):
+            yield item
+
     def subscribe_by_addr(
         self,
         sub_addr: str,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, RootModel
 
+from .._utils import decode_json
 from ._base import BaseReader
 
 logger = logging.getLogger(__name__)
@@ -201,8 +201,8 @@ class VaultsReader(BaseReader):
                 [vault_address],
             )
 
-            nav_result: list[Any] = json.loads(nav_bytes.decode("utf-8"))
-            shares_result: list[Any] = json.loads(shares_bytes.decode("utf-8"))
+            nav_result: list[Any] = decode_json(nav_bytes)
+            shares_result: list[Any] = decode_json(shares_bytes)
 
             nav_value = int(nav_result[0])
             shares_value = int(shares_result[0])
@@ -4,14 +4,14 @@ import asyncio
 import contextlib
 import json
 import logging
-from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 from pydantic import BaseModel, ValidationError
 from websockets import ConnectionClosed, Subprotocol
 from websockets.asyncio.client import ClientConnection, connect
 
-from .._utils import bigint_reviver, prettify_validation_error
+from .._utils import decode_json, prettify_validation_error
 
 if TYPE_CHECKING:
     from .._constants import DecibelConfig
@@ -28,6 +28,34 @@ T = TypeVar("T", bound=BaseModel)
 Unsubscribe = Callable[[], None]
 
 
+class _ModelListener(Generic[T]):
+    """Listener that validates each payload into ``model`` before calling ``on_data``."""
+
+    __slots__ = ("_model", "_on_data")
+
+    def __init__(
+        self,
+        model: type[T],
+        on_data: Callable[[T], None] | Callable[[T], Awaitable[None]],
+    ) -> None:
+        self._model = model
+        self._on_data = on_data
+
+    def __call__(self, data: Any) -> Any:
+        return self.deliver(data, {})
+
+    def deliver(self, data: Any, validated: dict[type[BaseModel], BaseModel]) -> Any:
+        # Listeners on one topic that share a model share one validated instance per message
+        parsed = validated.get(self._model)
+        if parsed is None:
+            try:
+                parsed = self._model.model_validate(data)
+            except ValidationError as e:
+                raise ValueError(prettify_validation_error(e)) from e
+            validated[self._model] = parsed
+        return self._on_data(cast("T", parsed))
+
+
 class DecibelWsSubscription:
     def __init__(
         self,
@@ -41,6 +69,8 @@ class DecibelWsSubscription:
 
         self._ws: ClientConnection | None = None
         self._subscriptions: dict[str, set[Callable[[Any], Any]]] = {}
+        # Encoded subscribe frame per active topic, replayed as-is on every reconnect
+        self._subscribe_frames: dict[str, str] = {}
         self._reconnect_attempts: int = 0
         self._running: bool = False
         self._receive_task: asyncio.Task[None] | None = None
@@ -54,8 +84,8 @@ class DecibelWsSubscription:
 
     def _parse_message(self, data: str) -> tuple[str, dict[str, Any]] | None:
         try:
-            json_data: Any = json.loads(data, object_hook=bigint_reviver)
-        except (json.JSONDecodeError, TypeError) as e:
+            json_data: Any = decode_json(data)
+        except (ValueError, TypeError) as e:
             raise ValueError(f"Unhandled WebSocket message: failed to parse JSON: {data}") from e
 
         if (
@@ -66,10 +96,11 @@ class DecibelWsSubscription:
             # Filter out response messages (they have a "success" field; data payloads do not)
             if "success" in json_data:
                 return None
-            topic: str = json_data["topic"]
+            # Detach the topic in place; the remaining keys are the payload, so there is no need
+            # to copy the whole frame into a second dict.
             json_dict = cast("dict[str, Any]", json_data)
-            rest: dict[str, Any] = {k: v for k, v in json_dict.items() if k != "topic"}
-            return (topic, rest)
+            topic: str = json_dict.pop("topic")
+            return (topic, json_dict)
         raise ValueError(f"Unhandled WebSocket message: missing topic field: {data}")
 
     async def _open(self) -> None:
@@ -84,8 +115,8 @@ class DecibelWsSubscription:
             self._reconnect_attempts = 0
             self._running = True
 
-            for topic in self._subscriptions:
-                await self._ws.send(self._get_subscribe_message(topic))
+            for frame in list(self._subscribe_frames.values()):
+                await self._ws.send(frame)
 
             self._receive_task = asyncio.create_task(self._receive_loop())
         except Exception as e:
@@ -114,9 +145,14 @@ class DecibelWsSubscription:
                 topic, data = parsed
                 listeners = self._subscriptions.get(topic)
                 if listeners:
+                    validated: dict[type[BaseModel], BaseModel] = {}
                     for listener in list(listeners):
                         try:
-                            result = listener(data)
+                            if isinstance(listener, _ModelListener):
+                                model_listener = cast("_ModelListener[BaseModel]", listener)
+                                result = model_listener.deliver(data, validated)
+                            else:
+                                result = listener(data)
                             if asyncio.iscoroutine(result):
                                 await result
                         except Exception as e:
@@ -149,24 +185,58 @@ class DecibelWsSubscription:
         model: type[T],
         on_data: Callable[[T], None] | Callable[[T], Awaitable[None]],
     ) -> Unsubscribe:
+        return self._add_listener(topic, _ModelListener(model, on_data))
+
+    def subscribe_raw(
+        self,
+        topic: str,
+        on_data: Callable[[dict[str, Any]], None] | Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> Unsubscribe:
+        """Subscribe to a topic and receive the decoded frame (minus ``topic``) unvalidated."""
+        return self._add_listener(topic, on_data)
+
+    def subscribe_fields(
+        self,
+        topic: str,
+        key: str,
+        model: type[BaseModel],
+        fields: Iterable[str],
+        on_data: Callable[[Any], None] | Callable[[Any], Awaitable[None]],
+    ) -> Unsubscribe:
+        """Subscribe to a topic, receiving only ``fields`` of the payload under ``key``.
+
+        ``fields`` must be fields of ``model``, the type of the payload (or of its items). Frames
+        skip model validation: a payload object is delivered as one plain dict and a payload list
+        as a list of them, with values as the raw decoded JSON and absent fields mapped to ``None``.
+        """
+        wanted = tuple(fields)
+        unknown = set(wanted).difference(model.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown {key} fields: {sorted(unknown)}")
+
+        def project(item: dict[str, Any]) -> dict[str, Any]:
+            return {field: item.get(field) for field in wanted}
+
+        def listener(data: dict[str, Any]) -> Any:
+            payload: dict[str, Any] | list[dict[str, Any]] = data[key]
+            if isinstance(payload, list):
+                return on_data([project(item) for item in payload])
+            return on_data(project(payload))
+
+        return self.subscribe_raw(topic, listener)
+
+    def _add_listener(self, topic: str, listener: Callable[[Any], Any]) -> Unsubscribe:
         listeners: set[Callable[[Any], Any]] = self._subscriptions.get(topic, set())
         if topic not in self._subscriptions:
             self._subscriptions[topic] = listeners
+            self._subscribe_frames[topic] = self._get_subscribe_message(topic)
 
         is_new_topic = len(listeners) == 0
 
-        def listener(data: Any) -> Any:
-            try:
-                parsed_data = model.model_validate(data)
-                result = on_data(parsed_data)
-                return result
-            except ValidationError as e:
-                raise ValueError(prettify_validation_error(e)) from e
-
         listeners.add(listener)
 
         if is_new_topic and self._ws is not None:
-            asyncio.create_task(self._ws.send(self._get_subscribe_message(topic)))
+            asyncio.create_task(self._ws.send(self._subscribe_frames[topic]))
 
         if self._ws is None:
             asyncio.create_task(self._open())
@@ -180,6 +250,64 @@ class DecibelWsSubscription:
 
         return unsubscribe
 
+    def subscribe_batched(
+        self,
+        topic: str,
+        model: type[T],
+        on_batch: Callable[[list[T]], None] | Callable[[list[T]], Awaitable[None]],
+        *,
+        max_batch: int = 32,
+        max_delay: float = 0.005,
+    ) -> Unsubscribe:
+        """Like :meth:`subscribe`, but deliver messages in lists.
+
+        Messages are buffered until ``max_batch`` have arrived or ``max_delay`` seconds have passed
+        since the first buffered one, whichever comes first, so bursts cost one callback. Anything
+        still buffered is delivered when the subscription is removed.
+        """
+        batch: list[T] = []
+        flush_handle: asyncio.TimerHandle | None = None
+        pending: set[asyncio.Future[None]] = set()
+
+        def on_batch_done(future: asyncio.Future[None]) -> None:
+            pending.discard(future)
+            if not future.cancelled() and (error := future.exception()) is not None:
+                logger.error("Error in WebSocket batch listener for topic %s: %s", topic, error)
+
+        def flush() -> None:
+            nonlocal flush_handle
+            if flush_handle is not None:
+                flush_handle.cancel()
+                flush_handle = None
+            if not batch:
+                return
+            items = batch.copy()
+            batch.clear()
+            try:
+                result = on_batch(items)
+                if result is not None:
+                    future = asyncio.ensure_future(result)
+                    pending.add(future)
+                    future.add_done_callback(on_batch_done)
+            except Exception as e:
+                logger.error("Error in WebSocket batch listener for topic %s: %s", topic, e)
+
+        def on_data(data: T) -> None:
+            nonlocal flush_handle
+            batch.append(data)
+            if len(batch) >= max_batch:
+                flush()
+            elif flush_handle is None:
+                flush_handle = asyncio.get_running_loop().call_later(max_delay, flush)
+
+        unsubscribe_listener = self.subscribe(topic, model, on_data)
+
+        def unsubscribe() -> None:
+            flush()
+            unsubscribe_listener()
+
+        return unsubscribe
+
     def _unsubscribe_listener(self, topic: str, listener: Callable[[Any], Any]) -> None:
         listeners = self._subscriptions.get(topic)
         if listeners is None:
@@ -195,6 +323,7 @@ class DecibelWsSubscription:
             return
 
         del self._subscriptions[topic]
+        del self._subscribe_frames[topic]
 
         if self._ws is not None:
             asyncio.create_task(self._ws.send(self._get_unsubscribe_message(topic)))
@@ -218,11 +347,15 @@ class DecibelWsSubscription:
     async def _reset_topic(self, topic: str) -> None:
         if self._ws is None:
             return
+        subscribe_frame = self._subscribe_frames.get(topic)
+        if subscribe_frame is None:
+            return
         await self._ws.send(self._get_unsubscribe_message(topic))
-        await self._ws.send(self._get_subscribe_message(topic))
+        await self._ws.send(subscribe_frame)
 
     async def close(self) -> None:
         self._subscriptions.clear()
+        self._subscribe_frames.clear()
         if self._close_timer_task is not None:
             self._close_timer_task.cancel()
             self._close_timer_task = None
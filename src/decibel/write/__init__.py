@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
@@ -393,6 +394,42 @@ class DecibelWriteDex(BaseSDK):
 
         return await self.send_subaccount_tx(_send, subaccount_addr)
 
+    async def cancel_orders(
+        self,
+        *,
+        order_ids: list[int | str],
+        market_name: str | None = None,
+        market_addr: str | None = None,
+        subaccount_addr: str | None = None,
+        account_override: Account | None = None,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Cancel several orders on one market, with all cancels in flight at once.
+
+        The contracts have no multi-order cancel entry function, so each order is still its own
+        transaction; they carry replay-protection nonces instead of sequence numbers, so they can
+        be submitted concurrently and the batch completes in roughly one round trip.
+
+        Returns one entry per order id, in order: the committed cancel transaction, or the
+        exception that cancel raised. One failed cancel does not stop or hide the others.
+        """
+        if market_name is not None:
+            market_addr = get_market_addr(market_name, self._config.deployment.perp_engine_global)
+        elif market_addr is None:
+            raise ValueError("Either market_name or market_addr must be provided")
+
+        return await asyncio.gather(
+            *(
+                self.cancel_order(
+                    order_id=order_id,
+                    market_addr=market_addr,
+                    subaccount_addr=subaccount_addr,
+                    account_override=account_override,
+                )
+                for order_id in order_ids
+            ),
+            return_exceptions=True,
+        )
+
     async def place_bulk_orders(
         self,
         *,
@@ -1341,6 +1378,41 @@ class DecibelWriteDexSync(BaseSDKSync):
 
         return self.send_subaccount_tx(_send, subaccount_addr)
 
+    def cancel_orders(
+        self,
+        *,
+        order_ids: list[int | str],
+        market_name: str | None = None,
+        market_addr: str | None = None,
+        subaccount_addr: str | None = None,
+        account_override: Account | None = None,
+    ) -> list[dict[str, Any] | Exception]:
+        """Cancel several orders on one market, one order at a time.
+
+        Each cancel is its own transaction and waits for the previous one to commit. Returns one
+        entry per order id, in order: the committed cancel transaction, or the exception that
+        cancel raised. A failed cancel does not stop the remaining ones.
+        """
+        if market_name is not None:
+            market_addr = get_market_addr(market_name, self._config.deployment.perp_engine_global)
+        elif market_addr is None:
+            raise ValueError("Either market_name or market_addr must be provided")
+
+        results: list[dict[str, Any] | Exception] = []
+        for order_id in order_ids:
+            try:
+                results.append(
+                    self.cancel_order(
+                        order_id=order_id,
+                        market_addr=market_addr,
+                        subaccount_addr=subaccount_addr,
+                        account_override=account_override,
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+        return results
+
     def place_bulk_orders(
         self,
         *,
@@ -71,6 +71,23 @@ class TestAbiRegistry:
         for fid in admin_funcs:
             assert "::admin_apis::" in fid
 
+    def test_get_module_functions_unknown_module(self) -> None:
+        registry = AbiRegistry()
+        assert registry.get_module_functions("no_such_module") == {}
+
+    def test_filtered_views_are_copies(self) -> None:
+        registry = AbiRegistry()
+        registry.get_entry_functions().clear()
+        registry.get_view_functions().clear()
+        registry.get_module_functions("admin_apis").clear()
+        registry.get_module_functions("no_such_module")["x"] = next(
+            iter(registry.get_all_functions().values())
+        )
+        assert len(registry.get_entry_functions()) > 0
+        assert len(registry.get_view_functions()) > 0
+        assert len(registry.get_module_functions("admin_apis")) > 0
+        assert registry.get_module_functions("no_such_module") == {}
+
     def test_get_function_exists(self) -> None:
         registry = AbiRegistry()
         package = registry.package_address
@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import asyncio
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+import pytest
+from aptos_sdk.account import Account
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.authenticator import (
+    AccountAuthenticator,
+    Authenticator,
+    Ed25519Authenticator,
+    FeePayerAuthenticator,
+)
+from aptos_sdk.bcs import Serializer
+from aptos_sdk.ed25519 import Signature
+from aptos_sdk.transactions import FeePayerRawTransaction, SignedTransaction
+
+from decibel import NETNA_CONFIG
+from decibel._base import (
+    BaseSDK,
+    BaseSDKOptions,
+    BaseSDKOptionsSync,
+    BaseSDKSync,
+    _next_poll_delay,
+    _sign_raw_txn_bytes,
+)
+from decibel._transaction_builder import (
+    InputEntryFunctionData,
+    SimpleTransaction,
+    build_simple_transaction_sync,
+)
+from decibel.abi import AbiRegistry
+
+INCREMENT_TIME = f"{NETNA_CONFIG.deployment.package}::admin_apis::increment_time"
+FAILING_ARG = 7777
+FEE_PAYER = AccountAddress.from_str("0x" + "ab" * 32)
+
+
+def _payload(value: int) -> InputEntryFunctionData:
+    return InputEntryFunctionData(function=INCREMENT_TIME, function_arguments=[value])
+
+
+@dataclass
+class FakeNode:
+    """Answers the fullnode routes BaseSDK uses and counts the calls to each."""
+
+    tx_success: bool = True
+    gas_estimate: int = 150
+    calls: dict[str, int] = field(default_factory=lambda: {})
+    # When set, gas estimate requests wait for it before answering
+    gas_gate: asyncio.Event | None = None
+    # When set, transaction polls are rate limited with this Retry-After value
+    poll_retry_after: str | None = None
+
+    def _count(self, route: str) -> None:
+        self.calls[route] = self.calls.get(route, 0) + 1
+
+    def route(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/transactions/simulate"):
+            self._count("simulate")
+            if struct.pack("<Q", FAILING_ARG) in request.content:
+                return httpx.Response(400, text="simulation rejected")
+            return httpx.Response(200, json=[{"max_gas_amount": "1000", "gas_unit_price": "120"}])
+        if path.endswith("/transactions"):
+            self._count("submit")
+            return httpx.Response(202, json={"hash": "0xabc"})
+        if "/transactions/by_hash/" in path:
+            self._count("poll")
+            if self.poll_retry_after is not None:
+                return httpx.Response(429, headers={"retry-after": self.poll_retry_after})
+            return httpx.Response(
+                200,
+                json={"type": "user_transaction", "success": self.tx_success, "vm_status": "abort"},
+            )
+        if path.endswith("/estimate_gas_price"):
+            self._count("estimate")
+            return httpx.Response(200, json={"gas_estimate": self.gas_estimate})
+        return httpx.Response(404)
+
+    async def async_route(self, request: httpx.Request) -> httpx.Response:
+        if self.gas_gate is not None and request.url.path.endswith("/estimate_gas_price"):
+            self._count("estimate")
+            await self.gas_gate.wait()
+            return httpx.Response(200, json={"gas_estimate": self.gas_estimate})
+        return self.route(request)
+
+
+def _simple_txn(account: Account, fee_payer: AccountAddress | None) -> SimpleTransaction:
+    abi = AbiRegistry(chain_id=NETNA_CONFIG.chain_id).get_function(INCREMENT_TIME)
+    assert abi is not None
+    txn = build_simple_transaction_sync(
+        sender=account.address(),
+        data=_payload(42),
+        chain_id=208,
+        gas_unit_price=100,
+        abi=abi,
+        with_fee_payer=fee_payer is not None,
+        replay_protection_nonce=123456789,
+    )
+    return SimpleTransaction(raw_transaction=txn.raw_transaction, fee_payer_address=fee_payer)
+
+
+def _bcs(value: Any) -> bytes:
+    serializer = Serializer()
+    value.serialize(serializer)
+    return serializer.output()
+
+
+def _async_sdk(node: FakeNode, **opts: Any) -> BaseSDK:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(node.async_route))
+    options = BaseSDKOptions(no_fee_payer=True, http_client=client, **opts)
+    return BaseSDK(NETNA_CONFIG, Account.generate(), options)
+
+
+def _sync_sdk(node: FakeNode, **opts: Any) -> BaseSDKSync:
+    client = httpx.Client(transport=httpx.MockTransport(node.route))
+    options = BaseSDKOptionsSync(no_fee_payer=True, http_client=client, **opts)
+    return BaseSDKSync(NETNA_CONFIG, Account.generate(), options)
+
+
+class TestSimulationCache:
+    async def test_identical_payload_reuses_simulation(self) -> None:
+        node = FakeNode()
+        async with _async_sdk(node, simulation_cache_ttl_secs=60.0) as sdk:
+            await sdk._send_tx(_payload(1))
+            await sdk._send_tx(_payload(1))
+            assert node.calls["simulate"] == 1
+            assert node.calls["submit"] == 2
+
+    async def test_different_arguments_are_simulated_separately(self) -> None:
+        node = FakeNode()
+        async with _async_sdk(node, simulation_cache_ttl_secs=60.0) as sdk:
+            await sdk._send_tx(_payload(1))
+            await sdk._send_tx(_payload(2))
+            assert node.calls["simulate"] == 2
+
+    async def test_expired_entry_is_simulated_again(self) -> None:
+        node = FakeNode()
+        async with _async_sdk(node, simulation_cache_ttl_secs=0.05) as sdk:
+            await sdk._send_tx(_payload(1))
+            await asyncio.sleep(0.1)
+            await sdk._send_tx(_payload(1))
+            assert node.calls["simulate"] == 2
+
+    async def test_failed_send_invalidates_entry(self) -> None:
+        node = FakeNode()
+        async with _async_sdk(node, simulation_cache_ttl_secs=60.0) as sdk:
+            await sdk._send_tx(_payload(1))
+            node.tx_success = False
+            with pytest.raises(ValueError, match="Transaction failed"):
+                await sdk._send_tx(_payload(1))
+            assert node.calls["simulate"] == 1
+
+            node.tx_success = True
+            await sdk._send_tx(_payload(1))
+            assert node.calls["simulate"] == 2
+
+    def test_sync_identical_payload_reuses_simulation(self) -> None:
+        node = FakeNode()
+        with _sync_sdk(node, simulation_cache_ttl_secs=60.0) as sdk:
+            sdk._send_tx(_payload(1))
+            sdk._send_tx(_payload(1))
+            sdk._send_tx(_payload(2))
+            assert node.calls["simulate"] == 2
+            assert node.calls["submit"] == 3
+
+    def test_sync_expired_entry_is_simulated_again(self) -> None:
+        node = FakeNode()
+        with _sync_sdk(node, simulation_cache_ttl_secs=0.05) as sdk:
+            sdk._send_tx(_payload(1))
+            time.sleep(0.1)
+            sdk._send_tx(_payload(1))
+            assert node.calls["simulate"] == 2
+
+    def test_sync_failed_send_invalidates_entry(self) -> None:
+        node = FakeNode()
+        with _sync_sdk(node, simulation_cache_ttl_secs=60.0) as sdk:
+            sdk._send_tx(_payload(1))
+            node.tx_success = False
+            with pytest.raises(ValueError, match="Transaction failed"):
+                sdk._send_tx(_payload(1))
+            assert node.calls["simulate"] == 1
+
+            node.tx_success = True
+            sdk._send_tx(_payload(1))
+            assert node.calls["simulate"] == 2
+
+
+class TestSendMany:
+    async def test_failure_is_returned_alongside_other_results(self) -> None:
+        node = FakeNode()
+        async with _async_sdk(node) as sdk:
+            results = await sdk.send_many([_payload(1), _payload(FAILING_ARG), _payload(2)])
+
+        assert len(results) == 3
+        assert isinstance(results[0], dict) and results[0]["success"] is True
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], dict) and results[2]["success"] is True
+        assert node.calls["submit"] == 2
+
+
+class TestGasUnitPrice:
+    async def test_stale_estimate_is_served_during_one_refresh(self) -> None:
+        node = FakeNode(gas_gate=asyncio.Event())
+        async with _async_sdk(node) as sdk:
+            sdk._last_gas_price = (time.monotonic() - 30.0, 50)
+
+            assert await sdk._get_gas_unit_price() == 50
+            refresh = sdk._gas_refresh_task
+            assert refresh is not None and not refresh.done()
+            assert await sdk._get_gas_unit_price() == 50
+            assert sdk._gas_refresh_task is refresh
+
+            assert node.gas_gate is not None
+            node.gas_gate.set()
+            assert await refresh == 150
+            assert await sdk._get_gas_unit_price() == 150
+            assert node.calls["estimate"] == 1
+
+    async def test_concurrent_cold_callers_share_one_request(self) -> None:
+        node = FakeNode(gas_gate=asyncio.Event())
+        async with _async_sdk(node) as sdk:
+            callers = [asyncio.create_task(sdk._get_gas_unit_price()) for _ in range(5)]
+            await asyncio.sleep(0.01)
+            assert node.calls["estimate"] == 1
+
+            assert node.gas_gate is not None
+            node.gas_gate.set()
+            assert await asyncio.gather(*callers) == [150] * 5
+            assert node.calls["estimate"] == 1
+
+    async def test_close_cancels_inflight_refresh(self) -> None:
+        node = FakeNode(gas_gate=asyncio.Event())
+        sdk = _async_sdk(node)
+        caller = asyncio.create_task(sdk._get_gas_unit_price())
+        await asyncio.sleep(0.01)
+        refresh = sdk._gas_refresh_task
+        assert refresh is not None
+
+        await sdk.close()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert refresh.cancelled()
+        assert sdk._gas_refresh_task is None
+
+
+class TestSigning:
+    def test_matches_raw_transaction_sign(self) -> None:
+        account = Account.generate()
+        txn = _simple_txn(account, None)
+
+        expected = txn.raw_transaction.sign(account.private_key)
+        actual = _sign_raw_txn_bytes(account, _bcs(txn.raw_transaction), None)
+        assert _bcs(actual) == _bcs(expected)
+
+    def test_matches_fee_payer_raw_transaction_sign(self) -> None:
+        account = Account.generate()
+        txn = _simple_txn(account, FEE_PAYER)
+
+        fee_payer_txn = FeePayerRawTransaction(txn.raw_transaction, [], FEE_PAYER)
+        expected = fee_payer_txn.sign(account.private_key)
+        actual = _sign_raw_txn_bytes(account, _bcs(txn.raw_transaction), FEE_PAYER)
+        assert _bcs(actual) == _bcs(expected)
+        assert fee_payer_txn.verify(account.public_key(), actual.authenticator.signature)
+
+    def test_sdk_signs_built_transactions_like_aptos_sdk(self) -> None:
+        node = FakeNode()
+        with _sync_sdk(node) as sdk:
+            for fee_payer in (None, FEE_PAYER):
+                txn = _simple_txn(sdk.account, fee_payer)
+                raw_txn = txn.raw_transaction
+                expected = (
+                    raw_txn.sign(sdk.account.private_key)
+                    if fee_payer is None
+                    else FeePayerRawTransaction(raw_txn, [], fee_payer).sign(
+                        sdk.account.private_key
+                    )
+                )
+                assert _bcs(sdk._sign_transaction(sdk.account, txn)) == _bcs(expected)
+
+
+class TestSimulationBody:
+    def _zero_auth(self, account: Account) -> Ed25519Authenticator:
+        return Ed25519Authenticator(account.public_key(), Signature(b"\x00" * 64))
+
+    def test_matches_signed_transaction_without_fee_payer(self) -> None:
+        with _sync_sdk(FakeNode()) as sdk:
+            txn = _simple_txn(sdk.account, None)
+            expected = SignedTransaction(
+                txn.raw_transaction, Authenticator(self._zero_auth(sdk.account))
+            )
+            assert sdk._serialize_for_simulation(txn) == expected.bytes()
+
+    def test_matches_signed_transaction_with_fee_payer(self) -> None:
+        with _sync_sdk(FakeNode()) as sdk:
+            txn = _simple_txn(sdk.account, FEE_PAYER)
+            account_auth = AccountAuthenticator(self._zero_auth(sdk.account))
+            expected = SignedTransaction(
+                txn.raw_transaction,
+                Authenticator(FeePayerAuthenticator(account_auth, [], (FEE_PAYER, account_auth))),
+            )
+            assert sdk._serialize_for_simulation(txn) == expected.bytes()
+
+    async def test_async_matches_sync(self) -> None:
+        async with _async_sdk(FakeNode()) as sdk:
+            sync_sdk = BaseSDKSync(NETNA_CONFIG, sdk.account)
+            for fee_payer in (None, FEE_PAYER):
+                txn = _simple_txn(sdk.account, fee_payer)
+                assert sdk._serialize_for_simulation(txn) == sync_sdk._serialize_for_simulation(txn)
+            sync_sdk.close()
+
+
+class TestPollDelay:
+    @pytest.mark.parametrize(
+        ("retry_after", "expected"),
+        [
+            (None, 0.5),
+            ("2", 2.0),
+            ("0.1", 0.5),
+            ("3600", 10.0),
+            ("-5", 0.5),
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 0.5),
+            ("nan", 0.5),
+        ],
+    )
+    def test_delay(self, retry_after: str | None, expected: float) -> None:
+        headers = {} if retry_after is None else {"retry-after": retry_after}
+        response = httpx.Response(429, headers=headers)
+        assert _next_poll_delay(response, 0.5, 10.0) == expected
+
+    def test_never_negative(self) -> None:
+        assert _next_poll_delay(httpx.Response(200), 0.5, -1.0) == 0.0
+
+    async def test_large_retry_after_does_not_outlast_timeout(self) -> None:
+        node = FakeNode(poll_retry_after="3600")
+        async with _async_sdk(node) as sdk:
+            started = time.monotonic()
+            with pytest.raises(TimeoutError):
+                await sdk._wait_for_transaction("0xabc", timeout_secs=0.2)
+            assert time.monotonic() - started < 1.0
+
+    def test_sync_large_retry_after_does_not_outlast_timeout(self) -> None:
+        node = FakeNode(poll_retry_after="3600")
+        with _sync_sdk(node) as sdk:
+            started = time.monotonic()
+            with pytest.raises(TimeoutError):
+                sdk._wait_for_transaction("0xabc", timeout_secs=0.2)
+            assert time.monotonic() - started < 1.0
+
+
+class TestHttp2Option:
+    def test_missing_h2_names_the_extra(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, "h2", None)
+        # aptos-sdk's RestClient always asks httpx for HTTP/2, so it is kept out of the way
+        monkeypatch.setattr("decibel._base.RestClient", lambda url: None)
+        with pytest.raises(ImportError, match=r"decibel-python-sdk\[http2\]"):
+            BaseSDK(NETNA_CONFIG, Account.generate(), BaseSDKOptions(http2=True))
+        with pytest.raises(ImportError, match=r"decibel-python-sdk\[http2\]"):
+            BaseSDKSync(NETNA_CONFIG, Account.generate(), BaseSDKOptionsSync(http2=True))
+
+    def test_http2_client_when_h2_is_installed(self) -> None:
+        pytest.importorskip("h2")
+        with BaseSDKSync(NETNA_CONFIG, Account.generate(), BaseSDKOptionsSync(http2=True)):
+            pass
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from typing import Any
+
+import httpx
+import pytest
+from aptos_sdk.account import Account
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.bcs import Serializer
+
+from decibel import NETNA_CONFIG
+from decibel._fee_pay import (
+    _build_gas_station_request,
+    _build_legacy_request,
+    _json_byte_array,
+    submit_fee_paid_transaction_sync,
+)
+from decibel._transaction_builder import (
+    InputEntryFunctionData,
+    SimpleTransaction,
+    build_simple_transaction_sync,
+)
+from decibel.abi import AbiRegistry
+
+INCREMENT_TIME = f"{NETNA_CONFIG.deployment.package}::admin_apis::increment_time"
+GAS_STATION_CONFIG = replace(NETNA_CONFIG, gas_station_api_key="test-key")
+LEGACY_CONFIG = replace(NETNA_CONFIG, gas_station_url="https://gas.example/v1")
+
+
+def _bcs(value: Any) -> bytes:
+    serializer = Serializer()
+    value.serialize(serializer)
+    return serializer.output()
+
+
+def _signed_txn(fee_payer: AccountAddress | None) -> tuple[SimpleTransaction, Any]:
+    account = Account.generate()
+    abi = AbiRegistry(chain_id=NETNA_CONFIG.chain_id).get_function(INCREMENT_TIME)
+    assert abi is not None
+    txn = build_simple_transaction_sync(
+        sender=account.address(),
+        data=InputEntryFunctionData(function=INCREMENT_TIME, function_arguments=[1]),
+        chain_id=208,
+        gas_unit_price=100,
+        abi=abi,
+        with_fee_payer=fee_payer is not None,
+        replay_protection_nonce=42,
+    )
+    txn = SimpleTransaction(raw_transaction=txn.raw_transaction, fee_payer_address=fee_payer)
+    return txn, txn.raw_transaction.sign(account.private_key)
+
+
+def _baseline_gas_station_body(txn: SimpleTransaction, auth: Any) -> dict[str, list[int]]:
+    # The dict the SDK used to hand to httpx's json= encoding
+    serializer = Serializer()
+    txn.raw_transaction.serialize(serializer)
+    if txn.fee_payer_address is None:
+        serializer.bool(False)
+    else:
+        serializer.bool(True)
+        txn.fee_payer_address.serialize(serializer)
+    return {"transactionBytes": list(serializer.output()), "senderAuth": list(_bcs(auth))}
+
+
+class TestJsonByteArray:
+    @pytest.mark.parametrize("data", [b"", b"\x00", bytes(range(256)), b"\xff\x00\x7f"])
+    def test_round_trips(self, data: bytes) -> None:
+        assert json.loads(_json_byte_array(data)) == list(data)
+
+
+class TestSubmitBody:
+    @pytest.mark.parametrize("fee_payer", [None, AccountAddress.from_str("0x" + "cd" * 32)])
+    def test_gas_station_body_matches_baseline(self, fee_payer: AccountAddress | None) -> None:
+        txn, auth = _signed_txn(fee_payer)
+        url, body, headers = _build_gas_station_request(GAS_STATION_CONFIG, txn, auth)
+
+        assert json.loads(body) == _baseline_gas_station_body(txn, auth)
+        assert url.endswith("/api/transaction/signAndSubmit")
+        assert headers["Authorization"] == "Bearer test-key"
+
+    def test_legacy_body_matches_baseline(self) -> None:
+        txn, auth = _signed_txn(None)
+        url, body, headers = _build_legacy_request(LEGACY_CONFIG, txn, auth)
+
+        assert json.loads(body) == {
+            "signature": list(_bcs(auth)),
+            "transaction": list(_bcs(txn.raw_transaction)),
+        }
+        assert url == "https://gas.example/v1/transactions"
+        assert headers["Content-Type"] == "application/json"
+
+    def test_submit_posts_the_body(self) -> None:
+        txn, auth = _signed_txn(AccountAddress.from_str("0x0"))
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={"transactionHash": "0xfeed"})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        pending = submit_fee_paid_transaction_sync(GAS_STATION_CONFIG, txn, auth, client=client)
+
+        assert pending.hash == "0xfeed"
+        assert json.loads(sent[0].content) == _baseline_gas_station_body(txn, auth)
+        assert sent[0].headers["content-type"] == "application/json"
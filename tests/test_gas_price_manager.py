@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+
+from decibel import NETNA_CONFIG
+from decibel._gas_price_manager import (
+    GasPriceManagerOptions,
+    GasPriceManagerSync,
+    _RefreshScheduler,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class _Recorder:
+    def __init__(self, delay: float | None = None) -> None:
+        self.tokens: list[int] = []
+        self.delay = delay
+
+    def callback(self, token: int) -> float | None:
+        self.tokens.append(token)
+        return self.delay
+
+
+class _CountingNode:
+    """Stub fullnode whose gas estimate requests can be held open."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        self.error: BaseException | None = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.entered.set()
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return httpx.Response(200, json={"gas_estimate": 100})
+
+
+def _manager(node: _CountingNode, refresh_interval_seconds: float = 60.0) -> GasPriceManagerSync:
+    return GasPriceManagerSync(
+        NETNA_CONFIG,
+        GasPriceManagerOptions(refresh_interval_seconds=refresh_interval_seconds),
+        client=httpx.Client(transport=httpx.MockTransport(node)),
+    )
+
+
+class TestRefreshScheduler:
+    def test_runs_callback_with_its_token(self) -> None:
+        scheduler = _RefreshScheduler()
+        recorder = _Recorder()
+        scheduler.schedule(recorder.callback, 7, 0.01)
+        assert _wait_until(lambda: recorder.tokens == [7])
+
+    def test_reschedules_with_returned_delay(self) -> None:
+        scheduler = _RefreshScheduler()
+        recorder = _Recorder(delay=0.01)
+        scheduler.schedule(recorder.callback, 1, 0.01)
+        assert _wait_until(lambda: len(recorder.tokens) >= 3)
+
+    def test_drops_collected_owner(self) -> None:
+        scheduler = _RefreshScheduler()
+        recorder = _Recorder(delay=0.01)
+        scheduler.schedule(recorder.callback, 1, 0.05)
+        del recorder
+        gc.collect()
+        assert _wait_until(lambda: not scheduler._queue)
+
+    def test_destroy_stops_manager_refreshes(self) -> None:
+        node = _CountingNode()
+        manager = _manager(node, refresh_interval_seconds=0.02)
+        manager.initialize()
+        assert _wait_until(lambda: node.calls >= 3)
+
+        generation = manager._refresh_generation
+        manager.destroy()
+        assert manager._scheduled_refresh(generation) is None
+        time.sleep(0.05)
+        calls = node.calls
+        time.sleep(0.1)
+        assert node.calls == calls
+
+
+class TestRequestRefreshSync:
+    def test_concurrent_callers_share_one_fetch(self) -> None:
+        node = _CountingNode()
+        node.release.clear()
+        manager = _manager(node)
+        results: list[int] = []
+
+        def call() -> None:
+            results.append(manager.request_refresh())
+
+        threads = [threading.Thread(target=call) for _ in range(5)]
+        threads[0].start()
+        assert node.entered.wait(timeout=2)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        node.release.set()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert node.calls == 1
+        assert results == [200] * 5
+
+    def test_followers_see_base_exception(self) -> None:
+        class Abort(BaseException):
+            pass
+
+        node = _CountingNode()
+        node.release.clear()
+        node.error = Abort()
+        manager = _manager(node)
+        errors: list[BaseException] = []
+
+        def call() -> None:
+            try:
+                manager.request_refresh()
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        threads[0].start()
+        assert node.entered.wait(timeout=2)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        node.release.set()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert len(errors) == 3
+        assert all(isinstance(e, Abort) for e in errors)
+        assert manager._inflight_fetch is None
+
+    def test_refresh_always_fetches(self) -> None:
+        node = _CountingNode()
+        manager = _manager(node)
+        manager.request_refresh()
+        manager.refresh()
+        assert node.calls == 2
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import weakref
+from typing import TYPE_CHECKING
+
+from decibel import _http
+from decibel._http import get_shared_async_client, get_shared_sync_client
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class TestSharedAsyncClient:
+    def test_reused_within_one_loop(self) -> None:
+        async def main() -> bool:
+            return get_shared_async_client() is get_shared_async_client()
+
+        assert asyncio.run(main())
+
+    def test_closed_and_released_when_loop_shuts_down(self) -> None:
+        async def main() -> httpx.AsyncClient:
+            return get_shared_async_client()
+
+        first = asyncio.run(main())
+        assert first.is_closed
+        assert _http._async_clients == {}
+
+        first_ref = weakref.ref(first)
+        del first
+        gc.collect()
+        assert first_ref() is None
+
+        second = asyncio.run(main())
+        assert second.is_closed
+        assert _http._async_clients == {}
+
+    def test_manually_closed_loop_is_dropped(self) -> None:
+        async def main() -> httpx.AsyncClient:
+            return get_shared_async_client()
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(main())
+        loop.close()
+        assert loop in _http._async_clients
+
+        asyncio.run(main())
+        assert loop not in _http._async_clients
+
+
+def test_shared_sync_client_is_reused() -> None:
+    client = get_shared_sync_client()
+    assert get_shared_sync_client() is client
+    assert not client.is_closed
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, TypeVar
+
+import pytest
+from pydantic import BaseModel
+
+from decibel import NETNA_CONFIG
+from decibel.read import _markets
+from decibel.read._base import ReaderDeps
+from decibel.read._markets import MarketsReader
+from decibel.read._user_order_history import UserOrderHistoryReader, UserOrders
+from decibel.read._user_trade_history import UserTradeHistoryReader, UserTradesResponse
+from decibel.read._ws import DecibelWsSubscription
+
+SUB_ADDR = "0x" + "5a" * 32
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def _deps() -> ReaderDeps:
+    return ReaderDeps(config=NETNA_CONFIG, ws=DecibelWsSubscription(NETNA_CONFIG))
+
+
+class _PagedServer:
+    """Serves ``total`` numbered items, capping each page at ``max_page`` items."""
+
+    def __init__(self, total: int, *, max_page: int = 1000, total_count: int | None = None) -> None:
+        self.total = total
+        self.max_page = max_page
+        self.total_count = total if total_count is None else total_count
+        self.requests: list[tuple[int, int]] = []
+
+    def page(self, limit: int, offset: int) -> tuple[list[int], int]:
+        self.requests.append((limit, offset))
+        end = min(offset + min(limit, self.max_page), self.total)
+        return list(range(offset, end)), self.total_count
+
+
+def _order(n: int) -> dict[str, Any]:
+    return {
+        "parent": "0x1",
+        "market": "0x2",
+        "client_order_id": "",
+        "order_id": str(n),
+        "status": "Filled",
+        "order_type": "Limit",
+        "trigger_condition": "",
+        "order_direction": "Buy",
+        "orig_size": 1.0,
+        "remaining_size": 0.0,
+        "size_delta": None,
+        "price": 100.0,
+        "is_buy": True,
+        "is_reduce_only": False,
+        "details": "",
+        "is_tpsl": False,
+        "tp_trigger_price": None,
+        "tp_limit_price": None,
+        "sl_trigger_price": None,
+        "sl_limit_price": None,
+        "transaction_version": n,
+        "unix_ms": n,
+    }
+
+
+def _trade(n: int) -> dict[str, Any]:
+    return {
+        "account": "0x1",
+        "market": "0x2",
+        "action": "OpenLong",
+        "size": 1.0,
+        "price": 100.0,
+        "is_profit": True,
+        "realized_pnl_amount": 0.0,
+        "is_funding_positive": True,
+        "realized_funding_amount": 0.0,
+        "is_rebate": False,
+        "fee_amount": 0.0,
+        "transaction_unix_ms": n,
+        "transaction_version": n,
+    }
+
+
+class _OrderReader(UserOrderHistoryReader):
+    def __init__(self, server: _PagedServer) -> None:
+        super().__init__(_deps())
+        self.server = server
+
+    async def get_by_addr(
+        self, *, sub_addr: str, limit: int | None = None, offset: int | None = None
+    ) -> UserOrders:
+        assert limit is not None and offset is not None
+        items, total_count = self.server.page(limit, offset)
+        return UserOrders.model_validate(
+            {"items": [_order(n) for n in items], "total_count": total_count}
+        )
+
+
+class _TradeReader(UserTradeHistoryReader):
+    def __init__(self, server: _PagedServer) -> None:
+        super().__init__(_deps())
+        self.server = server
+
+    async def get_by_addr(
+        self, *, sub_addr: str, limit: int = 10, offset: int = 0
+    ) -> UserTradesResponse:
+        items, total_count = self.server.page(limit, offset)
+        return UserTradesResponse.model_validate(
+            {"items": [_trade(n) for n in items], "total_count": total_count}
+        )
+
+
+async def _collect(reader: _OrderReader | _TradeReader, page_size: int) -> list[int]:
+    items = reader.iter_by_addr(sub_addr=SUB_ADDR, page_size=page_size)
+    return [item.transaction_version async for item in items]
+
+
+@pytest.fixture(params=[_OrderReader, _TradeReader], ids=["orders", "trades"])
+def reader_type(request: pytest.FixtureRequest) -> type[_OrderReader | _TradeReader]:
+    return request.param
+
+
+class TestIterByAddr:
+    async def test_stops_at_total_count(
+        self, reader_type: type[_OrderReader | _TradeReader]
+    ) -> None:
+        server = _PagedServer(5)
+        assert await _collect(reader_type(server), page_size=2) == [0, 1, 2, 3, 4]
+        assert server.requests == [(2, 0), (2, 2), (2, 4)]
+
+    async def test_stops_on_empty_page(
+        self, reader_type: type[_OrderReader | _TradeReader]
+    ) -> None:
+        # total_count overstates what the server will actually serve
+        server = _PagedServer(3, total_count=10)
+        assert await _collect(reader_type(server), page_size=2) == [0, 1, 2]
+        assert server.requests == [(2, 0), (2, 2), (2, 3)]
+
+    async def test_offset_advances_by_items_returned(
+        self, reader_type: type[_OrderReader | _TradeReader]
+    ) -> None:
+        # The server caps pages at 3 items even though 5 were asked for
+        server = _PagedServer(7, max_page=3)
+        assert await _collect(reader_type(server), page_size=5) == list(range(7))
+        assert server.requests == [(5, 0), (5, 3), (5, 6)]
+
+    async def test_empty_history(self, reader_type: type[_OrderReader | _TradeReader]) -> None:
+        server = _PagedServer(0)
+        assert await _collect(reader_type(server), page_size=2) == []
+        assert server.requests == [(2, 0)]
+
+
+def _market(name: str, addr: str) -> dict[str, Any]:
+    return {
+        "market_addr": addr,
+        "market_name": name,
+        "sz_decimals": 6,
+        "px_decimals": 6,
+        "max_leverage": 40.0,
+        "tick_size": 1.0,
+        "min_size": 1.0,
+        "lot_size": 1.0,
+        "max_open_interest": 1e9,
+        "mode": "Open",
+    }
+
+
+class _CountingMarketsReader(MarketsReader):
+    def __init__(self) -> None:
+        super().__init__(_deps())
+        self.listings = [[_market("BTC/USD", "0xb7c")]]
+        self.fetches = 0
+
+    async def get_request(
+        self, model: type[T], url: str, *, params: dict[str, Any] | None = None
+    ) -> tuple[T, int, str]:
+        assert url.endswith("/api/v1/markets")
+        listing = self.listings[min(self.fetches, len(self.listings) - 1)]
+        self.fetches += 1
+        return model.model_validate(listing), 200, ""
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    # Patch only the markets module's clock; the event loop keeps the real one
+    monkeypatch.setattr(_markets, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+class TestMarketsCache:
+    async def test_lookups_within_ttl_share_one_fetch(self, clock: _Clock) -> None:
+        reader = _CountingMarketsReader()
+        assert (await reader.find_by_name("BTC/USD")) is not None
+        clock.now += _markets._MARKETS_CACHE_TTL_SECONDS - 1
+        assert (await reader.find_by_name("BTC/USD")) is not None
+        assert len(await reader.get_all()) == 1
+        assert reader.fetches == 1
+
+    async def test_lookup_after_ttl_refetches(self, clock: _Clock) -> None:
+        reader = _CountingMarketsReader()
+        reader.listings.append([_market("BTC/USD", "0xb7c"), _market("ETH/USD", "0xe74")])
+        assert await reader.find_by_name("ETH/USD") is None
+
+        clock.now += _markets._MARKETS_CACHE_TTL_SECONDS
+        eth = await reader.find_by_name("ETH/USD")
+        assert eth is not None and eth.market_addr == "0xe74"
+        assert reader.fetches == 2
+
+    async def test_refresh_markets_bypasses_cache(self, clock: _Clock) -> None:
+        reader = _CountingMarketsReader()
+        reader.listings.append([_market("BTC/USD-2", "0xb7c")])
+        assert await reader.market_names_by_addresses(["0xb7c"]) == {"0xb7c": "BTC/USD"}
+
+        reader.refresh_markets()
+        assert await reader.find_by_name("BTC/USD-2") is not None
+        assert await reader.market_names_by_addresses(["0xb7c"]) == {"0xb7c": "BTC/USD-2"}
+        assert reader.fetches == 2
+
+    async def test_market_names_reuse_the_cached_listing(self, clock: _Clock) -> None:
+        reader = _CountingMarketsReader()
+        await reader.find_by_name("BTC/USD")
+        assert await reader.market_names_by_addresses(["0xb7c"]) == {"0xb7c": "BTC/USD"}
+        assert reader.fetches == 1
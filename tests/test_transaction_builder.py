@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.bcs import Serializer
+from aptos_sdk.transactions import TransactionArgument
+
+from decibel._transaction_builder import _encode_argument, _encode_function_arguments
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ADDR = "0x" + "12" * 32
+MARKET = "0xabc::perp_market::PerpMarket"
+OBJECT = f"0x1::object::Object<{MARKET}>"
+
+
+def _expected(value: Any, encoder: Callable[[Serializer, Any], None]) -> bytes:
+    return TransactionArgument(value, encoder).encode()
+
+
+def _option(encoder: Callable[[Serializer, Any], None]) -> Callable[[Serializer, Any], None]:
+    # A BCS Option is a vector of zero or one elements
+    def encode(serializer: Serializer, value: Any) -> None:
+        serializer.sequence([] if value is None else [value], encoder)
+
+    return encode
+
+
+def _address(serializer: Serializer, value: str) -> None:
+    serializer.struct(AccountAddress.from_str(value))
+
+
+SCALAR_CASES = [
+    ("u8", 0, _expected(0, Serializer.u8)),
+    ("u8", 255, _expected(255, Serializer.u8)),
+    ("u16", 65535, _expected(65535, Serializer.u16)),
+    ("u32", 2**32 - 1, _expected(2**32 - 1, Serializer.u32)),
+    ("u64", 0, _expected(0, Serializer.u64)),
+    ("u64", 2**64 - 1, _expected(2**64 - 1, Serializer.u64)),
+    ("u64", "1234", _expected(1234, Serializer.u64)),
+    ("u128", 2**100 + 7, _expected(2**100 + 7, Serializer.u128)),
+    ("u256", 2**200, _expected(2**200, Serializer.u256)),
+    ("bool", True, _expected(True, Serializer.bool)),
+    ("bool", False, _expected(False, Serializer.bool)),
+    ("address", ADDR, _expected(ADDR, _address)),
+    ("address", "0x1", _expected("0x1", _address)),
+    ("address", AccountAddress.from_str(ADDR), _expected(ADDR, _address)),
+    ("0x1::string::String", "", _expected("", Serializer.str)),
+    ("0x1::string::String", "héllo", _expected("héllo", Serializer.str)),
+    ("vector<u8>", b"", _expected(b"", Serializer.to_bytes)),
+    ("vector<u8>", b"\x00\xff", _expected(b"\x00\xff", Serializer.to_bytes)),
+    ("vector<u8>", "0x00ff", _expected(b"\x00\xff", Serializer.to_bytes)),
+    ("vector<u8>", [1, 2, 3], _expected(b"\x01\x02\x03", Serializer.to_bytes)),
+    (OBJECT, ADDR, _expected(ADDR, _address)),
+    (f"&{OBJECT}", ADDR, _expected(ADDR, _address)),
+]
+
+NESTED_CASES = [
+    ("vector<u64>", [], _expected([], Serializer.sequence_serializer(Serializer.u64))),
+    (
+        "vector<u64>",
+        [1, 2**64 - 1],
+        _expected([1, 2**64 - 1], Serializer.sequence_serializer(Serializer.u64)),
+    ),
+    (
+        "vector<bool>",
+        [True, False],
+        _expected([True, False], Serializer.sequence_serializer(Serializer.bool)),
+    ),
+    (
+        "vector<address>",
+        [ADDR, "0x1"],
+        _expected([ADDR, "0x1"], Serializer.sequence_serializer(_address)),
+    ),
+    (
+        "vector<vector<u64>>",
+        [[1, 2], [], [3]],
+        _expected(
+            [[1, 2], [], [3]],
+            Serializer.sequence_serializer(Serializer.sequence_serializer(Serializer.u64)),
+        ),
+    ),
+    (
+        "vector<vector<u8>>",
+        [b"\x01", b""],
+        _expected([b"\x01", b""], Serializer.sequence_serializer(Serializer.to_bytes)),
+    ),
+    ("0x1::option::Option<u64>", None, _expected(None, _option(Serializer.u64))),
+    ("0x1::option::Option<u64>", 5, _expected(5, _option(Serializer.u64))),
+    ("0x1::option::Option<u128>", 2**90, _expected(2**90, _option(Serializer.u128))),
+    ("0x1::option::Option<bool>", False, _expected(False, _option(Serializer.bool))),
+    (
+        "0x1::option::Option<0x1::string::String>",
+        "tp",
+        _expected("tp", _option(Serializer.str)),
+    ),
+    ("0x1::option::Option<address>", ADDR, _expected(ADDR, _option(_address))),
+    (
+        "0x1::option::Option<vector<u64>>",
+        [4, 5],
+        _expected([4, 5], _option(Serializer.sequence_serializer(Serializer.u64))),
+    ),
+    (
+        "vector<0x1::option::Option<u64>>",
+        [None, 9],
+        _expected([None, 9], Serializer.sequence_serializer(_option(Serializer.u64))),
+    ),
+    (f"0x1::option::Option<{OBJECT}>", ADDR, _expected(ADDR, _option(_address))),
+]
+
+
+class TestEncodeArgument:
+    @pytest.mark.parametrize(("param_type", "arg", "expected"), SCALAR_CASES)
+    def test_scalar_matches_aptos_serializer(
+        self, param_type: str, arg: Any, expected: bytes
+    ) -> None:
+        assert _encode_argument(arg, param_type) == expected
+
+    @pytest.mark.parametrize(("param_type", "arg", "expected"), NESTED_CASES)
+    def test_nested_matches_aptos_serializer(
+        self, param_type: str, arg: Any, expected: bytes
+    ) -> None:
+        assert _encode_argument(arg, param_type) == expected
+
+    def test_encode_function_arguments_in_order(self) -> None:
+        encoded = _encode_function_arguments(
+            [ADDR, 7, None], ["address", "u64", "0x1::option::Option<u64>"]
+        )
+        assert encoded == [
+            _expected(ADDR, _address),
+            _expected(7, Serializer.u64),
+            _expected(None, _option(Serializer.u64)),
+        ]
+
+    def test_encode_function_arguments_rejects_count_mismatch(self) -> None:
+        with pytest.raises(ValueError, match="Argument count mismatch"):
+            _encode_function_arguments([1], ["u64", "u64"])
+
+    def test_encode_argument_rejects_unknown_type(self) -> None:
+        with pytest.raises(ValueError, match="Cannot encode argument"):
+            _encode_argument(1, "0xabc::module::Struct")
@@ -1,12 +1,58 @@
 from __future__ import annotations
 
+from aptos_sdk.account_address import AccountAddress
+from pydantic import BaseModel
+
 from decibel import (
+    MAINNET_CONFIG,
+    NETNA_CONFIG,
+    CompatVersion,
+    FetchError,
     amount_to_chain_units,
+    amounts_to_chain_units,
     chain_units_to_amount,
+    format_fields,
+    get_market_addr,
+    get_primary_subaccount_addr,
     round_to_tick_size,
     round_to_valid_order_size,
+    round_to_valid_order_sizes,
     round_to_valid_price,
+    round_to_valid_prices,
+)
+from decibel._constants import (
+    _MAINNET_USDC,
+    get_perp_engine_global_address,
+    get_testc_address,
+    get_usdc_address,
 )
+from decibel._utils import decode_json
+
+
+class TestFetchError:
+    def test_json_body_overrides_status_and_message(self) -> None:
+        err = FetchError('{"status": "Too Many Requests", "message": "slow down"}', 429, "")
+        assert err.status_text == "Too Many Requests"
+        assert err.response_message == "slow down"
+        assert str(err) == "HTTP Error 429 (Too Many Requests): slow down"
+
+    def test_plain_text_body(self) -> None:
+        err = FetchError("upstream timeout", 504, "Gateway Timeout")
+        assert err.status_text == "Gateway Timeout"
+        assert err.response_message == "upstream timeout"
+
+
+class TestDecodeJson:
+    def test_plain_payload(self) -> None:
+        assert decode_json(b'{"a": 1, "b": [1.5, "x"]}') == {"a": 1, "b": [1.5, "x"]}
+
+    def test_revives_bigint(self) -> None:
+        payload = b'{"size": {"$bigint": "18446744073709551616"}}'
+        assert decode_json(payload) == {"size": 18446744073709551616}
+
+    def test_accepts_str(self) -> None:
+        assert decode_json('{"topic": "t", "n": {"$bigint": "7"}}') == {"topic": "t", "n": 7}
+        assert decode_json('{"topic": "t"}') == {"topic": "t"}
 
 
 class TestAmountToChainUnits:
@@ -32,6 +78,16 @@ class TestAmountToChainUnits:
         assert amount_to_chain_units(1.14, decimals=4) == 11400
 
 
+class TestAmountsToChainUnits:
+    def test_matches_scalar_conversion(self) -> None:
+        amounts = [62000.0, 60000.0, 0.29, 0.57, 1.14]
+        expected = [amount_to_chain_units(a, decimals=4) for a in amounts]
+        assert amounts_to_chain_units(amounts, decimals=4) == expected
+
+    def test_empty(self) -> None:
+        assert amounts_to_chain_units([]) == []
+
+
 class TestChainUnitsToAmount:
     def test_basic_conversion(self) -> None:
         assert chain_units_to_amount(5670000) == 5.67
@@ -49,6 +105,24 @@ class TestChainUnitsToAmount:
         assert chain_units_to_amount(1) == 0.000001
 
 
+class _Fill(BaseModel):
+    order_id: str
+    realized_pnl_amount: float
+    unix_ms: int
+
+
+class TestFormatFields:
+    def test_one_labelled_line_per_field(self) -> None:
+        fill = _Fill(order_id="42", realized_pnl_amount=1.5, unix_ms=7)
+        assert format_fields(fill) == (
+            "    Order ID: 42\n    Realized PnL Amount: 1.5\n    Unix MS: 7\n"
+        )
+
+    def test_indent(self) -> None:
+        fill = _Fill(order_id="1", realized_pnl_amount=0.0, unix_ms=0)
+        assert format_fields(fill, indent=0).startswith("Order ID: 1\n")
+
+
 class TestRoundToValidPrice:
     def test_exact_tick(self) -> None:
         result = round_to_valid_price(100.0, tick_size=100, px_decimals=2)
@@ -101,6 +175,26 @@ class TestRoundToValidOrderSize:
         assert result == 0.01
 
 
+class TestRoundToValidPrices:
+    def test_matches_scalar_rounding(self) -> None:
+        prices = [100.0, 100.24, 100.75, 0.0, 97123.45]
+        expected = [round_to_valid_price(p, tick_size=100, px_decimals=2) for p in prices]
+        assert round_to_valid_prices(prices, tick_size=100, px_decimals=2) == expected
+
+    def test_empty(self) -> None:
+        assert round_to_valid_prices([], tick_size=100, px_decimals=2) == []
+
+
+class TestRoundToValidOrderSizes:
+    def test_matches_scalar_rounding(self) -> None:
+        sizes = [1.0, 1.05, 1.08, 0.005, 0.0, 0.01]
+        expected = [
+            round_to_valid_order_size(s, lot_size=1000, sz_decimals=4, min_size=100) for s in sizes
+        ]
+        result = round_to_valid_order_sizes(sizes, lot_size=1000, sz_decimals=4, min_size=100)
+        assert result == expected
+
+
 class TestRoundToTickSize:
     def test_round_up(self) -> None:
         result = round_to_tick_size(100.24, tick_size=100, px_decimals=2, round_up=True)
@@ -113,3 +207,36 @@ class TestRoundToTickSize:
     def test_zero_price(self) -> None:
         result = round_to_tick_size(0.0, tick_size=100, px_decimals=2, round_up=True)
         assert result == 0.0
+
+
+class TestAddressDerivation:
+    OWNER = "0x" + "ab" * 32
+
+    def test_market_addr_is_stable(self) -> None:
+        engine = NETNA_CONFIG.deployment.perp_engine_global
+        first = get_market_addr("BTC/USD", engine)
+        assert get_market_addr("BTC/USD", engine) == first
+        assert get_market_addr("ETH/USD", engine) != first
+
+    def test_primary_subaccount_accepts_str_or_address(self) -> None:
+        package = NETNA_CONFIG.deployment.package
+        from_str = get_primary_subaccount_addr(self.OWNER, CompatVersion.V0_4, package)
+        from_addr = get_primary_subaccount_addr(
+            AccountAddress.from_str(self.OWNER),
+            CompatVersion.V0_4,
+            AccountAddress.from_str(package),
+        )
+        assert from_str == from_addr
+
+    def test_deployment_matches_per_address_helpers(self) -> None:
+        deployment = NETNA_CONFIG.deployment
+        assert deployment.usdc == get_usdc_address(deployment.package)
+        assert deployment.testc == get_testc_address(deployment.package)
+        assert deployment.perp_engine_global == get_perp_engine_global_address(deployment.package)
+
+    def test_mainnet_keeps_fixed_usdc(self) -> None:
+        deployment = MAINNET_CONFIG.deployment
+        assert deployment.usdc == _MAINNET_USDC
+        assert deployment.usdc != get_usdc_address(deployment.package)
+        assert deployment.testc == get_testc_address(deployment.package)
+        assert deployment.perp_engine_global == get_perp_engine_global_address(deployment.package)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aptos_sdk.account import Account
+
+from decibel import NETNA_CONFIG, DecibelWriteDex, DecibelWriteDexSync, get_market_addr
+from decibel._base import BaseSDKOptions, BaseSDKOptionsSync
+
+if TYPE_CHECKING:
+    from decibel._transaction_builder import InputEntryFunctionData
+
+SUBACCOUNT = "0x" + "5a" * 32
+MARKET = "BTC/USD"
+MARKET_ADDR = get_market_addr(MARKET, NETNA_CONFIG.deployment.perp_engine_global)
+CANCEL_ORDER = f"{NETNA_CONFIG.deployment.package}::dex_accounts_entry::cancel_order_to_subaccount"
+FAILING_ORDER_ID = 13
+
+
+def _result(payload: InputEntryFunctionData) -> dict[str, Any]:
+    if payload.function_arguments[1] == FAILING_ORDER_ID:
+        raise RuntimeError("cancel rejected")
+    return {"hash": f"0x{payload.function_arguments[1]:x}", "success": True}
+
+
+class _AsyncDex(DecibelWriteDex):
+    def __init__(self) -> None:
+        super().__init__(NETNA_CONFIG, Account.generate(), BaseSDKOptions(no_fee_payer=True))
+        self.payloads: list[InputEntryFunctionData] = []
+
+    async def _send_tx(
+        self, payload: InputEntryFunctionData, account_override: Account | None = None
+    ) -> dict[str, Any]:
+        self.payloads.append(payload)
+        return _result(payload)
+
+
+class _SyncDex(DecibelWriteDexSync):
+    def __init__(self) -> None:
+        super().__init__(NETNA_CONFIG, Account.generate(), BaseSDKOptionsSync(no_fee_payer=True))
+        self.payloads: list[InputEntryFunctionData] = []
+
+    def _send_tx(
+        self, payload: InputEntryFunctionData, account_override: Account | None = None
+    ) -> dict[str, Any]:
+        self.payloads.append(payload)
+        return _result(payload)
+
+
+def _summary(results: list[Any]) -> list[Any]:
+    return [r if isinstance(r, dict) else repr(r) for r in results]
+
+
+class TestCancelOrders:
+    ORDER_IDS: list[int | str] = [1, "2", 3]
+
+    async def test_async_sends_one_cancel_per_order(self) -> None:
+        dex = _AsyncDex()
+        results = await dex.cancel_orders(
+            order_ids=self.ORDER_IDS, market_name=MARKET, subaccount_addr=SUBACCOUNT
+        )
+
+        assert len(results) == 3
+        assert sorted(p.function_arguments[1] for p in dex.payloads) == [1, 2, 3]
+        for payload in dex.payloads:
+            assert payload.function == CANCEL_ORDER
+            assert payload.function_arguments[0] == SUBACCOUNT
+            assert payload.function_arguments[2] == MARKET_ADDR
+
+    def test_sync_sends_one_cancel_per_order(self) -> None:
+        dex = _SyncDex()
+        results = dex.cancel_orders(
+            order_ids=self.ORDER_IDS, market_addr=MARKET_ADDR, subaccount_addr=SUBACCOUNT
+        )
+
+        assert len(results) == 3
+        assert [p.function_arguments for p in dex.payloads] == [
+            [SUBACCOUNT, 1, MARKET_ADDR],
+            [SUBACCOUNT, 2, MARKET_ADDR],
+            [SUBACCOUNT, 3, MARKET_ADDR],
+        ]
+        assert {p.function for p in dex.payloads} == {CANCEL_ORDER}
+
+    async def test_sync_and_async_return_the_same_results(self) -> None:
+        order_ids: list[int | str] = [1, FAILING_ORDER_ID, 3]
+        kwargs: dict[str, Any] = {"market_name": MARKET, "subaccount_addr": SUBACCOUNT}
+
+        async_results = await _AsyncDex().cancel_orders(order_ids=order_ids, **kwargs)
+        sync_results = _SyncDex().cancel_orders(order_ids=order_ids, **kwargs)
+
+        assert _summary(async_results) == _summary(sync_results)
+        assert isinstance(sync_results[1], RuntimeError)
+        assert sync_results[2] == {"hash": "0x3", "success": True}
+
+    async def test_empty_input_sends_nothing(self) -> None:
+        async_dex, sync_dex = _AsyncDex(), _SyncDex()
+
+        assert await async_dex.cancel_orders(order_ids=[], market_name=MARKET) == []
+        assert sync_dex.cancel_orders(order_ids=[], market_name=MARKET) == []
+        assert async_dex.payloads == sync_dex.payloads == []
+
+    async def test_requires_a_market(self) -> None:
+        with pytest.raises(ValueError, match="market_name or market_addr"):
+            await _AsyncDex().cancel_orders(order_ids=[1])
+        with pytest.raises(ValueError, match="market_name or market_addr"):
+            _SyncDex().cancel_orders(order_ids=[1])
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import pytest_asyncio
+from pydantic import BaseModel
+
+from decibel import NETNA_CONFIG
+from decibel.read._account_overview import AccountOverviewReader
+from decibel.read._base import ReaderDeps
+from decibel.read._user_open_orders import UserOpenOrdersReader
+from decibel.read._ws import DecibelWsSubscription
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+TOPIC = "market_price:0xabc"
+SUB_ADDR = "0x" + "5a" * 32
+
+
+class Tick(BaseModel):
+    value: int
+
+
+@pytest_asyncio.fixture
+async def subscription() -> AsyncIterator[DecibelWsSubscription]:
+    sub = DecibelWsSubscription(NETNA_CONFIG)
+
+    async def no_connect() -> None:
+        return None
+
+    # Messages are delivered by hand, so no socket is opened
+    sub._open = no_connect  # type: ignore[method-assign]
+    yield sub
+    await sub.close()
+
+
+def _deliver(sub: DecibelWsSubscription, *values: int) -> None:
+    for value in values:
+        for listener in list(sub._subscriptions[TOPIC]):
+            listener({"value": value})
+
+
+class TestSubscribeBatched:
+    async def test_flushes_when_batch_is_full(self, subscription: DecibelWsSubscription) -> None:
+        batches: list[list[int]] = []
+        subscription.subscribe_batched(
+            TOPIC, Tick, lambda ticks: batches.append([t.value for t in ticks]), max_batch=3
+        )
+
+        _deliver(subscription, 1, 2)
+        assert batches == []
+        _deliver(subscription, 3, 4)
+        assert batches == [[1, 2, 3]]
+
+    async def test_flushes_after_max_delay(self, subscription: DecibelWsSubscription) -> None:
+        batches: list[list[int]] = []
+        subscription.subscribe_batched(
+            TOPIC,
+            Tick,
+            lambda ticks: batches.append([t.value for t in ticks]),
+            max_batch=100,
+            max_delay=0.01,
+        )
+
+        _deliver(subscription, 1, 2)
+        assert batches == []
+        await asyncio.sleep(0.05)
+        assert batches == [[1, 2]]
+
+    async def test_flushes_on_unsubscribe(self, subscription: DecibelWsSubscription) -> None:
+        batches: list[list[int]] = []
+        unsubscribe = subscription.subscribe_batched(
+            TOPIC,
+            Tick,
+            lambda ticks: batches.append([t.value for t in ticks]),
+            max_batch=100,
+            max_delay=10.0,
+        )
+
+        _deliver(subscription, 1, 2)
+        unsubscribe()
+        assert batches == [[1, 2]]
+        assert TOPIC not in subscription._subscriptions
+
+    async def test_logs_async_listener_errors(
+        self,
+        subscription: DecibelWsSubscription,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        async def on_batch(ticks: list[Any]) -> None:
+            raise RuntimeError("listener failed")
+
+        subscription.subscribe_batched(TOPIC, Tick, on_batch, max_batch=1)
+
+        with caplog.at_level(logging.ERROR, logger="decibel.read._ws"):
+            _deliver(subscription, 1)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        assert "listener failed" in caplog.text
+
+
+def _feed(sub: DecibelWsSubscription, topic: str, frame: dict[str, Any]) -> None:
+    for listener in list(sub._subscriptions[topic]):
+        listener(frame)
+
+
+class TestSubscribeFields:
+    async def test_overview_delivers_only_requested_keys(
+        self, subscription: DecibelWsSubscription
+    ) -> None:
+        reader = AccountOverviewReader(ReaderDeps(config=NETNA_CONFIG, ws=subscription))
+        received: list[dict[str, Any]] = []
+        reader.subscribe_fields_by_addr(
+            SUB_ADDR, ["perp_equity_balance", "net_deposits"], received.append
+        )
+
+        overview = {"perp_equity_balance": 12.5, "unrealized_pnl": -1.0, "total_margin": 3.0}
+        _feed(subscription, f"account_overview:{SUB_ADDR}", {"account_overview": overview})
+
+        assert received == [{"perp_equity_balance": 12.5, "net_deposits": None}]
+
+    async def test_open_orders_project_each_order(
+        self, subscription: DecibelWsSubscription
+    ) -> None:
+        reader = UserOpenOrdersReader(ReaderDeps(config=NETNA_CONFIG, ws=subscription))
+        received: list[list[dict[str, Any]]] = []
+        reader.subscribe_fields_by_addr(SUB_ADDR, ["order_id", "price"], received.append)
+
+        orders = [
+            {"order_id": "1", "price": 100.0, "market": "0xabc", "remaining_size": 2.0},
+            {"order_id": "2", "market": "0xabc"},
+        ]
+        _feed(subscription, f"account_open_orders:{SUB_ADDR}", {"orders": orders})
+
+        assert received == [[{"order_id": "1", "price": 100.0}, {"order_id": "2", "price": None}]]
+
+    async def test_rejects_unknown_fields(self, subscription: DecibelWsSubscription) -> None:
+        overview = AccountOverviewReader(ReaderDeps(config=NETNA_CONFIG, ws=subscription))
+        open_orders = UserOpenOrdersReader(ReaderDeps(config=NETNA_CONFIG, ws=subscription))
+
+        with pytest.raises(ValueError, match=r"Unknown account_overview fields: \['equity'\]"):
+            overview.subscribe_fields_by_addr(SUB_ADDR, ["perp_equity_balance", "equity"], print)
+        with pytest.raises(ValueError, match=r"Unknown orders fields: \['px'\]"):
+            open_orders.subscribe_fields_by_addr(SUB_ADDR, ["px"], print)
+        assert subscription._subscriptions == {}